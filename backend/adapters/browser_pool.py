@@ -0,0 +1,285 @@
+"""
+Bounded pool of pre-warmed headless Chrome sessions for web scraping adapters
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from loguru import logger
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from config import Config
+
+
+class BrowserPoolExhausted(Exception):
+    """Raised when no browser session can be handed out (queue full or wait timed out)"""
+
+
+class PooledSession:
+    """A Chrome driver plus the bookkeeping the pool needs to recycle it"""
+
+    __slots__ = ("driver", "uses", "created_at")
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+def create_chrome_driver(headless: bool = True, page_load_timeout: int = 30):
+    """Create a Chrome driver with the options used for SwissADME scraping"""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(page_load_timeout)
+    return driver
+
+
+class BrowserPool:
+    """
+    Thread-safe pool of browser sessions
+
+    Sessions are created lazily up to ``size``, health-checked when borrowed and
+    retired after ``max_uses`` borrows or when a scrape reports the browser as broken.
+    Callers beyond ``max_waiters`` are rejected immediately (backpressure); the rest
+    queue for up to ``acquire_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_uses: int,
+        max_waiters: int,
+        acquire_timeout: float,
+        driver_factory: Optional[Callable] = None,
+    ):
+        self.size = size
+        self.max_uses = max_uses
+        self.max_waiters = max_waiters
+        self.acquire_timeout = acquire_timeout
+        self._driver_factory = driver_factory or (lambda: create_chrome_driver(headless=Config.SWISSADME_HEADLESS))
+
+        self._cond = threading.Condition()
+        self._idle: List[PooledSession] = []
+        self._total = 0
+        self._waiting = 0
+        self._closed = False
+
+        self._metrics = {
+            "acquired": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "created": 0,
+            "recycled": 0,
+            "health_check_failures": 0,
+            "wait_time_total_ms": 0.0,
+            "wait_time_max_ms": 0.0,
+        }
+
+    def warm(self, count: Optional[int] = None):
+        """Start up to ``count`` sessions ahead of time so the first scrapes don't pay for Chrome startup"""
+        count = self.size if count is None else min(count, self.size)
+        while True:
+            with self._cond:
+                if self._closed or self._total >= count:
+                    return
+                self._total += 1
+            try:
+                session = self._create_session()
+            except Exception as e:
+                with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+                logger.error(f"Failed to pre-warm browser session: {e}")
+                return
+            with self._cond:
+                self._idle.append(session)
+                self._cond.notify()
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledSession:
+        """Borrow a session, waiting up to ``timeout`` seconds; pair every call with release()"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+
+        with self._cond:
+            if self._closed:
+                raise BrowserPoolExhausted("Browser pool is closed")
+            if self._waiting >= self.max_waiters:
+                self._metrics["rejected"] += 1
+                raise BrowserPoolExhausted(f"Browser pool queue is full ({self.max_waiters} waiting)")
+
+            self._waiting += 1
+            try:
+                while True:
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        break
+                    if self._total < self.size:
+                        # Reserve a slot; the driver is started outside the lock
+                        self._total += 1
+                        pooled = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        if not self._idle and self._total >= self.size:
+                            self._metrics["timeouts"] += 1
+                            raise BrowserPoolExhausted(f"No browser session available after {timeout:g}s")
+            finally:
+                self._waiting -= 1
+
+        self._record_wait(time.monotonic() - start)
+
+        if pooled is not None and not self._is_healthy(pooled):
+            logger.warning("Pooled browser session failed health check, replacing it")
+            with self._cond:
+                self._metrics["health_check_failures"] += 1
+            self._quit(pooled)
+            pooled = None
+
+        if pooled is None:
+            try:
+                pooled = self._create_session()
+            except Exception:
+                with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+                raise
+
+        with self._cond:
+            self._metrics["acquired"] += 1
+        return pooled
+
+    def release(self, pooled: PooledSession, broken: bool = False):
+        """Return a borrowed session; broken or worn-out sessions are quit and replaced lazily"""
+        pooled.uses += 1
+        retire = broken or self._closed or pooled.uses >= self.max_uses
+
+        if not retire:
+            try:
+                # Leave the browser in a neutral state for the next borrower
+                pooled.driver.delete_all_cookies()
+                pooled.driver.get("about:blank")
+            except Exception:
+                retire = True
+
+        if retire:
+            self._quit(pooled)
+            with self._cond:
+                self._total -= 1
+                self._metrics["recycled"] += 1
+                self._cond.notify()
+        else:
+            with self._cond:
+                self._idle.append(pooled)
+                self._cond.notify()
+
+    def _create_session(self) -> PooledSession:
+        driver = self._driver_factory()
+        with self._cond:
+            self._metrics["created"] += 1
+        logger.info("Started pooled browser session")
+        return PooledSession(driver)
+
+    @staticmethod
+    def _is_healthy(pooled: PooledSession) -> bool:
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(pooled: PooledSession):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.error(f"Error shutting down browser session: {e}")
+
+    def _record_wait(self, seconds: float):
+        wait_ms = seconds * 1000
+        with self._cond:
+            self._metrics["wait_time_total_ms"] += wait_ms
+            self._metrics["wait_time_max_ms"] = max(self._metrics["wait_time_max_ms"], wait_ms)
+
+    def get_metrics(self) -> Dict:
+        """Snapshot of pool occupancy and wait-time metrics"""
+        with self._cond:
+            metrics = dict(self._metrics)
+            metrics.update({
+                "size": self.size,
+                "open_sessions": self._total,
+                "idle_sessions": len(self._idle),
+                "waiting": self._waiting,
+            })
+        acquired = metrics["acquired"]
+        metrics["wait_time_avg_ms"] = metrics["wait_time_total_ms"] / acquired if acquired else 0.0
+        return metrics
+
+    def close(self):
+        """Quit all idle sessions; borrowed sessions are quit when returned"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
+        logger.info("Browser pool closed")
+
+
+_pool: Optional[BrowserPool] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = BrowserPool(
+                size=Config.SWISSADME_POOL_SIZE,
+                max_uses=Config.SWISSADME_POOL_MAX_USES,
+                max_waiters=Config.SWISSADME_POOL_MAX_WAITERS,
+                acquire_timeout=Config.SWISSADME_POOL_ACQUIRE_TIMEOUT,
+            )
+        return _pool
+
+
+def get_scrape_executor() -> ThreadPoolExecutor:
+    """
+    Get the dedicated executor that runs blocking Selenium work off the event loop
+
+    Threads rather than processes: WebDriver sessions hold sockets to their chromedriver
+    and cannot be shared with, or handed back from, another process.
+    """
+    global _executor
+    with _pool_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=Config.SWISSADME_WORKERS,
+                thread_name_prefix="swissadme",
+            )
+        return _executor
+
+
+def close_browser_pool():
+    """Shut down the process-wide browser pool and its executor"""
+    global _pool, _executor
+    with _pool_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        if _pool is not None:
+            _pool.close()
+        _pool = None
+        _executor = None
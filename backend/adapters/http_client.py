@@ -0,0 +1,132 @@
+"""
+Shared async HTTP client used by the API-based adapters
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from loguru import logger
+import asyncio
+import random
+import httpx
+
+from adapters.rate_limiter import get_rate_limiter
+from config import Config
+
+_client: Optional[httpx.AsyncClient] = None
+
+# Responses worth retrying: throttling and transient server-side failures
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Create the pooled client (keep-alive, HTTP/2 where the server supports it)"""
+    limits = httpx.Limits(
+        max_connections=Config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(Config.HTTP_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT)
+
+    try:
+        client = httpx.AsyncClient(http2=Config.HTTP2_ENABLED, limits=limits, timeout=timeout)
+    except ImportError:
+        # httpx raises ImportError when http2=True but the 'h2' package is missing
+        logger.warning("HTTP/2 support not installed, falling back to HTTP/1.1")
+        client = httpx.AsyncClient(limits=limits, timeout=timeout)
+
+    logger.info("Shared HTTP client initialized")
+    return client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+async def close_http_client():
+    """Close the shared HTTP client and release pooled connections"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("Shared HTTP client closed")
+    _client = None
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(Config.HTTP_BACKOFF_MAX, Config.HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+
+async def request_with_retries(method: str, url: str, max_retries: Optional[int] = None, **kwargs) -> httpx.Response:
+    """
+    Send a request through the shared client, respecting the per-host rate limiter
+
+    Throttled (429) and transient (5xx, connection) failures are retried with jittered
+    exponential backoff; a Retry-After header takes precedence and also pauses the
+    host's limiter so other callers back off too. The final response is returned with
+    raise_for_status() already applied.
+    """
+    max_retries = Config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+    limiter = get_rate_limiter(httpx.URL(url).host)
+
+    for attempt in range(max_retries + 1):
+        if limiter:
+            await limiter.acquire()
+
+        try:
+            response = await get_http_client().request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            if attempt == max_retries:
+                raise
+            delay = _backoff_seconds(attempt)
+            logger.warning(f"{method} {url} failed ({e}), retrying in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+                response.raise_for_status()
+                return response
+            retry_after = _retry_after_seconds(response)
+            delay = retry_after if retry_after is not None else _backoff_seconds(attempt)
+            if response.status_code == 429 and limiter:
+                # The paused limiter makes this retry (and everyone else) wait
+                limiter.pause(delay)
+                delay = 0
+            logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+
+        await asyncio.sleep(delay)
+
+
+@asynccontextmanager
+async def stream_request(method: str, url: str, **kwargs):
+    """
+    Open a streaming response through the shared client, respecting the per-host rate limiter
+
+    Unlike request_with_retries there is no retry: a body that has been partially
+    consumed cannot be replayed transparently.
+    """
+    limiter = get_rate_limiter(httpx.URL(url).host)
+    if limiter:
+        await limiter.acquire()
+    async with get_http_client().stream(method, url, **kwargs) as response:
+        response.raise_for_status()
+        yield response
@@ -0,0 +1,36 @@
+"""
+JSON decoding with an optional fast backend
+
+Uses orjson when it is installed and falls back to the standard library otherwise,
+so callers get the same ``loads``/``dumps`` API either way.
+"""
+
+from typing import Any, Callable, Optional, Union
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document (bytes are decoded without an intermediate str)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Encode ``obj`` as a compact JSON string
+
+    ``default`` converts objects the encoder can't handle (e.g. ``records.json_default``);
+    with orjson, dataclasses are passed to it too rather than encoded field by field.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_PASSTHROUGH_DATACLASS if default else 0)
+        return orjson.dumps(obj, default=default, option=option).decode()
+    return json.dumps(obj, separators=(",", ":"), default=default)
@@ -1,169 +1,290 @@
-"""
-PubMed API adapter for retrieving biomedical articles
-"""
-
-import requests
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional
-from loguru import logger
-import time
-from datetime import datetime
-
-class PubMedAdapter:
-    """Adapter for PubMed API integration"""
-    
-    def __init__(self):
-        self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
-        self.search_url = f"{self.base_url}esearch.fcgi"
-        self.fetch_url = f"{self.base_url}efetch.fcgi"
-        self.summary_url = f"{self.base_url}esummary.fcgi"
-        self.db = "pubmed"
-        self.retmax = 100  # Maximum results per request
-        
-    async def search_articles(self, query: str, max_results: int = 10) -> List[Dict]:
-        """
-        Search for articles in PubMed
-        
-        Args:
-            query: Search query string
-            max_results: Maximum number of results to return
-            
-        Returns:
-            List of article dictionaries
-        """
-        try:
-            logger.info(f"Searching PubMed for: {query}")
-            
-            # Step 1: Search for PMIDs
-            search_params = {
-                "db": self.db,
-                "term": query,
-                "retmax": min(max_results, self.retmax),
-                "retmode": "json",
-                "sort": "relevance"
-            }
-            
-            response = requests.get(self.search_url, params=search_params, timeout=30)
-            response.raise_for_status()
-            
-            search_data = response.json()
-            pmids = search_data.get("esearchresult", {}).get("idlist", [])
-            
-            if not pmids:
-                logger.info("No articles found in PubMed")
-                return []
-            
-            # Step 2: Fetch article details
-            articles = await self._fetch_article_details(pmids[:max_results])
-            
-            logger.info(f"Retrieved {len(articles)} articles from PubMed")
-            return articles
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"PubMed API request failed: {e}")
-            raise Exception(f"PubMed API error: {e}")
-        except Exception as e:
-            logger.error(f"Error searching PubMed: {e}")
-            raise
-    
-    async def _fetch_article_details(self, pmids: List[str]) -> List[Dict]:
-        """Fetch detailed information for given PMIDs"""
-        try:
-            # Use esummary for faster retrieval of basic details
-            summary_params = {
-                "db": self.db,
-                "id": ",".join(pmids),
-                "retmode": "json"
-            }
-            
-            response = requests.get(self.summary_url, params=summary_params, timeout=30)
-            response.raise_for_status()
-            
-            summary_data = response.json()
-            articles = []
-            
-            for pmid in pmids:
-                if pmid in summary_data.get("result", {}):
-                    article_data = summary_data["result"][pmid]
-                    article = self._parse_article_summary(pmid, article_data)
-                    articles.append(article)
-            
-            return articles
-            
-        except Exception as e:
-            logger.error(f"Error fetching article details: {e}")
-            # Fallback to basic information
-            return [{"pmid": pmid, "title": "Details unavailable", "error": str(e)} for pmid in pmids]
-    
-    def _parse_article_summary(self, pmid: str, data: Dict) -> Dict:
-        """Parse article summary data into standardized format"""
-        try:
-            return {
-                "pmid": pmid,
-                "title": data.get("title", "No title available"),
-                "authors": self._parse_authors(data.get("authors", [])),
-                "journal": data.get("source", "Unknown journal"),
-                "publication_date": data.get("pubdate", "Unknown date"),
-                "abstract": data.get("abstract", "No abstract available"),
-                "doi": data.get("elocationid", ""),
-                "pmc": data.get("pmc", ""),
-                "mesh_terms": data.get("mesh", []),
-                "keywords": data.get("keywords", []),
-                "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                "source": "pubmed",
-                "retrieved_at": datetime.utcnow().isoformat()
-            }
-        except Exception as e:
-            logger.error(f"Error parsing article data for PMID {pmid}: {e}")
-            return {
-                "pmid": pmid,
-                "title": "Parsing error",
-                "error": str(e),
-                "source": "pubmed"
-            }
-    
-    def _parse_authors(self, authors_data: List[Dict]) -> List[str]:
-        """Parse authors data into list of author names"""
-        try:
-            if not authors_data:
-                return ["Unknown authors"]
-            
-            authors = []
-            for author in authors_data:
-                name_parts = []
-                if author.get("name"):
-                    name_parts.append(author["name"])
-                elif author.get("lastname") or author.get("forename"):
-                    if author.get("lastname"):
-                        name_parts.append(author["lastname"])
-                    if author.get("forename"):
-                        name_parts.append(author["forename"])
-                
-                if name_parts:
-                    authors.append(" ".join(name_parts))
-            
-            return authors if authors else ["Unknown authors"]
-        except Exception as e:
-            logger.error(f"Error parsing authors: {e}")
-            return ["Unknown authors"]
-    
-    async def get_article_by_pmid(self, pmid: str) -> Optional[Dict]:
-        """Get a specific article by PMID"""
-        try:
-            articles = await self._fetch_article_details([pmid])
-            return articles[0] if articles else None
-        except Exception as e:
-            logger.error(f"Error retrieving article {pmid}: {e}")
-            return None
-    
-    def get_source_info(self) -> Dict:
-        """Get information about the PubMed data source"""
-        return {
-            "name": "PubMed",
-            "description": "PubMed is a free search engine accessing primarily the MEDLINE database of references and abstracts on life sciences and biomedical topics",
-            "url": "https://pubmed.ncbi.nlm.nih.gov/",
-            "api_documentation": "https://www.ncbi.nlm.nih.gov/books/NBK25501/",
-            "data_types": ["articles", "abstracts", "metadata"],
-            "access_method": "api",
-            "rate_limits": "3 requests per second without API key, 10 requests per second with API key"
+"""
+PubMed API adapter for retrieving biomedical articles
+"""
+
+import httpx
+from typing import AsyncIterator, List, Dict, Optional
+from loguru import logger
+from datetime import datetime
+
+from adapters.http_client import request_with_retries
+from adapters.records import Article
+from cache.response_cache import get_response_cache
+from cache.record_cache import get_record_cache
+from config import Config
+
+class PubMedAdapter:
+    """Adapter for PubMed API integration"""
+    
+    def __init__(self):
+        self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+        self.search_url = f"{self.base_url}esearch.fcgi"
+        self.fetch_url = f"{self.base_url}efetch.fcgi"
+        self.summary_url = f"{self.base_url}esummary.fcgi"
+        self.db = "pubmed"
+        self.retmax = 100  # Maximum results per request
+        
+    async def search_articles(self, query: str, max_results: int = 10) -> List[Article]:
+        """
+        Search for articles in PubMed
+        
+        Repeated queries are served from the shared response cache (stale entries are
+        returned immediately and refreshed in the background).
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+            
+        Returns:
+            List of Article records (serialized with ``to_dict`` / ``records.json_default``)
+        """
+        return await get_response_cache().get_or_fetch(
+            "pubmed",
+            {"op": "search", "term": query, "retmax": max_results},
+            lambda: self._search_articles_remote(query, max_results)
+        )
+    
+    async def _search_articles_remote(self, query: str, max_results: int) -> List[Article]:
+        """Run esearch + esummary against the E-utilities API"""
+        try:
+            logger.info(f"Searching PubMed for: {query}")
+            
+            if max_results > self.retmax:
+                # Too many for a single esearch page - page through the history server
+                articles = [article async for article in self.iter_articles(query, max_results)]
+                logger.info(f"Retrieved {len(articles)} articles from PubMed")
+                return articles
+            
+            # Step 1: Search for PMIDs
+            search_params = {
+                "db": self.db,
+                "term": query,
+                "retmax": min(max_results, self.retmax),
+                "retmode": "json",
+                "sort": "relevance"
+            }
+            
+            response = await request_with_retries("GET", self.search_url, params=self._eutils_params(search_params))
+            
+            search_data = response.json()
+            pmids = search_data.get("esearchresult", {}).get("idlist", [])
+            
+            if not pmids:
+                logger.info("No articles found in PubMed")
+                return []
+            
+            # Step 2: Fetch article details
+            articles = await self._fetch_article_details(pmids[:max_results])
+            
+            logger.info(f"Retrieved {len(articles)} articles from PubMed")
+            return articles
+            
+        except httpx.HTTPError as e:
+            logger.error(f"PubMed API request failed: {e}")
+            raise Exception(f"PubMed API error: {e}")
+        except Exception as e:
+            logger.error(f"Error searching PubMed: {e}")
+            raise
+    
+    async def _fetch_article_details(self, pmids: List[str]) -> List[Article]:
+        """Fetch detailed information for given PMIDs, calling esummary only for uncached ones"""
+        record_cache = get_record_cache("pubmed")
+        cached = await record_cache.get_many(pmids)
+        missing = [pmid for pmid in pmids if pmid not in cached]
+        
+        fetched = {}
+        if missing:
+            logger.info(f"Fetching {len(missing)} of {len(pmids)} PubMed records ({len(cached)} cached)")
+            articles = await self._fetch_article_summaries(missing)
+            fetched = {article.pmid: article for article in articles}
+            await record_cache.put_many({
+                article.pmid: article for article in articles if article.error is None
+            })
+        
+        return [cached.get(pmid) or fetched[pmid] for pmid in pmids if pmid in cached or pmid in fetched]
+    
+    async def _fetch_article_summaries(self, pmids: List[str]) -> List[Article]:
+        """Call esummary for the given PMIDs, in chunks to stay within URL length limits"""
+        articles = []
+        batch_size = Config.PUBMED_ESUMMARY_BATCH_SIZE
+        for start in range(0, len(pmids), batch_size):
+            articles.extend(await self._fetch_summary_chunk(pmids[start:start + batch_size]))
+        return articles
+    
+    async def _fetch_summary_chunk(self, pmids: List[str]) -> List[Article]:
+        """Call esummary for one chunk of PMIDs"""
+        try:
+            # Use esummary for faster retrieval of basic details
+            summary_params = {
+                "db": self.db,
+                "id": ",".join(pmids),
+                "retmode": "json"
+            }
+            
+            response = await request_with_retries("GET", self.summary_url, params=self._eutils_params(summary_params))
+            
+            summary_data = response.json()
+            articles = []
+            
+            for pmid in pmids:
+                if pmid in summary_data.get("result", {}):
+                    article_data = summary_data["result"][pmid]
+                    article = self._parse_article_summary(pmid, article_data)
+                    articles.append(article)
+            
+            return articles
+            
+        except Exception as e:
+            logger.error(f"Error fetching article details: {e}")
+            # Fallback to basic information
+            return [Article(pmid, title="Details unavailable", error=str(e)) for pmid in pmids]
+    
+    async def iter_articles(self, query: str, max_results: Optional[int] = None, batch_size: Optional[int] = None) -> AsyncIterator[Article]:
+        """
+        Stream articles for large result sets using the E-utilities history server
+        
+        esearch stores the hit list server-side (usehistory=y) and esummary pages
+        through it by WebEnv/query_key, so no PMID list is sent in the URL and only one
+        batch of articles is held in memory at a time.
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of articles to yield (None for all hits)
+            batch_size: Articles per esummary request (defaults to Config.PUBMED_ESUMMARY_BATCH_SIZE)
+            
+        Yields:
+            Article records, in relevance order, as each batch arrives
+        """
+        batch_size = batch_size or Config.PUBMED_ESUMMARY_BATCH_SIZE
+        try:
+            search_params = {
+                "db": self.db,
+                "term": query,
+                "retmax": 0,
+                "retmode": "json",
+                "sort": "relevance",
+                "usehistory": "y"
+            }
+            response = await request_with_retries("GET", self.search_url, params=self._eutils_params(search_params))
+            search_result = response.json().get("esearchresult", {})
+            
+            total = int(search_result.get("count", 0))
+            if max_results is not None:
+                total = min(total, max_results)
+            web_env = search_result.get("webenv")
+            query_key = search_result.get("querykey")
+            if not total or not web_env:
+                logger.info("No articles found in PubMed")
+                return
+            
+            logger.info(f"Streaming {total} PubMed articles in batches of {batch_size}")
+            record_cache = get_record_cache("pubmed")
+            
+            for retstart in range(0, total, batch_size):
+                summary_params = {
+                    "db": self.db,
+                    "WebEnv": web_env,
+                    "query_key": query_key,
+                    "retstart": retstart,
+                    "retmax": min(batch_size, total - retstart),
+                    "retmode": "json"
+                }
+                response = await request_with_retries("GET", self.summary_url, params=self._eutils_params(summary_params))
+                summary_data = response.json().get("result", {})
+                
+                batch = [
+                    self._parse_article_summary(pmid, summary_data[pmid])
+                    for pmid in summary_data.get("uids", [])
+                    if pmid in summary_data
+                ]
+                await record_cache.put_many({
+                    article.pmid: article for article in batch if article.error is None
+                })
+                for article in batch:
+                    yield article
+                    
+        except httpx.HTTPError as e:
+            logger.error(f"PubMed API request failed: {e}")
+            raise Exception(f"PubMed API error: {e}")
+    
+    def _eutils_params(self, params: Dict) -> Dict:
+        """Add the NCBI identification parameters (tool, email, api_key) to a request"""
+        params = dict(params)
+        if Config.NCBI_TOOL:
+            params["tool"] = Config.NCBI_TOOL
+        if Config.NCBI_EMAIL:
+            params["email"] = Config.NCBI_EMAIL
+        if Config.NCBI_API_KEY:
+            params["api_key"] = Config.NCBI_API_KEY
+        return params
+    
+    def _parse_article_summary(self, pmid: str, data: Dict) -> Article:
+        """Parse article summary data into an Article record"""
+        try:
+            return Article(
+                pmid=pmid,
+                title=data.get("title", "No title available"),
+                authors=self._parse_authors(data.get("authors", [])),
+                journal=data.get("source", "Unknown journal"),
+                publication_date=data.get("pubdate", "Unknown date"),
+                abstract=data.get("abstract", "No abstract available"),
+                doi=data.get("elocationid", ""),
+                pmc=data.get("pmc", ""),
+                mesh_terms=data.get("mesh", []),
+                keywords=data.get("keywords", []),
+                url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+                retrieved_at=datetime.utcnow().isoformat()
+            )
+        except Exception as e:
+            logger.error(f"Error parsing article data for PMID {pmid}: {e}")
+            return Article(pmid, title="Parsing error", error=str(e))
+    
+    def _parse_authors(self, authors_data: List[Dict]) -> List[str]:
+        """Parse authors data into list of author names"""
+        try:
+            if not authors_data:
+                return ["Unknown authors"]
+            
+            authors = []
+            for author in authors_data:
+                name_parts = []
+                if author.get("name"):
+                    name_parts.append(author["name"])
+                elif author.get("lastname") or author.get("forename"):
+                    if author.get("lastname"):
+                        name_parts.append(author["lastname"])
+                    if author.get("forename"):
+                        name_parts.append(author["forename"])
+                
+                if name_parts:
+                    authors.append(" ".join(name_parts))
+            
+            return authors if authors else ["Unknown authors"]
+        except Exception as e:
+            logger.error(f"Error parsing authors: {e}")
+            return ["Unknown authors"]
+    
+    async def get_article_by_pmid(self, pmid: str) -> Optional[Article]:
+        """Get a specific article by PMID"""
+        try:
+            cached = await get_record_cache("pubmed").get(pmid)
+            if cached:
+                return cached
+            
+            articles = await self._fetch_article_details([pmid])
+            return articles[0] if articles else None
+        except Exception as e:
+            logger.error(f"Error retrieving article {pmid}: {e}")
+            return None
+    
+    def get_source_info(self) -> Dict:
+        """Get information about the PubMed data source"""
+        return {
+            "name": "PubMed",
+            "description": "PubMed is a free search engine accessing primarily the MEDLINE database of references and abstracts on life sciences and biomedical topics",
+            "url": "https://pubmed.ncbi.nlm.nih.gov/",
+            "api_documentation": "https://www.ncbi.nlm.nih.gov/books/NBK25501/",
+            "data_types": ["articles", "abstracts", "metadata"],
+            "access_method": "api",
+            "rate_limits": "3 requests per second without API key, 10 requests per second with API key"
         }
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Process-wide async token-bucket rate limiting per upstream host
+"""
+
+from typing import Dict, Optional
+from loguru import logger
+import asyncio
+import time
+
+from config import Config
+
+
+class TokenBucket:
+    """
+    Async token bucket: ``rate`` requests per second with bursts up to ``capacity``
+
+    Callers over the rate wait their turn (FIFO, via the lock) instead of failing.
+    ``pause`` blocks the whole bucket, e.g. when the server answers 429 with Retry-After.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self._metrics = {"acquired": 0, "delayed": 0, "wait_time_total_ms": 0.0, "pauses": 0}
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+        waited = time.monotonic() - start
+        self._metrics["acquired"] += 1
+        if waited > 0.001:
+            self._metrics["delayed"] += 1
+            self._metrics["wait_time_total_ms"] += waited * 1000
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for ``seconds`` and drop any saved-up burst"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+        self._metrics["pauses"] += 1
+        logger.warning(f"Rate limiter paused for {seconds:.1f}s")
+
+    def get_metrics(self) -> Dict:
+        return dict(self._metrics, rate=self.rate, capacity=self.capacity)
+
+
+_limiters: Dict[str, TokenBucket] = {}
+
+
+def get_rate_limiter(host: str) -> Optional[TokenBucket]:
+    """Get the shared limiter for ``host``, or None if the host is not rate limited"""
+    if host not in _limiters:
+        rate = Config.RATE_LIMITS.get(host)
+        if not rate:
+            return None
+        _limiters[host] = TokenBucket(rate)
+    return _limiters[host]
+
+
+def get_rate_limiter_metrics() -> Dict:
+    """Metrics for every limiter created so far, keyed by host"""
+    return {host: limiter.get_metrics() for host, limiter in _limiters.items()}
@@ -0,0 +1,141 @@
+"""
+Typed, slotted record models shared by the data source adapters
+
+Records avoid a per-instance ``__dict__`` (and its repeated string keys), so large
+result sets take less memory. Search results stay records through the caches, the
+workflow and the orchestrator and are only converted where they are serialized (API
+responses, stored payloads, LLM prompts, provenance hashes): ``to_dict`` produces the
+same shape the adapters have always returned, ``json_default`` lets JSON encoders take
+records directly, and ``records_to_dicts``, ``records_to_json`` and ``records_to_columns``
+serialize whole result sets at once.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from adapters import json_codec
+
+
+class _Record:
+    """Serialization helpers for the slotted record dataclasses below"""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in the adapters' historical response shape ("error" only when set)"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        if data.get("error") is None:
+            data.pop("error", None)
+        return data
+
+    def to_json(self) -> str:
+        """Compact JSON encoding of ``to_dict()``"""
+        return json_codec.dumps(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build a record from a dict, ignoring unknown keys"""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+@dataclass(slots=True)
+class Article(_Record):
+    """A PubMed article summary"""
+
+    pmid: str
+    title: str = "No title available"
+    authors: List[str] = field(default_factory=list)
+    journal: str = "Unknown journal"
+    publication_date: str = "Unknown date"
+    abstract: str = "No abstract available"
+    doi: str = ""
+    pmc: str = ""
+    mesh_terms: List[str] = field(default_factory=list)
+    keywords: List[str] = field(default_factory=list)
+    url: str = ""
+    source: str = "pubmed"
+    retrieved_at: str = ""
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Protein(_Record):
+    """A UniProtKB protein entry"""
+
+    accession: str
+    id: str = ""
+    protein_name: str = "Unknown protein"
+    organism: str = "Unknown organism"
+    organism_id: Any = ""
+    gene_names: List[str] = field(default_factory=list)
+    sequence: str = ""
+    sequence_length: int = 0
+    molecular_weight: int = 0
+    ec_numbers: List[str] = field(default_factory=list)
+    go_terms: List[Dict] = field(default_factory=list)
+    keywords: List[str] = field(default_factory=list)
+    feature_count: int = 0
+    reviewed: bool = False
+    url: str = ""
+    source: str = "uniprot"
+    retrieved_at: str = ""
+    extra: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = _Record.to_dict(self)
+        if data["extra"] is None:
+            del data["extra"]
+        return data
+
+
+@dataclass(slots=True)
+class AdmeProfile(_Record):
+    """SwissADME results for a single molecule"""
+
+    smiles: str
+    physicochemical_properties: Dict[str, Any] = field(default_factory=dict)
+    lipophilicity: Dict[str, Any] = field(default_factory=dict)
+    water_solubility: Dict[str, Any] = field(default_factory=dict)
+    pharmacokinetics: Dict[str, Any] = field(default_factory=dict)
+    druglikeness: Dict[str, Any] = field(default_factory=dict)
+    medicinal_chemistry: Dict[str, Any] = field(default_factory=dict)
+    images: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_result(cls, result: Dict, smiles: str) -> "AdmeProfile":
+        """Pick one molecule's rows out of a section-keyed scrape_swissadme result"""
+        return cls(smiles, *(result.get(section, {}).get(smiles, {}) for section in cls.__slots__[1:]))
+
+
+def records_to_dicts(records: Iterable[_Record]) -> List[Dict[str, Any]]:
+    """Convert records to plain dicts, e.g. at an API or persistence boundary"""
+    return [record.to_dict() for record in records]
+
+
+def json_default(obj: Any) -> Any:
+    """
+    ``default`` hook for JSON encoders of results that may contain records
+
+    Records encode in their ``to_dict()`` shape; anything else falls back to ``str``.
+    """
+    if isinstance(obj, _Record):
+        return obj.to_dict()
+    return str(obj)
+
+
+def records_to_json(records: Iterable[_Record]) -> str:
+    """Encode records as a JSON array"""
+    return json_codec.dumps([record.to_dict() for record in records])
+
+
+def records_to_columns(records: Iterable[_Record]) -> Dict[str, List[Any]]:
+    """
+    Column-oriented view of same-typed records: ``{field: [value, ...]}``
+
+    The result can be handed directly to ``pandas.DataFrame`` or a columnar writer.
+    """
+    records = list(records)
+    if not records:
+        return {}
+    return {name: [getattr(record, name) for record in records] for name in type(records[0]).__slots__}
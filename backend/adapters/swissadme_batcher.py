@@ -0,0 +1,164 @@
+"""
+Micro-batching of SwissADME submissions across concurrent requests
+"""
+
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+import asyncio
+
+from config import Config
+
+# Sections of a scrape_swissadme result that are keyed per SMILES
+PER_MOLECULE_SECTIONS = (
+    "physicochemical_properties",
+    "lipophilicity",
+    "water_solubility",
+    "pharmacokinetics",
+    "druglikeness",
+    "medicinal_chemistry",
+    "images",
+)
+
+ScrapeFunc = Callable[[List[str]], Awaitable[Dict]]
+
+
+def slice_result(result: Dict, smiles: List[str]) -> Dict:
+    """Extract the rows for ``smiles`` from a (possibly larger) scrape_swissadme result"""
+    if not result.get("success"):
+        return {"success": False, "error": result.get("error", "SwissADME scrape failed")}
+
+    sliced = {"success": True, "smiles": list(smiles)}
+    for section in PER_MOLECULE_SECTIONS:
+        rows = result.get(section, {})
+        sliced[section] = {s: rows.get(s, {}) for s in smiles}
+    errors = result.get("errors", {})
+    sliced["errors"] = {s: errors[s] for s in smiles if s in errors}
+    # The BOILED-Egg plot is rendered once per submission and plots (and labels) every
+    # molecule in it, so only a caller who owns the whole submission gets it
+    owns_batch = set(result.get("smiles", [])) <= set(smiles)
+    sliced["boiled_egg_plot"] = result.get("boiled_egg_plot", "") if owns_batch else ""
+    sliced["source"] = result.get("source", "swissadme")
+    return sliced
+
+
+class SmilesBatcher:
+    """
+    Coalesces SMILES from concurrent callers into a single SwissADME submission
+
+    Requests arriving within ``window`` seconds of each other share one scrape, up to
+    ``max_batch_size`` distinct molecules. Each caller gets back only its own rows (and
+    the BOILED-Egg plot only when no other request's molecules are on it).
+    If a shared submission fails outright, each caller's molecules are resubmitted on
+    their own so one caller's bad input doesn't fail everybody else's request.
+    """
+
+    def __init__(self, scrape: ScrapeFunc, window: float, max_batch_size: int):
+        self._scrape = scrape
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._pending_smiles: Dict[str, None] = {}  # insertion-ordered set
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self._metrics = {"submissions": 0, "batches": 0, "molecules_submitted": 0, "molecules_requested": 0, "isolated_retries": 0}
+
+    async def submit(self, smiles: List[str]) -> Dict:
+        """Queue ``smiles`` for the next batch and wait for this caller's slice of the result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        new_smiles = [s for s in dict.fromkeys(smiles) if s not in self._pending_smiles]
+        if self._pending and len(self._pending_smiles) + len(new_smiles) > self.max_batch_size:
+            # Don't let this request push the open batch past its cap
+            self._flush()
+
+        self._pending.append((list(smiles), future))
+        self._pending_smiles.update(dict.fromkeys(smiles))
+        self._metrics["submissions"] += 1
+        self._metrics["molecules_requested"] += len(smiles)
+
+        if len(self._pending_smiles) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        waiters, self._pending = self._pending, []
+        batch_smiles, self._pending_smiles = list(self._pending_smiles), {}
+
+        self._metrics["batches"] += 1
+        self._metrics["molecules_submitted"] += len(batch_smiles)
+        logger.info(f"Submitting SwissADME batch of {len(batch_smiles)} molecules for {len(waiters)} request(s)")
+
+        task = asyncio.ensure_future(self._run_batch(batch_smiles, waiters))
+
+        def _cancel_if_abandoned(_):
+            # Every caller went away (e.g. disconnected) - stop scraping for nobody
+            if all(f.cancelled() for _, f in waiters) and not task.done():
+                task.cancel()
+
+        for _, future in waiters:
+            future.add_done_callback(_cancel_if_abandoned)
+
+    async def _run_batch(self, batch_smiles: List[str], waiters: List[Tuple[List[str], asyncio.Future]]):
+        try:
+            result = await self._scrape_or_error(batch_smiles)
+            if not result.get("success") and len(waiters) > 1:
+                logger.warning(f"SwissADME batch failed ({result.get('error')}), resubmitting each request on its own")
+                self._metrics["isolated_retries"] += 1
+                await asyncio.gather(*(
+                    self._run_alone(smiles, future) for smiles, future in waiters if not future.done()
+                ))
+                return
+        except asyncio.CancelledError:
+            for _, future in waiters:
+                if not future.done():
+                    future.cancel()
+            raise
+
+        for smiles, future in waiters:
+            if not future.done():
+                future.set_result(slice_result(result, smiles))
+
+    async def _run_alone(self, smiles: List[str], future: asyncio.Future):
+        result = await self._scrape_or_error(smiles)
+        if not future.done():
+            future.set_result(slice_result(result, smiles))
+
+    async def _scrape_or_error(self, smiles: List[str]) -> Dict:
+        try:
+            return await self._scrape(smiles)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def get_metrics(self) -> Dict:
+        """Batching effectiveness counters"""
+        metrics = dict(self._metrics)
+        batches = metrics["batches"]
+        metrics["avg_molecules_per_batch"] = metrics["molecules_submitted"] / batches if batches else 0.0
+        metrics["avg_requests_per_batch"] = metrics["submissions"] / batches if batches else 0.0
+        return metrics
+
+
+_batcher: Optional[SmilesBatcher] = None
+
+
+def get_smiles_batcher(scrape: ScrapeFunc) -> SmilesBatcher:
+    """Get the process-wide batcher, created with ``scrape`` on first use"""
+    global _batcher
+    if _batcher is None:
+        _batcher = SmilesBatcher(
+            scrape,
+            window=Config.SWISSADME_BATCH_WINDOW_MS / 1000,
+            max_batch_size=Config.SWISSADME_BATCH_MAX_SIZE,
+        )
+    return _batcher
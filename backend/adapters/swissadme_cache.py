@@ -0,0 +1,135 @@
+"""
+Persistent per-molecule cache of SwissADME results, keyed by canonical SMILES
+"""
+
+from typing import Dict, List, Optional
+from loguru import logger
+import re
+
+from adapters.records import AdmeProfile
+from adapters.swissadme_batcher import PER_MOLECULE_SECTIONS
+from cache.kv_store import SqliteKVStore
+from config import Config
+
+try:
+    from rdkit import Chem
+    from rdkit import RDLogger
+    RDLogger.DisableLog("rdApp.*")
+except ImportError:  # RDKit is optional; fall back to textual normalization
+    Chem = None
+
+
+def canonicalize_smiles(smiles: str) -> str:
+    """
+    Normalize a SMILES string so equivalent spellings share a cache entry
+
+    Uses RDKit canonical SMILES when available; otherwise strips whitespace only.
+    """
+    smiles = "".join(smiles.split())
+    if Chem is not None:
+        mol = Chem.MolFromSmiles(smiles)
+        if mol is not None:
+            return Chem.MolToSmiles(mol)
+    return smiles
+
+
+# Atoms outside brackets plus bond, ring-closure, branch and charge symbols
+_BRACKET_ATOM_RE = re.compile(r"\[[^\[\]]+\]")
+_SMILES_RE = re.compile(r"^(?:Cl|Br|[BCNOPSFIbcnops]|[0-9%=#$@+\-/\\().:*])+$")
+
+
+def looks_like_smiles(text: str) -> bool:
+    """
+    Whether ``text`` is one or more SMILES (newline/comma separated) rather than prose
+
+    Free-text questions contain spaces or letters that aren't organic-subset atoms
+    (e.g. "aspirin"), so they are never sent to SwissADME as molecules.
+    """
+    parts = [part.strip() for part in re.split(r"[\n,]", text)]
+    parts = [part for part in parts if part]
+    return bool(parts) and all(_SMILES_RE.match(_BRACKET_ATOM_RE.sub("C", part)) for part in parts)
+
+
+class SwissADMECache:
+    """Stores each molecule's SwissADME sections so repeat submissions skip the scrape"""
+
+    def __init__(self, store: SqliteKVStore):
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, smiles: List[str]) -> Dict[str, AdmeProfile]:
+        """Return cached profiles keyed by the caller's SMILES spelling"""
+        keys = {s: canonicalize_smiles(s) for s in smiles}
+        found = self.store.get_many(keys.values())
+        entries = {s: AdmeProfile.from_dict({**found[key], "smiles": s}) for s, key in keys.items() if key in found}
+        self.hits += len(entries)
+        self.misses += len(keys) - len(entries)
+        return entries
+
+    def put_result(self, result: Dict):
+        """
+        Cache every molecule from a successful scrape_swissadme result that has CSV data
+
+        Only rows matched to the submitted molecule (by its ``molN`` name) are cached. With
+        RDKit the row's reported SMILES must also canonicalize to the submitted key.
+        Without it, the row is additionally stored under SwissADME's own canonical SMILES,
+        so later submissions spelled that way share the entry.
+        """
+        if not result.get("success"):
+            return
+        csv_smiles = result.get("csv_smiles", {})
+        items = {}
+        for smiles in result.get("smiles", []):
+            if not result.get("physicochemical_properties", {}).get(smiles):
+                # No CSV row came back for this molecule - don't cache an empty answer
+                continue
+            reported = csv_smiles.get(smiles)
+            if not reported:
+                continue
+            key = canonicalize_smiles(smiles)
+            alias = canonicalize_smiles(reported)
+            if Chem is not None and alias != key:
+                logger.debug(f"Not caching SwissADME row for {smiles}: reported SMILES {reported} doesn't match")
+                continue
+            profile = AdmeProfile.from_result(result, smiles).to_dict()
+            items[key] = profile
+            items[alias] = profile
+        self.store.set_many(items)
+        logger.info(f"Cached SwissADME results for {len(items)} molecule(s)")
+
+    @staticmethod
+    def compose(smiles: List[str], profiles: Dict[str, AdmeProfile], boiled_egg_plot: str = "") -> Dict:
+        """Build a scrape_swissadme-shaped result from per-molecule profiles"""
+        result = {"success": True, "smiles": list(smiles)}
+        for section in PER_MOLECULE_SECTIONS:
+            result[section] = {s: getattr(profiles[s], section) if s in profiles else {} for s in smiles}
+        result["boiled_egg_plot"] = boiled_egg_plot
+        result["source"] = "swissadme"
+        return result
+
+    def get_metrics(self) -> Dict:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.store),
+        }
+
+
+_cache: Optional[SwissADMECache] = None
+
+
+def get_swissadme_cache() -> SwissADMECache:
+    """Get the process-wide SwissADME result cache"""
+    global _cache
+    if _cache is None:
+        _cache = SwissADMECache(SqliteKVStore(
+            Config.CACHE_DB_PATH,
+            table="swissadme_results",
+            ttl=Config.SWISSADME_CACHE_TTL,
+            max_entries=Config.SWISSADME_CACHE_MAX_ENTRIES,
+        ))
+    return _cache
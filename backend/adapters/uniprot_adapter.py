@@ -2,13 +2,151 @@
 UniProt API adapter for retrieving protein data
 """
 
-import requests
+import httpx
 import json
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Optional
 from loguru import logger
-import time
 from datetime import datetime
 
+from adapters import json_codec
+from adapters.http_client import request_with_retries, stream_request
+from adapters.records import Protein
+from cache.response_cache import get_response_cache
+from cache.record_cache import get_record_cache
+from config import Config
+
+# UniProtKB return fields covering every key _parse_protein_data reads
+UNIPROT_PARSER_FIELDS = (
+    "accession",      # primaryAccession
+    "id",             # uniProtkbId
+    "reviewed",       # entryType
+    "protein_name",   # proteinDescription (including recommendedName.ecNumbers)
+    "organism_name",  # organism.scientificName / taxonId
+    "gene_names",     # genes
+    "sequence",       # sequence.value / length / molWeight
+    "keyword",        # keywords
+    "go",             # uniProtKBCrossReferences (GO only)
+    "feature_count",  # extraAttributes.countByFeatureType
+)
+
+# Top-level JSON keys consumed by the parser; anything else came from extra_fields
+_PARSED_ENTRY_KEYS = {
+    "entryType", "primaryAccession", "uniProtkbId", "proteinDescription", "organism", "genes",
+    "sequence", "keywords", "uniProtKBCrossReferences", "features", "extraAttributes",
+}
+
+
+def uniprot_fields_param(extra_fields: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Build the ``fields`` query parameter for UniProtKB requests
+
+    Returns None (full entries) when projection is disabled via UNIPROT_FIELD_PROJECTION.
+    """
+    if not Config.UNIPROT_FIELD_PROJECTION:
+        return None
+    fields = list(dict.fromkeys([*UNIPROT_PARSER_FIELDS, *(extra_fields or [])]))
+    return ",".join(fields)
+
+
+async def _iter_json_results(text_chunks: AsyncIterator[str], array_key: str = "results") -> AsyncIterator[Dict]:
+    """
+    Incrementally decode the objects of a top-level JSON array (``{"results": [...]}``)
+
+    Only the current partial entry is buffered, so arbitrarily large responses are
+    parsed in bounded memory.
+    """
+    decoder = json.JSONDecoder()
+    marker = f'"{array_key}"'
+    buffer = ""
+    in_array = False
+
+    async for chunk in text_chunks:
+        buffer += chunk
+        if not in_array:
+            start = buffer.find(marker)
+            bracket = buffer.find("[", start) if start != -1 else -1
+            if bracket == -1:
+                continue
+            buffer = buffer[bracket + 1:]
+            in_array = True
+
+        while True:
+            buffer = buffer.lstrip(" \t\r\n,")
+            if not buffer:
+                break
+            if buffer[0] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                break  # Entry not complete yet - wait for more data
+            yield item
+            buffer = buffer[end:]
+
+_REVIEWED_ENTRY_TYPE = "UniProtKB reviewed (Swiss-Prot)"
+
+
+def _extract_protein(data: Dict, include_extra: bool, retrieved_at: str) -> Protein:
+    """Single-pass extraction of the standardized protein fields from a UniProtKB entry"""
+    get = data.get
+    accession = get("primaryAccession", "")
+
+    protein_name = "Unknown protein"
+    ec_numbers = []
+    recommended = (get("proteinDescription") or {}).get("recommendedName")
+    if isinstance(recommended, dict):
+        full_name = recommended.get("fullName")
+        if isinstance(full_name, dict):
+            protein_name = full_name.get("value", protein_name)
+        ec_numbers = [ec["value"] for ec in recommended.get("ecNumbers") or () if isinstance(ec, dict) and ec.get("value")]
+
+    organism = get("organism")
+    if not isinstance(organism, dict):
+        organism = {}
+    sequence = get("sequence")
+    if not isinstance(sequence, dict):
+        sequence = {}
+
+    gene_names = []
+    for gene in get("genes") or ():
+        gene_name = gene.get("geneName")
+        if isinstance(gene_name, dict) and gene_name.get("value"):
+            gene_names.append(gene_name["value"])
+
+    go_terms = [
+        {"id": ref.get("id", ""), "properties": ref.get("properties", [])}
+        for ref in get("uniProtKBCrossReferences") or ()
+        if ref.get("database") == "GO"
+    ]
+
+    # Full entries carry the feature list; projected ones only the per-type counts
+    features = get("features")
+    if isinstance(features, list):
+        feature_count = len(features)
+    else:
+        counts = (get("extraAttributes") or {}).get("countByFeatureType")
+        feature_count = sum(c for c in counts.values() if isinstance(c, int)) if isinstance(counts, dict) else 0
+
+    return Protein(
+        accession=accession,
+        id=get("uniProtkbId", ""),
+        protein_name=protein_name,
+        organism=organism.get("scientificName", "Unknown organism"),
+        organism_id=organism.get("taxonId", ""),
+        gene_names=gene_names,
+        sequence=sequence.get("value", ""),
+        sequence_length=sequence.get("length", 0),
+        molecular_weight=sequence.get("molWeight", 0),
+        ec_numbers=ec_numbers,
+        go_terms=go_terms,
+        keywords=[kw.get("name", "") for kw in get("keywords") or () if isinstance(kw, dict)],
+        feature_count=feature_count,
+        reviewed=get("entryType") == _REVIEWED_ENTRY_TYPE,
+        url=f"https://www.uniprot.org/uniprotkb/{accession}",
+        retrieved_at=retrieved_at,
+        extra={key: value for key, value in data.items() if key not in _PARSED_ENTRY_KEYS} if include_extra else None
+    )
+
 class UniProtAdapter:
     """Adapter for UniProt API integration"""
     
@@ -16,128 +154,184 @@ class UniProtAdapter:
         self.base_url = "https://rest.uniprot.org"
         self.search_url = f"{self.base_url}/uniprotkb/search"
         self.retrieve_url = f"{self.base_url}/uniprotkb"
+        self.stream_url = f"{self.base_url}/uniprotkb/stream"
         self.max_results = 100
         
-    async def search_proteins(self, query: str, max_results: int = 10) -> List[Dict]:
+    async def search_proteins(self, query: str, max_results: int = 10, extra_fields: Optional[List[str]] = None) -> List[Protein]:
         """
         Search for proteins in UniProt
         
+        Only the fields the parser needs are downloaded; ``extra_fields`` requests
+        additional UniProtKB return fields, whose raw JSON is returned under "extra".
+        Repeated queries are served from the shared response cache (stale entries are
+        returned immediately and refreshed in the background).
+        
         Args:
             query: Search query string (can be protein name, gene name, organism, etc.)
             max_results: Maximum number of results to return
+            extra_fields: Additional UniProtKB return fields (e.g. ["cc_function", "xref_pdb"])
             
         Returns:
-            List of protein dictionaries
+            List of Protein records (serialized with ``to_dict`` / ``records.json_default``)
         """
+        params = {"op": "search", "query": query, "size": max_results}
+        if extra_fields:
+            params["extra_fields"] = extra_fields
+        return await get_response_cache().get_or_fetch(
+            "uniprot",
+            params,
+            lambda: self._search_proteins_remote(query, max_results, extra_fields)
+        )
+    
+    async def _search_proteins_remote(self, query: str, max_results: int, extra_fields: Optional[List[str]] = None) -> List[Protein]:
+        """Run a UniProtKB search against the REST API"""
         try:
             logger.info(f"Searching UniProt for: {query}")
             
+            if max_results > self.max_results:
+                # More than one page - follow the pagination cursor
+                proteins = [protein async for protein in self.iter_proteins(query, max_results, extra_fields=extra_fields)]
+                logger.info(f"Retrieved {len(proteins)} proteins from UniProt")
+                return proteins
+            
             # Construct search parameters
             search_params = {
                 "query": query,
                 "size": min(max_results, self.max_results),
                 "format": "json",
-                # "fields": "accession,id,protein_name,organism_name,gene_names,sequence,length,mass,ec,go,feature_count,reviewed"
             }
+            fields = uniprot_fields_param(extra_fields)
+            if fields:
+                search_params["fields"] = fields
+            
+            response = await request_with_retries("GET", self.search_url, params=search_params)
+            
+            data = json_codec.loads(response.content)
+            results = data.get("results", [])
+            retrieved_at = datetime.utcnow().isoformat()
             
-            response = requests.get(self.search_url, params=search_params, timeout=30)
-            response.raise_for_status()
+            if extra_fields:
+                # Cached records only hold the standard fields
+                proteins = [self._parse_protein_data(result, include_extra=True, retrieved_at=retrieved_at)
+                            for result in results]
+                logger.info(f"Retrieved {len(proteins)} proteins from UniProt")
+                return proteins
             
-            data = response.json()
+            # Reuse already-parsed entries; only parse (and cache) accessions not seen before
+            record_cache = get_record_cache("uniprot")
+            cached = await record_cache.get_many(
+                result.get("primaryAccession", "") for result in results if result.get("primaryAccession")
+            )
             proteins = []
+            parsed = {}
             
-            for result in data.get("results", []):
-                protein = self._parse_protein_data(result)
+            for result in results:
+                accession = result.get("primaryAccession", "")
+                protein = cached.get(accession)
+                if protein is None:
+                    protein = self._parse_protein_data(result, retrieved_at=retrieved_at)
+                    if accession and protein.error is None:
+                        parsed[accession] = protein
                 proteins.append(protein)
             
+            await record_cache.put_many(parsed)
+            
             logger.info(f"Retrieved {len(proteins)} proteins from UniProt")
             return proteins
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"UniProt API request failed: {e}")
             raise Exception(f"UniProt API error: {e}")
         except Exception as e:
             logger.error(f"Error searching UniProt: {e}")
             raise
     
-    @staticmethod
-    def _safe_get(obj: Any, path: list, default: Any = None) -> Any:
-        """Safely traverse nested dicts/lists with type checking"""
-        for key in path:
-            if isinstance(obj, dict):
-                obj = obj.get(key, default)
-            elif isinstance(obj, list) and isinstance(key, int) and key < len(obj):
-                obj = obj[key]
-            else:
-                return default
-        return obj
-
-    def _parse_protein_data(self, data: Dict) -> Dict:
-        """Parse UniProt protein JSON into standardized format"""
+    async def iter_proteins(self, query: str, max_results: Optional[int] = None, page_size: Optional[int] = None,
+                            extra_fields: Optional[List[str]] = None) -> AsyncIterator[Protein]:
+        """
+        Page through UniProtKB search results by following the ``Link: rel="next"`` cursor
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of proteins to yield (None for every match)
+            page_size: Entries per page (UniProt allows up to 500)
+            extra_fields: Additional UniProtKB return fields, returned under "extra"
+            
+        Yields:
+            Protein records, one page at a time
+        """
+        page_size = page_size or Config.UNIPROT_PAGE_SIZE
+        url = self.search_url
+        params = {"query": query, "size": page_size, "format": "json"}
+        fields = uniprot_fields_param(extra_fields)
+        if fields:
+            params["fields"] = fields
+        yielded = 0
         try:
-            protein = {
-                "accession": data.get("primaryAccession", ""),
-                "id": data.get("uniProtkbId", ""),
-                "protein_name": UniProtAdapter._safe_get(
-                    data, ["proteinDescription", "recommendedName", "fullName", "value"], "Unknown protein"
-                ),
-                "organism": UniProtAdapter._safe_get(data, ["organism", "scientificName"], "Unknown organism"),
-                "organism_id": UniProtAdapter._safe_get(data, ["organism", "taxonId"], ""),
-                "gene_names": self._extract_gene_names(data.get("genes", [])),
-                "sequence": UniProtAdapter._safe_get(data, ["sequence", "value"], ""),
-                "sequence_length": UniProtAdapter._safe_get(data, ["sequence", "length"], 0),
-                "molecular_weight": UniProtAdapter._safe_get(data, ["sequence", "molWeight"], 0),
-                "ec_numbers": self._extract_ec_numbers(
-                    UniProtAdapter._safe_get(data, ["proteinDescription", "recommendedName", "ecNumbers"], [])
-                ),
-                "go_terms": self._extract_go_terms(data.get("uniProtKBCrossReferences", [])),
-                "keywords": [kw.get("name", "") for kw in data.get("keywords", []) if isinstance(kw, dict)],
-                "feature_count": len(data.get("features", [])) if isinstance(data.get("features", []), list) else 0,
-                "reviewed": data.get("entryType") == "UniProtKB reviewed (Swiss-Prot)",
-                "url": f"https://www.uniprot.org/uniprotkb/{data.get('primaryAccession', '')}",
-                "source": "uniprot",
-                "retrieved_at": datetime.utcnow().isoformat()
-            }
-            return protein
-
+            while url:
+                response = await request_with_retries("GET", url, params=params)
+                retrieved_at = datetime.utcnow().isoformat()
+                for result in json_codec.loads(response.content).get("results", []):
+                    if max_results is not None and yielded >= max_results:
+                        return
+                    yield self._parse_protein_data(result, include_extra=bool(extra_fields), retrieved_at=retrieved_at)
+                    yielded += 1
+                
+                # The next-page URL already carries the query and cursor
+                url = response.links.get("next", {}).get("url")
+                params = None
+                
+        except httpx.HTTPError as e:
+            logger.error(f"UniProt API request failed: {e}")
+            raise Exception(f"UniProt API error: {e}")
+    
+    async def stream_proteins(self, query: str, max_results: Optional[int] = None,
+                              extra_fields: Optional[List[str]] = None) -> AsyncIterator[Protein]:
+        """
+        Bulk-download every match via the /uniprotkb/stream endpoint
+        
+        The response is a single JSON document with all entries; it is decoded
+        incrementally so organism- or keyword-wide pulls run in bounded memory.
+        
+        Args:
+            query: Search query string
+            max_results: Stop after this many proteins (None for every match)
+            extra_fields: Additional UniProtKB return fields, returned under "extra"
+            
+        Yields:
+            Protein records as entries arrive
+        """
+        params = {"query": query, "format": "json"}
+        fields = uniprot_fields_param(extra_fields)
+        if fields:
+            params["fields"] = fields
+        yielded = 0
+        try:
+            async with stream_request("GET", self.stream_url, params=params) as response:
+                retrieved_at = datetime.utcnow().isoformat()
+                async for result in _iter_json_results(response.aiter_text()):
+                    yield self._parse_protein_data(result, include_extra=bool(extra_fields), retrieved_at=retrieved_at)
+                    yielded += 1
+                    if max_results is not None and yielded >= max_results:
+                        return
+                        
+        except httpx.HTTPError as e:
+            logger.error(f"UniProt stream request failed: {e}")
+            raise Exception(f"UniProt API error: {e}")
+    
+    def _parse_protein_data(self, data: Dict, include_extra: bool = False, retrieved_at: Optional[str] = None) -> Protein:
+        """
+        Parse UniProt protein JSON into a Protein record
+        
+        Every field is pulled in a single pass over the entry. Pass ``retrieved_at``
+        to stamp a whole batch with one timestamp instead of one per record.
+        """
+        try:
+            return _extract_protein(data, include_extra, retrieved_at or datetime.utcnow().isoformat())
         except Exception as e:
             logger.error(f"Error parsing protein data: {e}")
-            return {
-                "accession": data.get("primaryAccession", "Unknown"),
-                "protein_name": "Parsing error",
-                "error": str(e),
-                "source": "uniprot"
-            }
+            return Protein(data.get("primaryAccession", "Unknown"), protein_name="Parsing error", error=str(e))
 
-    def _extract_gene_names(self, genes_data: List[Dict]) -> List[str]:
-        """Extract gene names"""
-        gene_names = []
-        for gene in genes_data:
-            if isinstance(gene.get("geneName"), dict):
-                val = gene["geneName"].get("value")
-                if val:
-                    gene_names.append(val)
-        return gene_names
-
-    def _extract_ec_numbers(self, ec_numbers_data: List[Dict]) -> List[str]:
-        """Extract EC numbers"""
-        ec_numbers = []
-        for ec in ec_numbers_data:
-            if isinstance(ec, dict) and ec.get("value"):
-                ec_numbers.append(ec["value"])
-        return ec_numbers
-
-    def _extract_go_terms(self, cross_refs: List[Dict]) -> List[Dict]:
-        """Extract GO terms"""
-        go_terms = []
-        for ref in cross_refs:
-            if ref.get("database") == "GO":
-                go_term = {
-                    "id": ref.get("id", ""),
-                    "properties": ref.get("properties", [])
-                }
-                go_terms.append(go_term)
-        return go_terms
     def get_source_info(self) -> Dict:
         """Get information about the UniProt data source"""
         return {
@@ -0,0 +1,172 @@
+"""
+Token-budgeted compaction of source results before they are sent to the LLM
+"""
+
+from typing import Any, Dict, List, Tuple
+import hashlib
+import json
+import re
+
+from adapters.records import json_default
+from config import Config
+
+# Fields that identify the same record across sources / sub-queries
+_IDENTITY_FIELDS = ("pmid", "accession", "smiles", "doi", "id")
+
+# Fields worth matching the query against (everything else only counts lightly)
+_TEXT_FIELDS = ("title", "abstract", "protein_name", "gene_names", "keywords", "mesh_terms", "organism", "journal")
+
+# Bulky fields that add little to a synthesis prompt
+_DROP_FIELDS = {"images", "boiled_egg_plot", "go_terms", "url", "retrieved_at", "source", "extra"}
+
+_MAX_STRING_CHARS = 800
+_MAX_SEQUENCE_CHARS = 60
+
+_BASE64_RE = re.compile(r"^[A-Za-z0-9+/=\r\n]{256,}$")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)"""
+    return (len(text) + 3) // 4
+
+
+def _is_binary(value: str) -> bool:
+    """
+    Data URIs, or long base64 runs showing a base64 marker
+
+    Long protein sequences are also runs of letters, so the charset alone isn't
+    enough: require "=" padding, "+" or "/", or mixed case with digits.
+    """
+    if value.startswith("data:"):
+        return True
+    if not _BASE64_RE.match(value):
+        return False
+    if value.rstrip().endswith("=") or "+" in value or "/" in value:
+        return True
+    return any(c.islower() for c in value) and any(c.isupper() for c in value) and any(c.isdigit() for c in value)
+
+
+def _strip(value: Any, key: str = "") -> Any:
+    """Drop binary payloads and bulky fields; shorten long strings"""
+    if isinstance(value, dict):
+        return {
+            k: _strip(v, k) for k, v in value.items()
+            # Sequences are truncated, never dropped, whatever they look like
+            if k not in _DROP_FIELDS and (k == "sequence" or not (isinstance(v, str) and _is_binary(v)))
+        }
+    if isinstance(value, list):
+        return [_strip(v, key) for v in value if not (isinstance(v, str) and _is_binary(v))]
+    if isinstance(value, str):
+        limit = _MAX_SEQUENCE_CHARS if key == "sequence" else _MAX_STRING_CHARS
+        if len(value) > limit:
+            return value[:limit] + "..."
+    return value
+
+
+def _collect_records(value: Any, label: str, records: List[Tuple[str, Dict]]) -> Any:
+    """Pull record dicts out of lists (keyed by their source label); return the remaining skeleton"""
+    if isinstance(value, dict):
+        if "results" in value and isinstance(value.get("source"), str):
+            label = value["source"]
+        skeleton = {}
+        for k, v in value.items():
+            child_label = k if label in ("", "results") else label
+            rest = _collect_records(v, child_label, records)
+            if rest not in (None, [], {}):
+                skeleton[k] = rest
+        return skeleton
+    if isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+        records.extend((label or "results", v) for v in value)
+        return None
+    return value
+
+
+def _identity(record: Dict) -> str:
+    for field in _IDENTITY_FIELDS:
+        if record.get(field):
+            return f"{field}:{record[field]}"
+    return hashlib.sha1(json.dumps(record, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _relevance(record: Dict, query_terms: set) -> float:
+    if not query_terms:
+        return 0.0
+    text = " ".join(str(record.get(field, "")) for field in _TEXT_FIELDS).lower()
+    primary = query_terms & set(_WORD_RE.findall(text))
+    everything = query_terms & set(_WORD_RE.findall(json.dumps(record, default=str).lower()))
+    return (len(primary) + 0.25 * len(everything - primary)) / len(query_terms)
+
+
+def compact_results(results: Any, query: str = "", budget: int = None) -> Tuple[str, Dict]:
+    """
+    Reduce source results to the most relevant evidence that fits a token budget
+
+    Binary payloads (data URIs, base64) and bulky fields are stripped, records seen more
+    than once are kept once, and the rest are ranked by overlap with the query terms and
+    packed in order until ``budget`` tokens (default Config.AI_CONTEXT_TOKEN_BUDGET) are used.
+
+    Args:
+        results: Results as a JSON string or already-decoded object
+        query: The research query used for ranking
+        budget: Token budget for the compacted context
+
+    Returns:
+        (compacted JSON string, stats with original/compacted token counts and tokens saved)
+    """
+    budget = budget or Config.AI_CONTEXT_TOKEN_BUDGET
+    if isinstance(results, str):
+        original = results
+        try:
+            results = json.loads(results)
+        except ValueError:
+            compacted = results[:budget * 4]
+            return compacted, _stats(original, compacted, 0, 0, 0)
+    else:
+        original = json.dumps(results, default=json_default)
+        results = json.loads(original)  # Records (Article, Protein) become plain dicts
+
+    if not query and isinstance(results, dict):
+        query = str(results.get("query", ""))
+    query_terms = {term for term in _WORD_RE.findall(query.lower()) if len(term) > 2}
+
+    records: List[Tuple[str, Dict]] = []
+    skeleton = _strip(_collect_records(results, "", records) or {})
+
+    unique = {}
+    for order, (label, record) in enumerate(records):
+        key = _identity(record)
+        if key not in unique:
+            unique[key] = (label, _strip(record), order)
+    duplicates = len(records) - len(unique)
+
+    ranked = sorted(unique.values(), key=lambda item: (-_relevance(item[1], query_terms), item[2]))
+
+    compacted_obj = {"context": skeleton, "evidence": {}}
+    used = estimate_tokens(json.dumps(compacted_obj, separators=(",", ":"), default=str))
+    kept = 0
+    for label, record, _ in ranked:
+        cost = estimate_tokens(json.dumps(record, separators=(",", ":"), default=str)) + 1
+        if used + cost > budget:
+            continue  # A smaller, lower-ranked record may still fit
+        compacted_obj["evidence"].setdefault(label, []).append(record)
+        used += cost
+        kept += 1
+    if kept < len(ranked):
+        compacted_obj["omitted_records"] = len(ranked) - kept
+
+    compacted = json.dumps(compacted_obj, separators=(",", ":"), default=str)
+    return compacted, _stats(original, compacted, len(records), kept, duplicates)
+
+
+def _stats(original: str, compacted: str, records: int, kept: int, duplicates: int) -> Dict:
+    original_tokens = estimate_tokens(original)
+    compacted_tokens = estimate_tokens(compacted)
+    return {
+        "original_tokens": original_tokens,
+        "compacted_tokens": compacted_tokens,
+        "tokens_saved": max(0, original_tokens - compacted_tokens),
+        "records": records,
+        "records_kept": kept,
+        "duplicates_removed": duplicates,
+    }
@@ -1,287 +1,450 @@
-"""
-AI Agent Orchestrator using LangChain for workflow coordination
-"""
-
-from langchain.agents import initialize_agent, AgentType
-from langchain.tools import Tool
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.schema import HumanMessage, SystemMessage
-from typing import List, Dict, Optional, Any
-from loguru import logger
-import asyncio
-import json
-from datetime import datetime
-
-from adapters.pubmed_adapter import PubMedAdapter
-from adapters.uniprot_adapter import UniProtAdapter
-from adapters.swissadme_adapter import SwissADMEAdapter
-from config import Config
-
-class AIOrchestrator:
-    """AI Agent for orchestrating biomedical research workflows"""
-    
-    def __init__(self):
-        self.llm = None
-        self.agent = None
-        self.tools = []
-        self.pubmed_adapter = PubMedAdapter()
-        self.uniprot_adapter = UniProtAdapter()
-        self.swissadme_adapter = SwissADMEAdapter()
-        
-    async def initialize(self):
-        """Initialize the AI agent and tools"""
-        try:
-            # Validate configuration
-            Config.validate_config()
-            
-            # Initialize LLM (using Google Gemini)
-            self.llm = ChatGoogleGenerativeAI(
-                model=Config.AI_MODEL,
-                temperature=Config.AI_TEMPERATURE,
-                max_output_tokens=Config.AI_MAX_TOKENS,
-                google_api_key=Config.GEMINI_API_KEY
-            )
-            
-            # Define tools for the agent
-            self.tools = [
-                Tool(
-                    name="search_pubmed",
-                    description="Search PubMed for biomedical articles. Input should be a search query string.",
-                    func=self._search_pubmed_tool
-                ),
-                Tool(
-                    name="search_uniprot",
-                    description="Search UniProt for protein information. Input should be a protein name, gene name, or organism.",
-                    func=self._search_uniprot_tool
-                ),
-                Tool(
-                    name="search_swissadme",
-                    description="Search SwissADME for drug properties. Input should be a SMILES notation of a drug molecule.",
-                    func=self._search_swissadme_tool
-                ),
-                Tool(
-                    name="synthesize_results",
-                    description="Synthesize and analyze results from multiple biomedical sources. Input should be a JSON string of results.",
-                    func=self._synthesize_results_tool
-                )
-            ]
-            
-            # Initialize the agent
-            self.agent = initialize_agent(
-                tools=self.tools,
-                llm=self.llm,
-                agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                verbose=True,
-                handle_parsing_errors=True
-            )
-            
-            logger.info("AI Orchestrator initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Error initializing AI Orchestrator: {e}")
-            raise
-    
-    def _search_pubmed_tool(self, query: str) -> str:
-        """Tool function for PubMed search"""
-        try:
-            # Run async function in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            results = loop.run_until_complete(self.pubmed_adapter.search_articles(query, 5))
-            loop.close()
-            
-            if results:
-                return json.dumps({
-                    "source": "pubmed",
-                    "count": len(results),
-                    "results": results[:3]  # Limit to first 3 for tool response
-                })
-            else:
-                return json.dumps({"source": "pubmed", "count": 0, "message": "No articles found"})
-                
-        except Exception as e:
-            logger.error(f"PubMed tool error: {e}")
-            return json.dumps({"source": "pubmed", "error": str(e)})
-    
-    def _search_uniprot_tool(self, query: str) -> str:
-        """Tool function for UniProt search"""
-        try:
-            # Run async function in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            results = loop.run_until_complete(self.uniprot_adapter.search_proteins(query, 5))
-            loop.close()
-            
-            if results:
-                return json.dumps({
-                    "source": "uniprot",
-                    "count": len(results),
-                    "results": results[:3]  # Limit to first 3 for tool response
-                })
-            else:
-                return json.dumps({"source": "uniprot", "count": 0, "message": "No proteins found"})
-                
-        except Exception as e:
-            logger.error(f"UniProt tool error: {e}")
-            return json.dumps({"source": "uniprot", "error": str(e)})
-    
-    def _search_swissadme_tool(self, smiles: str) -> str:
-        """Tool function for SwissADME search"""
-        try:
-            # Run async function in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            results = loop.run_until_complete(self.swissadme_adapter.search_drug_properties(smiles))
-            loop.close()
-            
-            if results:
-                return json.dumps({
-                    "source": "swissadme",
-                    "count": len(results),
-                    "results": results
-                })
-            else:
-                return json.dumps({"source": "swissadme", "count": 0, "message": "No drug properties found"})
-                
-        except Exception as e:
-            logger.error(f"SwissADME tool error: {e}")
-            return json.dumps({"source": "swissadme", "error": str(e)})
-    
-    def _synthesize_results_tool(self, results_json: str) -> str:
-        """Tool function for synthesizing results"""
-        try:
-            results = json.loads(results_json)
-            
-            # Create a synthesis prompt
-            synthesis_prompt = f"""
-            Analyze and synthesize the following biomedical research results:
-            
-            {results_json}
-            
-            Provide:
-            1. Key findings summary
-            2. Connections between different data sources
-            3. Potential research implications
-            4. Recommendations for further investigation
-            
-            Keep the response concise and focused on actionable insights.
-            """
-            
-            # Use LLM to synthesize results
-            messages = [
-                SystemMessage(content="You are a biomedical research assistant. Analyze and synthesize research data from multiple sources."),
-                HumanMessage(content=synthesis_prompt)
-            ]
-            
-            response = self.llm(messages)
-            return response.content
-            
-        except Exception as e:
-            logger.error(f"Synthesis tool error: {e}")
-            return f"Error synthesizing results: {str(e)}"
-    
-    async def process_query(self, query: str, sources: List[str], max_results: int = 10) -> Dict:
-        """
-        Process a biomedical research query using AI orchestration
-        
-        Args:
-            query: The research query
-            sources: List of data sources to query
-            max_results: Maximum results per source
-            
-        Returns:
-            Dictionary containing orchestrated results
-        """
-        try:
-            logger.info(f"Processing query with AI orchestration: {query}")
-            
-            # Create a comprehensive prompt for the agent
-            agent_prompt = f"""
-            You are a biomedical research assistant. The user has asked: "{query}"
-            
-            Available data sources: {', '.join(sources)}
-            
-            Please:
-            1. Search relevant data sources based on the query
-            2. Analyze the results
-            3. Synthesize findings from multiple sources
-            4. Provide actionable insights and recommendations
-            
-            Focus on finding connections between different types of biomedical data.
-            """
-            
-            # Execute the agent
-            if self.agent:
-                result = self.agent.run(agent_prompt)
-            else:
-                # Fallback to direct tool usage
-                result = await self._fallback_processing(query, sources, max_results)
-            
-            return {
-                "query": query,
-                "sources_queried": sources,
-                "ai_analysis": result,
-                "timestamp": datetime.utcnow().isoformat(),
-                "orchestration_method": "AI Agent"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in AI orchestration: {e}")
-            # Fallback to direct processing
-            return await self._fallback_processing(query, sources, max_results)
-    
-    async def _fallback_processing(self, query: str, sources: List[str], max_results: int) -> Dict:
-        """Fallback processing when AI agent is not available"""
-        try:
-            results = {}
-            
-            # Query each source directly
-            if "pubmed" in sources:
-                try:
-                    pubmed_results = await self.pubmed_adapter.search_articles(query, max_results)
-                    results["pubmed"] = pubmed_results
-                except Exception as e:
-                    results["pubmed"] = {"error": str(e)}
-            
-            if "uniprot" in sources:
-                try:
-                    uniprot_results = await self.uniprot_adapter.search_proteins(query, max_results)
-                    results["uniprot"] = uniprot_results
-                except Exception as e:
-                    results["uniprot"] = {"error": str(e)}
-            
-            if "swissadme" in sources:
-                try:
-                    # For SwissADME, we need SMILES notation
-                    # This is a simplified approach - in practice, you'd convert the query to SMILES
-                    smiles_query = "CCO"  # Placeholder
-                    swissadme_results = await self.swissadme_adapter.search_drug_properties(query)
-                    results["swissadme"] = swissadme_results
-                except Exception as e:
-                    results["swissadme"] = {"error": str(e)}
-            
-            return {
-                "query": query,
-                "sources_queried": sources,
-                "results": results,
-                "timestamp": datetime.utcnow().isoformat(),
-                "orchestration_method": "Direct"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in fallback processing: {e}")
-            return {
-                "query": query,
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
-                "orchestration_method": "error"
-            }
-    
-    async def cleanup(self):
-        """Cleanup resources"""
-        try:
-            if self.swissadme_adapter:
-                self.swissadme_adapter.cleanup()
-            logger.info("AI Orchestrator cleaned up")
-        except Exception as e:
-            logger.error(f"Error cleaning up AI Orchestrator: {e}")
+"""
+AI Agent Orchestrator using LangChain for workflow coordination
+"""
+
+from langchain.agents import initialize_agent, AgentType
+from langchain.tools import Tool
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain.schema import HumanMessage, SystemMessage
+from typing import List, Dict, Optional, Any, Tuple
+from loguru import logger
+import functools
+import json
+from datetime import datetime
+import re
+
+from adapters.pubmed_adapter import PubMedAdapter
+from adapters.records import json_default
+from adapters.uniprot_adapter import UniProtAdapter
+from adapters.swissadme_adapter import SwissADMEAdapter
+from adapters.swissadme_cache import looks_like_smiles
+from services.source_fanout import gather_sources
+from cache.llm_cache import get_llm_cache
+from ai_agent.context_compactor import compact_results
+from config import Config
+
+def fold_call_result(results: Dict, key: str, call_result: Any) -> str:
+    """
+    Merge a planned "source:index" call's result into ``results`` (one entry per source)
+    
+    Returns:
+        The source name
+    """
+    source = key.split(":", 1)[0]
+    if isinstance(call_result, list):
+        merged = results.get(source)
+        results[source] = (merged if isinstance(merged, list) else []) + call_result
+    elif source not in results:
+        results[source] = call_result
+    return source
+
+
+class AIOrchestrator:
+    """AI Agent for orchestrating biomedical research workflows"""
+    
+    def __init__(self):
+        self.llm = None
+        self.agent = None
+        self.tools = []
+        self.pubmed_adapter = PubMedAdapter()
+        self.uniprot_adapter = UniProtAdapter()
+        self.swissadme_adapter = SwissADMEAdapter()
+        self._context_metrics = {"compactions": 0, "original_tokens": 0, "compacted_tokens": 0, "tokens_saved": 0}
+        
+    async def initialize(self):
+        """Initialize the AI agent and tools"""
+        try:
+            # Validate configuration
+            Config.validate_config()
+            
+            # Initialize LLM (using Google Gemini)
+            self.llm = ChatGoogleGenerativeAI(
+                model=Config.AI_MODEL,
+                temperature=Config.AI_TEMPERATURE,
+                max_output_tokens=Config.AI_MAX_TOKENS,
+                google_api_key=Config.GEMINI_API_KEY
+            )
+            
+            # Define tools for the agent (coroutine tools run on the server's event loop)
+            self.tools = [
+                Tool(
+                    name="search_pubmed",
+                    description="Search PubMed for biomedical articles. Input should be a search query string.",
+                    func=None,
+                    coroutine=self._search_pubmed_tool
+                ),
+                Tool(
+                    name="search_uniprot",
+                    description="Search UniProt for protein information. Input should be a protein name, gene name, or organism.",
+                    func=None,
+                    coroutine=self._search_uniprot_tool
+                ),
+                Tool(
+                    name="search_swissadme",
+                    description="Search SwissADME for drug properties. Input should be a SMILES notation of a drug molecule.",
+                    func=None,
+                    coroutine=self._search_swissadme_tool
+                ),
+                Tool(
+                    name="synthesize_results",
+                    description="Synthesize and analyze results from multiple biomedical sources. Input should be a JSON string of results.",
+                    func=None,
+                    coroutine=self._synthesize_results_tool
+                )
+            ]
+            
+            # Initialize the agent
+            self.agent = initialize_agent(
+                tools=self.tools,
+                llm=self.llm,
+                agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
+                verbose=True,
+                handle_parsing_errors=True
+            )
+            
+            logger.info("AI Orchestrator initialized successfully")
+            
+        except Exception as e:
+            logger.error(f"Error initializing AI Orchestrator: {e}")
+            raise
+    
+    async def _search_pubmed_tool(self, query: str) -> str:
+        """Tool function for PubMed search"""
+        try:
+            results = await self.pubmed_adapter.search_articles(query, 5)
+            
+            if results:
+                return json.dumps({
+                    "source": "pubmed",
+                    "count": len(results),
+                    "results": results[:3]  # Limit to first 3 for tool response
+                }, default=json_default)
+            else:
+                return json.dumps({"source": "pubmed", "count": 0, "message": "No articles found"})
+                
+        except Exception as e:
+            logger.error(f"PubMed tool error: {e}")
+            return json.dumps({"source": "pubmed", "error": str(e)})
+    
+    async def _search_uniprot_tool(self, query: str) -> str:
+        """Tool function for UniProt search"""
+        try:
+            results = await self.uniprot_adapter.search_proteins(query, 5)
+            
+            if results:
+                return json.dumps({
+                    "source": "uniprot",
+                    "count": len(results),
+                    "results": results[:3]  # Limit to first 3 for tool response
+                }, default=json_default)
+            else:
+                return json.dumps({"source": "uniprot", "count": 0, "message": "No proteins found"})
+                
+        except Exception as e:
+            logger.error(f"UniProt tool error: {e}")
+            return json.dumps({"source": "uniprot", "error": str(e)})
+    
+    async def _search_swissadme_tool(self, smiles: str) -> str:
+        """Tool function for SwissADME search"""
+        try:
+            results = await self.swissadme_adapter.search_drug_properties(smiles)
+            
+            if results:
+                return json.dumps({
+                    "source": "swissadme",
+                    "count": len(results),
+                    "results": results
+                })
+            else:
+                return json.dumps({"source": "swissadme", "count": 0, "message": "No drug properties found"})
+                
+        except Exception as e:
+            logger.error(f"SwissADME tool error: {e}")
+            return json.dumps({"source": "swissadme", "error": str(e)})
+    
+    async def _synthesize_results_tool(self, results_json: str) -> str:
+        """Tool function for synthesizing results"""
+        try:
+            # Strip images, drop duplicates and keep the most relevant records within the token budget
+            context, stats = compact_results(results_json)
+            self._record_compaction(stats)
+            
+            # Create a synthesis prompt
+            synthesis_prompt = f"""
+            Analyze and synthesize the following biomedical research results:
+            
+            {context}
+            
+            Provide:
+            1. Key findings summary
+            2. Connections between different data sources
+            3. Potential research implications
+            4. Recommendations for further investigation
+            
+            Keep the response concise and focused on actionable insights.
+            """
+            
+            # Use LLM to synthesize results
+            messages = [
+                SystemMessage(content="You are a biomedical research assistant. Analyze and synthesize research data from multiple sources."),
+                HumanMessage(content=synthesis_prompt)
+            ]
+            
+            return await self._invoke_llm(messages, similarity_text=context)
+            
+        except Exception as e:
+            logger.error(f"Synthesis tool error: {e}")
+            return f"Error synthesizing results: {str(e)}"
+    
+    def _record_compaction(self, stats: Dict):
+        """Log and accumulate the token savings of one context compaction"""
+        logger.info(
+            f"Synthesis context compacted {stats['original_tokens']} -> {stats['compacted_tokens']} tokens "
+            f"(saved {stats['tokens_saved']}; kept {stats['records_kept']}/{stats['records']} records, "
+            f"{stats['duplicates_removed']} duplicates)"
+        )
+        self._context_metrics["compactions"] += 1
+        for key in ("original_tokens", "compacted_tokens", "tokens_saved"):
+            self._context_metrics[key] += stats[key]
+    
+    def get_context_metrics(self) -> Dict:
+        """Cumulative token savings from context compaction"""
+        return dict(self._context_metrics)
+    
+    async def _invoke_llm(self, messages: List, similarity_text: Optional[str] = None) -> str:
+        """
+        Call the LLM through the response cache
+        
+        Identical prompts are reused; with near-duplicate matching enabled, so are prompts
+        whose ``similarity_text`` (the part that varies between calls) is nearly identical.
+        """
+        prompt = "\n".join(message.content for message in messages)
+        
+        async def call() -> str:
+            return (await self.llm.ainvoke(messages)).content
+        
+        return await get_llm_cache().get_or_call(
+            Config.AI_MODEL, Config.AI_TEMPERATURE, prompt, call, similarity_text=similarity_text
+        )
+    
+    async def synthesize_results(self, query: str, results: Dict) -> Optional[str]:
+        """
+        Synthesize already-retrieved source results into an analysis
+        
+        Args:
+            query: The research query
+            results: Results keyed by source
+            
+        Returns:
+            The analysis text, or None when no LLM is configured
+        """
+        if not self.llm:
+            return None
+        results_json = json.dumps({"query": query, "results": results}, default=json_default)
+        return await self._synthesize_results_tool(results_json)
+    
+    async def _plan_tool_calls(self, query: str, sources: List[str]) -> List[Dict]:
+        """
+        Ask the LLM for every tool call the query needs, in a single round-trip
+        
+        Returns:
+            List of {"source": ..., "input": ...} calls restricted to the requested sources
+        """
+        planning_prompt = f"""
+        Plan the data retrieval for this biomedical research question: "{query}"
+        
+        Available sources: {', '.join(sources)}
+        - pubmed: input is a PubMed search query
+        - uniprot: input is a protein name, gene name, or organism
+        - swissadme: input is the SMILES notation of a drug molecule (only if one can be derived)
+        
+        Return ONLY a JSON object of the form
+        {{"calls": [{{"source": "<source>", "input": "<tool input>"}}]}}
+        using at most {Config.AI_PLAN_MAX_CALLS} calls. Calls run in parallel, so include every
+        independent lookup needed; omit sources that are not relevant.
+        """
+        messages = [
+            SystemMessage(content="You are a biomedical research planner. You reply with JSON only."),
+            HumanMessage(content=planning_prompt)
+        ]
+        content = await self._invoke_llm(messages, similarity_text=query)
+        
+        # Tolerate markdown code fences around the JSON
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        if not match:
+            raise ValueError(f"Planner returned no JSON: {content[:200]}")
+        plan = json.loads(match.group(0))
+        
+        calls = []
+        seen = set()
+        for call in plan.get("calls", []):
+            source = str(call.get("source", "")).lower()
+            tool_input = str(call.get("input", "")).strip()
+            if source not in sources or not tool_input or (source, tool_input) in seen:
+                continue
+            seen.add((source, tool_input))
+            calls.append({"source": source, "input": tool_input})
+        return calls[:Config.AI_PLAN_MAX_CALLS]
+    
+    async def plan_source_calls(self, query: str, sources: List[str], max_results: int) -> Tuple[List[Dict], Dict, Dict]:
+        """
+        Plan the tool calls for a query and build them for concurrent execution
+        
+        Returns:
+            (plan, calls, timeouts): calls and timeouts are keyed "source:index" for
+            services.source_fanout; fold their results with ``fold_call_result``
+        """
+        searches = {
+            "pubmed": lambda text: self.pubmed_adapter.search_articles(text, max_results),
+            "uniprot": lambda text: self.uniprot_adapter.search_proteins(text, max_results),
+            "swissadme": lambda text: self.swissadme_adapter.search_drug_properties(text),
+        }
+        
+        plan = await self._plan_tool_calls(query, sources)
+        if not plan:
+            # Nothing planned - query every requested source with the original question
+            # (SwissADME only if the question is itself SMILES)
+            plan = [
+                {"source": source, "input": query} for source in sources
+                if source in searches and (source != "swissadme" or looks_like_smiles(query))
+            ]
+        logger.info(f"Planned {len(plan)} tool call(s): {plan}")
+        
+        calls = {}
+        timeouts = {}
+        for index, call in enumerate(plan):
+            search = searches.get(call["source"])
+            if search:
+                key = f"{call['source']}:{index}"
+                calls[key] = functools.partial(search, call["input"])
+                # Sub-query keys don't match Config.SOURCE_TIMEOUTS; give each its source's deadline
+                timeouts[key] = Config.SOURCE_TIMEOUTS.get(call["source"])
+        return plan, calls, timeouts
+    
+    async def _process_with_plan(self, query: str, sources: List[str], max_results: int) -> Dict:
+        """Plan once, run the planned tool calls concurrently, then synthesize once"""
+        plan, calls, timeouts = await self.plan_source_calls(query, sources, max_results)
+        call_results = await gather_sources(calls, timeouts)
+        
+        # Fold sub-query results back into one entry per source
+        results = {}
+        for key, call_result in call_results.items():
+            fold_call_result(results, key, call_result)
+        
+        analysis = await self.synthesize_results(query, results)
+        
+        return {
+            "query": query,
+            "sources_queried": sources,
+            "plan": plan,
+            "results": results,
+            "ai_analysis": analysis,
+            "timestamp": datetime.utcnow().isoformat(),
+            "orchestration_method": "AI Plan"
+        }
+    
+    async def process_query(self, query: str, sources: List[str], max_results: int = 10) -> Dict:
+        """
+        Process a biomedical research query using AI orchestration
+        
+        In "plan" mode (Config.AI_ORCHESTRATION_MODE) the LLM plans all tool calls up
+        front, they run concurrently, and one synthesis call folds the results together;
+        if planning fails the ReAct agent runs instead.
+        
+        Args:
+            query: The research query
+            sources: List of data sources to query
+            max_results: Maximum results per source
+            
+        Returns:
+            Dictionary containing orchestrated results
+        """
+        try:
+            logger.info(f"Processing query with AI orchestration: {query}")
+            
+            if Config.AI_ORCHESTRATION_MODE == "plan" and self.llm:
+                try:
+                    return await self._process_with_plan(query, sources, max_results)
+                except Exception as e:
+                    logger.warning(f"Planned orchestration failed, falling back to the ReAct agent: {e}")
+            
+            # Create a comprehensive prompt for the agent
+            agent_prompt = f"""
+            You are a biomedical research assistant. The user has asked: "{query}"
+            
+            Available data sources: {', '.join(sources)}
+            
+            Please:
+            1. Search relevant data sources based on the query
+            2. Analyze the results
+            3. Synthesize findings from multiple sources
+            4. Provide actionable insights and recommendations
+            
+            Focus on finding connections between different types of biomedical data.
+            """
+            
+            # Execute the agent without blocking the event loop. Agent runs are not cached:
+            # the answer depends on what the tools return, which the prompt doesn't capture.
+            if self.agent:
+                result = (await self.agent.ainvoke({"input": agent_prompt}))["output"]
+            else:
+                # Fallback to direct tool usage
+                result = await self._fallback_processing(query, sources, max_results)
+            
+            return {
+                "query": query,
+                "sources_queried": sources,
+                "ai_analysis": result,
+                "timestamp": datetime.utcnow().isoformat(),
+                "orchestration_method": "AI Agent"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in AI orchestration: {e}")
+            # Fallback to direct processing
+            return await self._fallback_processing(query, sources, max_results)
+    
+    async def _fallback_processing(self, query: str, sources: List[str], max_results: int) -> Dict:
+        """Fallback processing when AI agent is not available"""
+        try:
+            calls = {}
+            
+            # Query each source directly, all at once, each with its own deadline
+            if "pubmed" in sources:
+                calls["pubmed"] = lambda: self.pubmed_adapter.search_articles(query, max_results)
+            
+            if "uniprot" in sources:
+                calls["uniprot"] = lambda: self.uniprot_adapter.search_proteins(query, max_results)
+            
+            if "swissadme" in sources:
+                # For SwissADME, we need SMILES notation
+                # This is a simplified approach - in practice, you'd convert the query to SMILES
+                calls["swissadme"] = lambda: self.swissadme_adapter.search_drug_properties(query)
+            
+            results = await gather_sources(calls)
+            
+            return {
+                "query": query,
+                "sources_queried": sources,
+                "results": results,
+                "timestamp": datetime.utcnow().isoformat(),
+                "orchestration_method": "Direct"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in fallback processing: {e}")
+            return {
+                "query": query,
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat(),
+                "orchestration_method": "error"
+            }
+    
+    async def cleanup(self):
+        """Cleanup resources"""
+        try:
+            if self.swissadme_adapter:
+                self.swissadme_adapter.cleanup()
+            logger.info("AI Orchestrator cleaned up")
+        except Exception as e:
+            logger.error(f"Error cleaning up AI Orchestrator: {e}")
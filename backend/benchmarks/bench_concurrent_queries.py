@@ -0,0 +1,62 @@
+"""
+Benchmark: concurrent /api/query requests against a running backend
+
+Fires N identical queries at once and compares the wall-clock time with the
+sum of the individual request latencies. When requests overlap on the event
+loop the overlap factor approaches N; when they are serialized it stays near 1.
+
+Usage:
+    python benchmarks/bench_concurrent_queries.py --url http://localhost:8000 -n 10
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+import httpx
+
+
+async def _timed_query(client: httpx.AsyncClient, url: str, payload: dict) -> float:
+    start = time.perf_counter()
+    response = await client.post(f"{url}/api/query", json=payload)
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run(url: str, concurrency: int, query: str, sources: List[str], max_results: int):
+    payload = {"query": query, "sources": sources, "max_results": max_results}
+
+    async with httpx.AsyncClient(timeout=None) as client:
+        # Warm-up request so connection setup is not measured
+        await _timed_query(client, url, payload)
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(
+            *[_timed_query(client, url, payload) for _ in range(concurrency)]
+        )
+        wall = time.perf_counter() - start
+
+    total = sum(latencies)
+    print(f"requests:        {concurrency}")
+    print(f"wall clock:      {wall:.2f}s")
+    print(f"sum of latency:  {total:.2f}s")
+    print(f"mean latency:    {total / concurrency:.2f}s")
+    print(f"max latency:     {max(latencies):.2f}s")
+    print(f"overlap factor:  {total / wall:.2f}x (1.0 = fully serialized, {concurrency}.0 = fully concurrent)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("-n", "--concurrency", type=int, default=10)
+    parser.add_argument("--query", default="insulin receptor")
+    parser.add_argument("--sources", nargs="+", default=["pubmed", "uniprot"])
+    parser.add_argument("--max-results", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.url, args.concurrency, args.query, args.sources, args.max_results))
+
+
+if __name__ == "__main__":
+    main()
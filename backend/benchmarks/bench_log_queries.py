@@ -0,0 +1,194 @@
+"""
+Benchmark: query log and provenance lookups on a large SQLite database
+
+Populates a scratch database (1M query logs and 1M provenance rows by default)
+using the application's schema, then times the log listing (including OFFSET
+versus keyset paging deep into history) and provenance lookups with the
+migration indexes in place and again after dropping them.
+It also compares small committed writes under the tuned connection settings
+(WAL, synchronous=NORMAL) with SQLite's defaults (rollback journal, FULL).
+
+Usage:
+    python benchmarks/bench_log_queries.py --rows 1000000
+    python benchmarks/bench_log_queries.py --rows 100000 --db /tmp/bench.db --keep
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SOURCES = ["pubmed", "uniprot", "swissadme"]
+STATUSES = ["completed"] * 8 + ["failed", "cancelled"]
+
+INDEXES = [
+    "ix_query_logs_timestamp_id",
+    "ix_query_logs_status_timestamp_id",
+    "ix_data_provenance_query_log_id",
+    "ix_data_provenance_record_id",
+    "ix_workflow_executions_query_log_id",
+]
+
+QUERIES = {
+    "recent logs (ORDER BY timestamp DESC LIMIT 100)": (
+        "SELECT id, query, sources, timestamp, processing_time, status, error_message "
+        "FROM query_logs ORDER BY timestamp DESC, id DESC LIMIT 100",
+        lambda rows: (),
+    ),
+    "logs in a one-day window": (
+        "SELECT id, status FROM query_logs WHERE timestamp >= ? AND timestamp < ? "
+        "ORDER BY timestamp DESC, id DESC LIMIT 100",
+        lambda rows: (_timestamp(rows // 2), _timestamp(rows // 2 + 1440)),
+    ),
+    "failed logs (status filter)": (
+        "SELECT id, status FROM query_logs WHERE status = 'failed' "
+        "ORDER BY timestamp DESC, id DESC LIMIT 100",
+        lambda rows: (),
+    ),
+    "deep page via OFFSET (halfway back)": (
+        "SELECT id, timestamp FROM query_logs ORDER BY timestamp DESC, id DESC LIMIT 100 OFFSET ?",
+        lambda rows: (rows // 2,),
+    ),
+    "deep page via keyset (halfway back)": (
+        "SELECT id, timestamp FROM query_logs WHERE (timestamp, id) < (?, ?) "
+        "ORDER BY timestamp DESC, id DESC LIMIT 100",
+        lambda rows: (_timestamp(rows // 2), rows // 2),
+    ),
+    "provenance for one query": (
+        "SELECT source, record_id, data_hash FROM data_provenance WHERE query_log_id = ?",
+        lambda rows: (random.randint(1, rows),),
+    ),
+    "provenance for one record": (
+        "SELECT query_log_id, data_hash FROM data_provenance WHERE record_id = ?",
+        lambda rows: (str(random.randint(1, rows)),),
+    ),
+}
+
+_EPOCH = datetime(2024, 1, 1)
+
+
+def _timestamp(minutes: int) -> str:
+    return (_EPOCH + timedelta(minutes=minutes)).isoformat(sep=" ")
+
+
+def create_schema(path: str):
+    """Create the application schema (tables, indexes, migrations) in ``path``"""
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    from database.models import init_database  # noqa: E402 - reads DATABASE_URL at import
+
+    init_database()
+
+
+def populate(path: str, rows: int, chunk: int = 50000):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    start = time.perf_counter()
+    for offset in range(0, rows, chunk):
+        ids = range(offset + 1, min(offset + chunk, rows) + 1)
+        conn.executemany(
+            "INSERT INTO query_logs (id, query, sources, timestamp, processing_time, status) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (i, f"query {i} about protein kinase inhibitors", json.dumps(random.sample(SOURCES, 2)),
+                 _timestamp(i), random.randint(200, 20000), random.choice(STATUSES))
+                for i in ids
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO data_provenance (query_log_id, source, data_type, record_id, extraction_method, timestamp, data_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (random.randint(1, rows), "pubmed", "article", str(i), "api", _timestamp(i), f"{i:064x}")
+                for i in ids
+            ),
+        )
+        conn.commit()
+    conn.close()
+    return time.perf_counter() - start
+
+
+def time_queries(path: str, rows: int, repeats: int) -> dict:
+    conn = sqlite3.connect(path)
+    timings = {}
+    for name, (sql, params) in QUERIES.items():
+        conn.execute(sql, params(rows)).fetchall()  # Warm the page cache
+        start = time.perf_counter()
+        for _ in range(repeats):
+            conn.execute(sql, params(rows)).fetchall()
+        timings[name] = (time.perf_counter() - start) / repeats * 1000
+    conn.close()
+    return timings
+
+
+def time_writes(directory: str, writes: int, tuned: bool) -> float:
+    """Seconds for ``writes`` single-row committed inserts"""
+    path = os.path.join(directory, f"writes_{'tuned' if tuned else 'default'}.db")
+    conn = sqlite3.connect(path)
+    if tuned:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, payload TEXT)")
+    start = time.perf_counter()
+    for i in range(writes):
+        conn.execute("INSERT INTO t (payload) VALUES (?)", (f"row {i}",))
+        conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Query logs (and provenance rows) to insert")
+    parser.add_argument("--repeats", type=int, default=20, help="Timed runs per query")
+    parser.add_argument("--writes", type=int, default=2000, help="Committed single-row inserts for the write test")
+    parser.add_argument("--db", help="Database file (default: a temporary file)")
+    parser.add_argument("--keep", action="store_true", help="Keep the database file afterwards")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="bench_logs_")
+    path = args.db or os.path.join(directory, "bench.db")
+    if os.path.exists(path):
+        sys.exit(f"{path} already exists; pass a new path")
+
+    create_schema(path)
+    print(f"Populating {args.rows:,} query logs and provenance rows...")
+    print(f"  {populate(path, args.rows):.1f}s")
+
+    indexed = time_queries(path, args.rows, args.repeats)
+    conn = sqlite3.connect(path)
+    for index in INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {index}")
+    conn.commit()
+    conn.close()
+    unindexed = time_queries(path, args.rows, max(1, args.repeats // 10))
+
+    print(f"\n{'query':<52}{'indexed ms':>12}{'no index ms':>14}{'speedup':>10}")
+    for name in QUERIES:
+        print(f"{name:<52}{indexed[name]:>12.3f}{unindexed[name]:>14.3f}{unindexed[name] / indexed[name]:>9.0f}x")
+
+    default = time_writes(directory, args.writes, tuned=False)
+    tuned = time_writes(directory, args.writes, tuned=True)
+    print(f"\n{args.writes} committed single-row writes:")
+    print(f"  rollback journal, synchronous=FULL: {default:.3f}s ({args.writes / default:,.0f}/s)")
+    print(f"  WAL, synchronous=NORMAL:            {tuned:.3f}s ({args.writes / tuned:,.0f}/s)")
+
+    if not args.keep:
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+        if args.db:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
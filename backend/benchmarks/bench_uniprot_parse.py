@@ -0,0 +1,211 @@
+"""
+Benchmark: UniProtKB entry decoding and parsing
+
+Compares the previous parser (stdlib json, nested _safe_get lookups, one
+timestamp per record, dicts) with the current path (json_codec, single-pass
+extraction, one timestamp per batch, slotted Protein records) over the same
+payload, plus the memory each keeps alive for the parsed result set. Records
+are only converted with to_dict() where results are serialized, so that cost
+is reported separately.
+
+By default a synthetic payload of large, full-entry-shaped records is
+generated; pass --fixture to use a recorded UniProtKB search response
+(e.g. saved with ``curl 'https://rest.uniprot.org/uniprotkb/search?query=...&size=500&format=json'``).
+
+Usage:
+    python benchmarks/bench_uniprot_parse.py --entries 500 --repeats 5
+    python benchmarks/bench_uniprot_parse.py --fixture uniprot_page.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adapters import json_codec  # noqa: E402
+from adapters.uniprot_adapter import UniProtAdapter  # noqa: E402
+
+
+# --- Previous implementation, kept verbatim for comparison -----------------
+
+def _legacy_safe_get(obj: Any, path: list, default: Any = None) -> Any:
+    for key in path:
+        if isinstance(obj, dict):
+            obj = obj.get(key, default)
+        elif isinstance(obj, list) and isinstance(key, int) and key < len(obj):
+            obj = obj[key]
+        else:
+            return default
+    return obj
+
+
+def _legacy_parse(data: Dict) -> Dict:
+    gene_names = []
+    for gene in data.get("genes", []):
+        if isinstance(gene.get("geneName"), dict):
+            val = gene["geneName"].get("value")
+            if val:
+                gene_names.append(val)
+    ec_numbers = []
+    for ec in _legacy_safe_get(data, ["proteinDescription", "recommendedName", "ecNumbers"], []):
+        if isinstance(ec, dict) and ec.get("value"):
+            ec_numbers.append(ec["value"])
+    go_terms = []
+    for ref in data.get("uniProtKBCrossReferences", []):
+        if ref.get("database") == "GO":
+            go_terms.append({"id": ref.get("id", ""), "properties": ref.get("properties", [])})
+    return {
+        "accession": data.get("primaryAccession", ""),
+        "id": data.get("uniProtkbId", ""),
+        "protein_name": _legacy_safe_get(
+            data, ["proteinDescription", "recommendedName", "fullName", "value"], "Unknown protein"
+        ),
+        "organism": _legacy_safe_get(data, ["organism", "scientificName"], "Unknown organism"),
+        "organism_id": _legacy_safe_get(data, ["organism", "taxonId"], ""),
+        "gene_names": gene_names,
+        "sequence": _legacy_safe_get(data, ["sequence", "value"], ""),
+        "sequence_length": _legacy_safe_get(data, ["sequence", "length"], 0),
+        "molecular_weight": _legacy_safe_get(data, ["sequence", "molWeight"], 0),
+        "ec_numbers": ec_numbers,
+        "go_terms": go_terms,
+        "keywords": [kw.get("name", "") for kw in data.get("keywords", []) if isinstance(kw, dict)],
+        "feature_count": len(data.get("features", [])) if isinstance(data.get("features", []), list) else 0,
+        "reviewed": data.get("entryType") == "UniProtKB reviewed (Swiss-Prot)",
+        "url": f"https://www.uniprot.org/uniprotkb/{data.get('primaryAccession', '')}",
+        "source": "uniprot",
+        "retrieved_at": datetime.utcnow().isoformat()
+    }
+
+
+# --- Synthetic fixture -----------------------------------------------------
+
+def _synthetic_entry(i: int, rng: random.Random) -> Dict:
+    """A full-entry-shaped record with realistic volumes of features and cross-references"""
+    length = rng.randint(300, 1500)
+    databases = ["GO", "PDB", "RefSeq", "Ensembl", "InterPro", "Pfam", "KEGG", "Reactome"]
+    return {
+        "entryType": "UniProtKB reviewed (Swiss-Prot)",
+        "primaryAccession": f"P{i:05d}",
+        "uniProtkbId": f"PROT{i}_HUMAN",
+        "proteinDescription": {
+            "recommendedName": {
+                "fullName": {"value": f"Synthetic protein {i}"},
+                "ecNumbers": [{"value": f"2.7.11.{i % 30}"}],
+            }
+        },
+        "organism": {"scientificName": "Homo sapiens", "taxonId": 9606, "lineage": ["Eukaryota", "Metazoa"] * 5},
+        "genes": [{"geneName": {"value": f"GENE{i}"}, "synonyms": [{"value": f"SYN{i}"}]}],
+        "sequence": {
+            "value": "".join(rng.choice("ACDEFGHIKLMNPQRSTVWY") for _ in range(length)),
+            "length": length,
+            "molWeight": length * 110,
+        },
+        "keywords": [{"id": f"KW-{k:04d}", "name": f"Keyword {k}"} for k in range(15)],
+        "features": [
+            {"type": "Domain", "location": {"start": {"value": f}, "end": {"value": f + 20}}, "description": "x" * 40}
+            for f in range(rng.randint(50, 200))
+        ],
+        "comments": [{"commentType": "FUNCTION", "texts": [{"value": "y" * 400}]} for _ in range(8)],
+        "uniProtKBCrossReferences": [
+            {
+                "database": databases[r % len(databases)],
+                "id": f"XREF:{i}:{r}",
+                "properties": [{"key": "Evidence", "value": "IEA"}, {"key": "Term", "value": "z" * 30}],
+            }
+            for r in range(rng.randint(100, 400))
+        ],
+    }
+
+
+def _load_payload(fixture: str, entries: int) -> bytes:
+    if fixture:
+        with open(fixture, "rb") as f:
+            return f.read()
+    rng = random.Random(42)
+    return json.dumps({"results": [_synthetic_entry(i, rng) for i in range(entries)]}).encode()
+
+
+# --- Benchmark -------------------------------------------------------------
+
+def _best_of(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _retained_kb(fn) -> float:
+    """KB still allocated by ``fn``'s return value (the parsed records, not the input)"""
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size / 1024
+
+
+def run(fixture: str, entries: int, repeats: int):
+    payload = _load_payload(fixture, entries)
+    adapter = UniProtAdapter()
+
+    def legacy() -> List[Dict]:
+        return [_legacy_parse(entry) for entry in json.loads(payload).get("results", [])]
+
+    def current() -> List:
+        retrieved_at = datetime.utcnow().isoformat()
+        return [adapter._parse_protein_data(entry, retrieved_at=retrieved_at)
+                for entry in json_codec.loads(payload).get("results", [])]
+
+    # Sanity check: both parsers agree on everything but the timestamp
+    strip = lambda records: [{k: v for k, v in r.items() if k != "retrieved_at"} for r in records]
+    assert strip(legacy()) == strip([record.to_dict() for record in current()]), "parsers disagree"
+
+    entries_list = json.loads(payload).get("results", [])
+    retrieved_at = datetime.utcnow().isoformat()
+    decode_json = _best_of(lambda: json.loads(payload), repeats)
+    decode_fast = _best_of(lambda: json_codec.loads(payload), repeats)
+    parse_legacy = _best_of(lambda: [_legacy_parse(entry) for entry in entries_list], repeats)
+    parse_current = _best_of(
+        lambda: [adapter._parse_protein_data(entry, retrieved_at=retrieved_at) for entry in entries_list], repeats
+    )
+    records = current()
+    to_dict_time = _best_of(lambda: [record.to_dict() for record in records], repeats)
+    legacy_time = _best_of(legacy, repeats)
+    current_time = _best_of(current, repeats)
+    legacy_kb = _retained_kb(lambda: [_legacy_parse(entry) for entry in entries_list])
+    current_kb = _retained_kb(lambda: [adapter._parse_protein_data(entry, retrieved_at=retrieved_at) for entry in entries_list])
+
+    print(f"payload:         {len(payload) / 1024 / 1024:.1f} MB, {len(entries_list)} entries")
+    print(f"json backend:    {json_codec.BACKEND}")
+    print(f"{'':<16} {'legacy':>10} {'current':>10} {'speedup':>8}")
+    for label, old, new in (
+        ("decode ms", decode_json, decode_fast),
+        ("parse ms", parse_legacy, parse_current),
+        ("total ms", legacy_time, current_time),
+    ):
+        print(f"{label:<16} {old * 1000:>10.1f} {new * 1000:>10.1f} {old / new:>7.2f}x")
+    print(f"{'retained KB':<16} {legacy_kb:>10.0f} {current_kb:>10.0f} {legacy_kb / current_kb:>7.2f}x")
+    print(f"to_dict() at serialization: {to_dict_time * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", help="Recorded UniProtKB search response (JSON with a 'results' array)")
+    parser.add_argument("--entries", type=int, default=500, help="Synthetic entries when no fixture is given")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.fixture, args.entries, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: UniProtKB field projection vs full entries
+
+Downloads the same search page twice - once with the parser's projected
+``fields`` and once with full entries - and compares bytes transferred,
+decoded payload size, and JSON decode + parse time.
+
+Usage:
+    python benchmarks/bench_uniprot_projection.py --query "organism_id:9606 AND reviewed:true" --size 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adapters.uniprot_adapter import UniProtAdapter, UNIPROT_PARSER_FIELDS  # noqa: E402
+
+SEARCH_URL = "https://rest.uniprot.org/uniprotkb/search"
+
+
+def _fetch(client: httpx.Client, query: str, size: int, fields: str = None) -> httpx.Response:
+    params = {"query": query, "size": size, "format": "json"}
+    if fields:
+        params["fields"] = fields
+    response = client.get(SEARCH_URL, params=params)
+    response.raise_for_status()
+    return response
+
+
+def _parse_time(adapter: UniProtAdapter, response: httpx.Response, repeats: int) -> float:
+    """Best-of-N seconds to decode the JSON body and parse every entry"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for entry in response.json().get("results", []):
+            adapter._parse_protein_data(entry)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(query: str, size: int, repeats: int):
+    adapter = UniProtAdapter()
+    rows = []
+    with httpx.Client(timeout=120) as client:
+        for label, fields in (("full", None), ("projected", ",".join(UNIPROT_PARSER_FIELDS))):
+            start = time.perf_counter()
+            response = _fetch(client, query, size, fields)
+            elapsed = time.perf_counter() - start
+            entries = len(response.json().get("results", []))
+            rows.append((label, entries, response.num_bytes_downloaded, len(response.content),
+                         elapsed, _parse_time(adapter, response, repeats)))
+
+    print(f"{'mode':<10} {'entries':>8} {'wire KB':>10} {'body KB':>10} {'fetch s':>8} {'parse ms':>9}")
+    for label, entries, wire, body, elapsed, parse in rows:
+        print(f"{label:<10} {entries:>8} {wire / 1024:>10.1f} {body / 1024:>10.1f} {elapsed:>8.2f} {parse * 1000:>9.1f}")
+
+    full, projected = rows
+    if projected[3] and projected[5]:
+        print(f"\nbody size reduction:  {full[3] / projected[3]:.1f}x")
+        print(f"parse time reduction: {full[5] / projected[5]:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--query", default="insulin AND reviewed:true")
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.query, args.size, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+SQLite-backed key/value store with TTL and size-bounded LRU eviction
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from loguru import logger
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class SqliteKVStore:
+    """
+    Persistent JSON key/value table in a local SQLite file
+
+    Entries older than ``ttl`` seconds are treated as missing (but kept until evicted so
+    callers can still serve them stale), and the table is trimmed to ``max_entries`` by
+    least-recent access. Methods are blocking; call them via asyncio.to_thread from async code.
+    """
+
+    def __init__(self, path: str, table: str, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        self.path = path
+        self.table = table
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_accessed_at ON {table} (accessed_at)")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a fresh value, or None if missing or past its TTL"""
+        return self.get_many([key]).get(key)
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Get (value, stored_at) regardless of TTL, for stale-while-revalidate callers"""
+        return self.get_entries([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get fresh values for all keys that are present and within TTL"""
+        now = time.time()
+        return {
+            key: value
+            for key, (value, stored_at) in self.get_entries(keys).items()
+            if self.ttl is None or now - stored_at <= self.ttl
+        }
+
+    def get_entries(self, keys: Iterable[str]) -> Dict[str, Tuple[Any, float]]:
+        """Get (value, stored_at) for all present keys and mark them as recently used"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        entries = {}
+        now = time.time()
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value, stored_at FROM {self.table} WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, value, stored_at in rows:
+                    entries[key] = (json.loads(value), stored_at)
+            if entries:
+                self._conn.executemany(
+                    f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in entries],
+                )
+        return entries
+
+    def set(self, key: str, value: Any):
+        """Store a single value"""
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[str, Any]):
+        """Store several values in one transaction, then evict if over capacity"""
+        if not items:
+            return
+        now = time.time()
+        rows = [(key, json.dumps(value), now, now) for key, value in items.items()]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: str):
+        """Remove a key"""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def _evict(self):
+        if self.max_entries is None:
+            return
+        (count,) = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,),
+            )
+            logger.debug(f"Evicted {excess} entries from {self.table}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        return count
+
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
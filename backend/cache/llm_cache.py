@@ -0,0 +1,187 @@
+"""
+LLM response cache keyed by model, temperature and normalized prompt, with near-duplicate matching
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, FrozenSet, Optional, Tuple
+from loguru import logger
+import asyncio
+import hashlib
+import re
+import time
+
+from cache.kv_store import SqliteKVStore
+from config import Config
+
+# Set for the duration of a request that must not be served from (or written to) the cache
+_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@contextmanager
+def bypass_llm_cache(enabled: bool = True):
+    """Skip the LLM cache for calls made inside this block (including tasks it spawns)"""
+    token = _bypass.set(enabled)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Collapse whitespace so formatting-only differences share a key
+
+    Case is kept: it distinguishes molecules in SMILES (c1ccccc1O is phenol,
+    C1CCCCC1O cyclohexanol) and gene symbols from ordinary words.
+    """
+    return " ".join(prompt.split())
+
+
+def make_llm_cache_key(model: str, temperature: float, prompt: str) -> str:
+    payload = f"{model}\x00{temperature}\x00{normalize_prompt(prompt)}"
+    return f"llm:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+def shingles(prompt: str, n: int = 3) -> FrozenSet[int]:
+    """Hashed word n-grams of a normalized prompt"""
+    words = _WORD_RE.findall(prompt)
+    if len(words) < n:
+        return frozenset([hash(" ".join(words))])
+    return frozenset(hash(" ".join(words[i:i + n])) for i in range(len(words) - n + 1))
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class LLMCache:
+    """
+    Caches LLM responses in the shared SQLite store
+
+    Exact matches are looked up by key. Near-duplicate matching is opt-in: when
+    ``similarity`` is above zero and the caller passes ``similarity_text`` (the variable
+    part of the prompt, e.g. the user question or the evidence), a prompt built from the
+    same template whose variable part has a word-trigram Jaccard similarity at or above
+    the threshold is served that prompt's response. Comparing whole prompts would let
+    the shared template boilerplate swamp a one-word difference such as BRCA1 vs BRCA2.
+    """
+
+    def __init__(self, store: SqliteKVStore, ttl: float, similarity: float, index_size: int):
+        self.store = store
+        self.ttl = ttl
+        self.similarity = similarity
+        self.index_size = index_size
+        # key -> (model/temperature scope, shingles, stored_at) for near-duplicate lookups
+        self._index: "OrderedDict[str, Tuple[str, FrozenSet[int], float]]" = OrderedDict()
+        self._metrics = {"hits": 0, "near_hits": 0, "misses": 0, "bypassed": 0}
+
+    async def get_or_call(self, model: str, temperature: float, prompt: str, call: Callable[[], Awaitable[str]],
+                          similarity_text: Optional[str] = None) -> str:
+        """
+        Return the cached response for ``prompt`` or call the LLM and cache its answer
+
+        Args:
+            model: Model name (part of the key)
+            temperature: Sampling temperature (part of the key)
+            prompt: The full prompt
+            call: Makes the LLM call on a miss
+            similarity_text: Variable part of ``prompt`` used for near-duplicate matching;
+                without it only exact matches are served
+        """
+        if _bypass.get() or not Config.LLM_CACHE_ENABLED:
+            self._metrics["bypassed"] += 1
+            return await call()
+
+        key = make_llm_cache_key(model, temperature, prompt)
+        try:
+            cached = await asyncio.to_thread(self.store.get, key)
+        except Exception as e:
+            logger.error(f"Error reading LLM cache: {e}")
+            cached = None
+        if cached is not None:
+            self._metrics["hits"] += 1
+            return cached["response"]
+
+        near_duplicates = self.similarity > 0 and bool(similarity_text)
+        # Near-duplicates must share the model, temperature and the rest of the prompt
+        template = normalize_prompt(prompt.replace(similarity_text, "")) if near_duplicates else ""
+        scope = f"{model}\x00{temperature}\x00{hashlib.sha256(template.encode()).hexdigest()}"
+        prompt_shingles = shingles(similarity_text) if near_duplicates else frozenset()
+        near_key = self._find_near_duplicate(scope, prompt_shingles)
+        if near_key:
+            near = await asyncio.to_thread(self.store.get, near_key)
+            if near is not None:
+                self._metrics["near_hits"] += 1
+                return near["response"]
+
+        self._metrics["misses"] += 1
+        response = await call()
+        if response:
+            try:
+                await asyncio.to_thread(self.store.set, key, {"response": response})
+            except Exception as e:
+                logger.error(f"Error writing LLM cache: {e}")
+            if near_duplicates:
+                self._remember(key, scope, prompt_shingles)
+        return response
+
+    def _find_near_duplicate(self, scope: str, prompt_shingles: FrozenSet[int]) -> Optional[str]:
+        if self.similarity <= 0 or not prompt_shingles:
+            return None
+        cutoff = time.time() - self.ttl
+        best_key, best_score = None, self.similarity
+        for key, (entry_scope, entry_shingles, stored_at) in self._index.items():
+            if entry_scope != scope or stored_at < cutoff:
+                continue
+            # Jaccard can't reach the threshold if the sizes differ too much
+            small, large = sorted((len(prompt_shingles), len(entry_shingles)))
+            if small < best_score * large:
+                continue
+            score = jaccard(prompt_shingles, entry_shingles)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def _remember(self, key: str, scope: str, prompt_shingles: FrozenSet[int]):
+        self._index[key] = (scope, prompt_shingles, time.time())
+        self._index.move_to_end(key)
+        while len(self._index) > self.index_size:
+            self._index.popitem(last=False)
+
+    def get_metrics(self) -> Dict:
+        """Hit/miss counters and sizes"""
+        served = self._metrics["hits"] + self._metrics["near_hits"]
+        lookups = served + self._metrics["misses"]
+        return dict(
+            self._metrics,
+            hit_rate=served / lookups if lookups else 0.0,
+            index_entries=len(self._index),
+            store_entries=len(self.store),
+        )
+
+
+_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide LLM response cache"""
+    global _cache
+    if _cache is None:
+        _cache = LLMCache(
+            store=SqliteKVStore(
+                Config.CACHE_DB_PATH,
+                table="llm_cache",
+                ttl=Config.LLM_CACHE_TTL,
+                max_entries=Config.LLM_CACHE_MAX_ENTRIES,
+            ),
+            ttl=Config.LLM_CACHE_TTL,
+            similarity=Config.LLM_CACHE_SIMILARITY,
+            index_size=Config.LLM_CACHE_INDEX_SIZE,
+        )
+    return _cache
@@ -0,0 +1,119 @@
+"""
+Per-record cache (PMID, UniProt accession) for de-duplicated fetching across queries
+"""
+
+from typing import Any, Dict, Iterable, Optional, Type
+from loguru import logger
+import asyncio
+import time
+
+from adapters.records import Article, Protein
+from cache.kv_store import SqliteKVStore
+from cache.response_cache import MemoryLRU
+from config import Config
+
+
+class RecordCache:
+    """
+    Parsed records keyed by their upstream identifier
+
+    Lookups check the in-process LRU first and fall back to the namespace's SQLite table,
+    so overlapping result sets from different queries only fetch the records not seen yet.
+    The LRU holds ``record_type`` instances; they are converted to dicts only when
+    written to (and rebuilt when read from) SQLite.
+    """
+
+    def __init__(self, namespace: str, store: SqliteKVStore, memory: MemoryLRU, ttl: float, record_type: Type):
+        self.namespace = namespace
+        self.record_type = record_type
+        self.store = store
+        self.memory = memory
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(self, record_ids: Iterable[str]) -> Dict[str, Any]:
+        """Return fresh cached records for the given ids"""
+        record_ids = [str(record_id) for record_id in dict.fromkeys(record_ids)]
+        now = time.time()
+        found = {}
+        remaining = []
+        for record_id in record_ids:
+            entry = self.memory.get(record_id)
+            if entry is not None and now - entry[1] <= self.ttl:
+                found[record_id] = entry[0]
+            else:
+                remaining.append(record_id)
+
+        if remaining:
+            try:
+                entries = await asyncio.to_thread(self.store.get_entries, remaining)
+            except Exception as e:
+                logger.error(f"Error reading {self.namespace} record cache: {e}")
+                entries = {}
+            for record_id, (data, stored_at) in entries.items():
+                if now - stored_at <= self.ttl:
+                    record = self.record_type.from_dict(data)
+                    found[record_id] = record
+                    self.memory.set(record_id, record, stored_at)
+
+        self.hits += len(found)
+        self.misses += len(record_ids) - len(found)
+        return found
+
+    async def get(self, record_id: str) -> Optional[Any]:
+        """Return a single cached record, if present"""
+        return (await self.get_many([record_id])).get(str(record_id))
+
+    async def put_many(self, records: Dict[str, Any]):
+        """Cache records keyed by id"""
+        if not records:
+            return
+        stored_at = time.time()
+        for record_id, record in records.items():
+            self.memory.set(str(record_id), record, stored_at)
+        try:
+            await asyncio.to_thread(self.store.set_many, {str(k): v.to_dict() for k, v in records.items()})
+        except Exception as e:
+            logger.error(f"Error writing {self.namespace} record cache: {e}")
+
+    def get_metrics(self) -> Dict:
+        """Hit/miss counters and tier sizes"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "store_entries": len(self.store),
+        }
+
+
+_caches: Dict[str, RecordCache] = {}
+
+# Record model stored by each namespace
+RECORD_TYPES: Dict[str, Type] = {"pubmed": Article, "uniprot": Protein}
+
+
+def get_record_cache(namespace: str) -> RecordCache:
+    """Get the process-wide record cache for a source (e.g. "pubmed", "uniprot")"""
+    if namespace not in _caches:
+        ttl = Config.RECORD_CACHE_TTLS.get(namespace, Config.RECORD_CACHE_DEFAULT_TTL)
+        _caches[namespace] = RecordCache(
+            namespace,
+            store=SqliteKVStore(
+                Config.CACHE_DB_PATH,
+                table=f"{namespace}_records",
+                ttl=ttl,
+                max_entries=Config.RECORD_CACHE_MAX_ENTRIES,
+            ),
+            memory=MemoryLRU(Config.RECORD_CACHE_MEMORY_ENTRIES),
+            ttl=ttl,
+            record_type=RECORD_TYPES[namespace],
+        )
+    return _caches[namespace]
+
+
+def get_record_cache_metrics() -> Dict:
+    """Metrics for every record cache created so far"""
+    return {namespace: cache.get_metrics() for namespace, cache in _caches.items()}
@@ -0,0 +1,242 @@
+"""
+Two-tier response cache (in-process LRU + shared SQLite) with stale-while-revalidate
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+from loguru import logger
+import asyncio
+import hashlib
+import json
+import threading
+import time
+
+from adapters.records import Article, Protein
+from cache.kv_store import SqliteKVStore
+from config import Config
+
+
+def normalize_params(params: Dict) -> Dict:
+    """
+    Normalize query parameters so trivially different spellings share a key
+
+    Whitespace is collapsed but case is kept: PubMed and UniProt treat only
+    upper-case AND/OR/NOT as operators, so case changes what a query returns.
+    """
+    normalized = {}
+    for key, value in params.items():
+        if isinstance(value, str):
+            value = " ".join(value.split())
+        elif isinstance(value, (list, tuple)):
+            value = sorted(value)
+        normalized[key] = value
+    return normalized
+
+
+def make_cache_key(namespace: str, params: Dict) -> str:
+    """Stable key for a namespace plus its normalized parameters"""
+    payload = json.dumps(normalize_params(params), sort_keys=True, separators=(",", ":"))
+    return f"{namespace}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+def _has_error_records(value: Any) -> bool:
+    """Whether a list response contains records (or dicts) that carry an ``error``"""
+    if not isinstance(value, list):
+        return False
+    return any(
+        (item.get("error") if isinstance(item, dict) else getattr(item, "error", None)) is not None
+        for item in value
+    )
+
+
+class MemoryLRU:
+    """Small thread-safe in-process LRU holding (value, stored_at) pairs"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, stored_at: float):
+        with self._lock:
+            self._entries[key] = (value, stored_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Caches upstream responses per namespace (source) with a TTL and a stale window
+
+    Within ``ttl`` an entry is served as-is. Within ``ttl + stale_ttl`` it is served
+    immediately and refreshed in the background. Older entries are fetched again.
+    Concurrent misses for the same key share one upstream call, which runs in its own
+    task: a waiter that is cancelled leaves it running for the others, and it is only
+    cancelled once every waiter has gone. Responses holding records with an ``error``
+    (placeholders for records that failed to load) are returned but never cached.
+
+    Namespaces listed in ``record_types`` cache lists of records: the LRU keeps the
+    record instances and SQLite stores their ``to_dict()`` form.
+    """
+
+    def __init__(self, store: SqliteKVStore, memory: MemoryLRU, ttls: Dict[str, float], stale_ttls: Dict[str, float],
+                 record_types: Optional[Dict[str, Type]] = None):
+        self.store = store
+        self.memory = memory
+        self.ttls = ttls
+        self.stale_ttls = stale_ttls
+        self.record_types = record_types or {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, namespace: str, counter: str):
+        counters = self._counters.setdefault(
+            namespace, {"hits": 0, "memory_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0, "uncached": 0}
+        )
+        counters[counter] += 1
+
+    async def get_or_fetch(self, namespace: str, params: Dict, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached response for ``params`` or call ``fetch`` and cache its result"""
+        key = make_cache_key(namespace, params)
+        ttl = self.ttls.get(namespace, 0)
+        stale_ttl = self.stale_ttls.get(namespace, 0)
+
+        entry = self.memory.get(key)
+        from_memory = entry is not None
+        if entry is None:
+            entry = await asyncio.to_thread(self.store.get_entry, key)
+            if entry is not None:
+                entry = (self._decode(namespace, entry[0]), entry[1])
+                self.memory.set(key, *entry)
+
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age <= ttl:
+                self._count(namespace, "memory_hits" if from_memory else "hits")
+                return value
+            if age <= ttl + stale_ttl:
+                self._count(namespace, "stale_hits")
+                self._schedule_refresh(namespace, key, fetch)
+                return value
+
+        self._count(namespace, "misses")
+        return await self._fetch_shared(namespace, key, fetch)
+
+    async def _fetch_shared(self, namespace: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(namespace, key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._fetch_done(key, done))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    # Nobody is waiting for this result any more; new callers start afresh
+                    task.cancel()
+                    if self._inflight.get(key) is task:
+                        del self._inflight[key]
+
+    async def _fetch_and_store(self, namespace: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await fetch()
+        except BaseException:
+            self._count(namespace, "errors")
+            raise
+        if _has_error_records(value):
+            # Placeholders for records that failed to load (e.g. a 429 from esummary)
+            # must not be served as a complete answer for the next TTL
+            self._count(namespace, "uncached")
+        else:
+            await self._store(namespace, key, value)
+        return value
+
+    def _fetch_done(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody awaited doesn't log "exception never retrieved"
+            task.exception()
+
+    def _decode(self, namespace: str, value: Any) -> Any:
+        record_type = self.record_types.get(namespace)
+        return [record_type.from_dict(item) for item in value] if record_type else value
+
+    def _encode(self, namespace: str, value: Any) -> Any:
+        return [record.to_dict() for record in value] if namespace in self.record_types else value
+
+    async def _store(self, namespace: str, key: str, value: Any):
+        stored_at = time.time()
+        self.memory.set(key, value, stored_at)
+        try:
+            await asyncio.to_thread(self.store.set, key, self._encode(namespace, value))
+        except Exception as e:
+            logger.error(f"Error writing response cache entry: {e}")
+
+    def _schedule_refresh(self, namespace: str, key: str, fetch: Callable[[], Awaitable[Any]]):
+        if key in self._refreshing or key in self._inflight:
+            return
+
+        async def _refresh():
+            try:
+                await self._fetch_shared(namespace, key, fetch)
+                self._count(namespace, "refreshes")
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {namespace}: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(_refresh())
+
+    def get_metrics(self) -> Dict:
+        """Per-namespace hit/miss counters plus tier sizes"""
+        namespaces = {}
+        for namespace, counters in self._counters.items():
+            served = counters["hits"] + counters["memory_hits"] + counters["stale_hits"]
+            lookups = served + counters["misses"]
+            namespaces[namespace] = dict(counters, hit_rate=served / lookups if lookups else 0.0)
+        return {
+            "namespaces": namespaces,
+            "memory_entries": len(self.memory),
+            "store_entries": len(self.store),
+        }
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache"""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(
+            store=SqliteKVStore(
+                Config.CACHE_DB_PATH,
+                table="response_cache",
+                max_entries=Config.RESPONSE_CACHE_MAX_ENTRIES,
+            ),
+            memory=MemoryLRU(Config.RESPONSE_CACHE_MEMORY_ENTRIES),
+            ttls=Config.RESPONSE_CACHE_TTLS,
+            stale_ttls=Config.RESPONSE_CACHE_STALE_TTLS,
+            record_types={"pubmed": Article, "uniprot": Protein},
+        )
+    return _cache
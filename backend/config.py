@@ -1,38 +1,130 @@
-"""
-Configuration settings for the biomedical platform
-"""
-
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-class Config:
-    """Application configuration"""
-    
-    # Google Gemini API Configuration
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-    
-    # Database Configuration
-    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./biomedical_platform.db")
-    
-    # Application Configuration
-    DEBUG = os.getenv("DEBUG", "True").lower() == "true"
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    
-    # Server Configuration
-    HOST = os.getenv("HOST", "0.0.0.0")
-    PORT = int(os.getenv("PORT", "8000"))
-    
-    # AI Model Configuration
-    AI_MODEL = "gemini"
-    AI_TEMPERATURE = 0.1
-    AI_MAX_TOKENS = 1000
-    
-    @classmethod
-    def validate_config(cls):
-        """Validate required configuration"""
-        if not cls.GEMINI_API_KEY:
-            raise ValueError("GEMINI_API_KEY environment variable is required")
-        return True
+"""
+Configuration settings for the biomedical platform
+"""
+
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+class Config:
+    """Application configuration"""
+    
+    # Google Gemini API Configuration
+    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    
+    # Database Configuration
+    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./biomedical_platform.db")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))  # How long SQLite waits on a locked database
+    
+    # Application Configuration
+    DEBUG = os.getenv("DEBUG", "True").lower() == "true"
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    
+    # Server Configuration
+    HOST = os.getenv("HOST", "0.0.0.0")
+    PORT = int(os.getenv("PORT", "8000"))
+    
+    # AI Model Configuration
+    AI_MODEL = "gemini"
+    AI_TEMPERATURE = 0.1
+    AI_MAX_TOKENS = 1000
+    AI_ORCHESTRATION_MODE = os.getenv("AI_ORCHESTRATION_MODE", "plan").lower()  # plan (one planning call, concurrent tools) or react
+    AI_PLAN_MAX_CALLS = int(os.getenv("AI_PLAN_MAX_CALLS", "6"))  # Upper bound on tool calls a plan may request
+    AI_CONTEXT_TOKEN_BUDGET = int(os.getenv("AI_CONTEXT_TOKEN_BUDGET", "6000"))  # Tokens of source evidence sent for synthesis
+
+    # HTTP Client Configuration (shared by the API adapters)
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "True").lower() == "true"
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "4"))
+    HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.5"))  # Seconds, doubled per attempt
+    HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "30"))
+
+    # NCBI E-utilities Configuration (an API key raises the limit from 3 to 10 requests/second)
+    NCBI_API_KEY = os.getenv("NCBI_API_KEY")
+    NCBI_TOOL = os.getenv("NCBI_TOOL", "biomedical-research-platform")
+    NCBI_EMAIL = os.getenv("NCBI_EMAIL")
+    PUBMED_ESUMMARY_BATCH_SIZE = int(os.getenv("PUBMED_ESUMMARY_BATCH_SIZE", "200"))  # Records per esummary call
+    NCBI_RATE_LIMIT = float(os.getenv("NCBI_RATE_LIMIT", "10" if NCBI_API_KEY else "3"))
+    UNIPROT_FIELD_PROJECTION = os.getenv("UNIPROT_FIELD_PROJECTION", "True").lower() == "true"  # Download only parsed fields
+    UNIPROT_PAGE_SIZE = int(os.getenv("UNIPROT_PAGE_SIZE", "500"))  # Entries per cursor page (max 500)
+    UNIPROT_RATE_LIMIT = float(os.getenv("UNIPROT_RATE_LIMIT", "10"))
+
+    # Requests per second allowed per upstream host (process-wide)
+    RATE_LIMITS = {
+        "eutils.ncbi.nlm.nih.gov": NCBI_RATE_LIMIT,
+        "rest.uniprot.org": UNIPROT_RATE_LIMIT,
+    }
+
+    # Per-source deadlines (seconds) when querying sources concurrently
+    SOURCE_TIMEOUTS = {
+        "pubmed": float(os.getenv("PUBMED_SOURCE_TIMEOUT", "30")),
+        "uniprot": float(os.getenv("UNIPROT_SOURCE_TIMEOUT", "30")),
+        "swissadme": float(os.getenv("SWISSADME_SOURCE_TIMEOUT", "120")),
+    }
+
+    # SwissADME scraping Configuration
+    SWISSADME_WORKERS = int(os.getenv("SWISSADME_WORKERS", "2"))  # Executor threads running Selenium scrapes
+    SWISSADME_HEADLESS = os.getenv("SWISSADME_HEADLESS", "True").lower() == "true"
+    SWISSADME_POOL_SIZE = int(os.getenv("SWISSADME_POOL_SIZE", str(SWISSADME_WORKERS)))
+    SWISSADME_POOL_WARM = int(os.getenv("SWISSADME_POOL_WARM", "1"))  # Sessions started at startup
+    SWISSADME_POOL_MAX_USES = int(os.getenv("SWISSADME_POOL_MAX_USES", "50"))  # Recycle after N scrapes
+    SWISSADME_POOL_MAX_WAITERS = int(os.getenv("SWISSADME_POOL_MAX_WAITERS", "20"))
+    SWISSADME_POOL_ACQUIRE_TIMEOUT = float(os.getenv("SWISSADME_POOL_ACQUIRE_TIMEOUT", "60"))
+    SWISSADME_BATCH_WINDOW_MS = int(os.getenv("SWISSADME_BATCH_WINDOW_MS", "250"))  # Coalescing window
+    SWISSADME_BATCH_MAX_SIZE = int(os.getenv("SWISSADME_BATCH_MAX_SIZE", "20"))  # Molecules per submission
+
+    # Local cache Configuration
+    CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", "./data/biomedical_cache.db")
+    SWISSADME_CACHE_TTL = int(os.getenv("SWISSADME_CACHE_TTL", str(30 * 24 * 3600)))  # Seconds
+    SWISSADME_CACHE_MAX_ENTRIES = int(os.getenv("SWISSADME_CACHE_MAX_ENTRIES", "10000"))
+    BLOB_STORE_PATH = os.getenv("BLOB_STORE_PATH", "./data/blobs")  # Compressed query result payloads
+    BLOB_COMPRESSION_LEVEL = int(os.getenv("BLOB_COMPRESSION_LEVEL", "3"))  # zstd level (1-22)
+    RESPONSE_CACHE_MEMORY_ENTRIES = int(os.getenv("RESPONSE_CACHE_MEMORY_ENTRIES", "512"))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "20000"))
+    RESPONSE_CACHE_TTLS = {  # Seconds a cached search is served as fresh
+        "pubmed": int(os.getenv("PUBMED_CACHE_TTL", "3600")),
+        "uniprot": int(os.getenv("UNIPROT_CACHE_TTL", "86400")),
+    }
+    RESPONSE_CACHE_STALE_TTLS = {  # Extra seconds served stale while refreshing in the background
+        "pubmed": int(os.getenv("PUBMED_CACHE_STALE_TTL", "86400")),
+        "uniprot": int(os.getenv("UNIPROT_CACHE_STALE_TTL", "604800")),
+    }
+    RECORD_CACHE_MEMORY_ENTRIES = int(os.getenv("RECORD_CACHE_MEMORY_ENTRIES", "5000"))
+    RECORD_CACHE_MAX_ENTRIES = int(os.getenv("RECORD_CACHE_MAX_ENTRIES", "100000"))
+    RECORD_CACHE_DEFAULT_TTL = int(os.getenv("RECORD_CACHE_DEFAULT_TTL", str(7 * 24 * 3600)))
+    RECORD_CACHE_TTLS = {  # Seconds an individual PMID / accession record is reused
+        "pubmed": int(os.getenv("PUBMED_RECORD_CACHE_TTL", str(7 * 24 * 3600))),
+        "uniprot": int(os.getenv("UNIPROT_RECORD_CACHE_TTL", str(7 * 24 * 3600))),
+    }
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+    LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "86400"))  # Seconds a cached LLM answer is reused
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+    LLM_CACHE_SIMILARITY = float(os.getenv("LLM_CACHE_SIMILARITY", "0"))  # Opt-in near-duplicate Jaccard threshold on the question / evidence (0 disables)
+    LLM_CACHE_INDEX_SIZE = int(os.getenv("LLM_CACHE_INDEX_SIZE", "500"))  # Recent prompts checked for near-duplicates
+
+    # How often (seconds) long-running requests check whether the client went away
+    DISCONNECT_POLL_INTERVAL = float(os.getenv("DISCONNECT_POLL_INTERVAL", "1"))
+
+    # Asynchronous job API
+    JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))  # Queries run concurrently by the job workers
+    JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "100"))  # Pending jobs accepted before returning 503
+
+    # Query / provenance logging
+    PROVENANCE_FLUSH_INTERVAL = float(os.getenv("PROVENANCE_FLUSH_INTERVAL", "1"))  # Seconds between batched log writes
+    PROVENANCE_FLUSH_SIZE = int(os.getenv("PROVENANCE_FLUSH_SIZE", "100"))  # Buffered writes that trigger an early flush
+    PROVENANCE_MAX_ATTEMPTS = int(os.getenv("PROVENANCE_MAX_ATTEMPTS", "3"))  # Flushes a failing query's logs are tried before being dropped
+
+    @classmethod
+    def validate_config(cls):
+        """Validate required configuration"""
+        if not cls.GEMINI_API_KEY:
+            raise ValueError("GEMINI_API_KEY environment variable is required")
+        return True
@@ -0,0 +1,100 @@
+"""
+Content-addressed, zstd-compressed storage for large result payloads
+"""
+
+from typing import Any, Dict, Optional, Tuple
+from loguru import logger
+import hashlib
+import json
+import os
+import tempfile
+
+import zstandard
+
+from adapters.records import json_default
+from config import Config
+
+
+class BlobStore:
+    """
+    Stores JSON documents as compressed files named by the SHA-256 of their canonical encoding
+
+    Documents are encoded with sorted keys so equal results always hash the same way and
+    are written once (``root/ab/cd/<sha256>.zst``). Writes go through a temporary file and
+    an atomic rename, so concurrent writers of the same blob are harmless. Methods are
+    blocking; call them via asyncio.to_thread from async code.
+    """
+
+    def __init__(self, root: str, level: int = 3):
+        self.root = root
+        self.level = level
+        os.makedirs(root, exist_ok=True)
+        self._metrics = {"writes": 0, "deduplicated": 0, "reads": 0, "bytes_raw": 0, "bytes_stored": 0}
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], f"{digest}.zst")
+
+    @staticmethod
+    def encode(document: Any) -> bytes:
+        """Canonical JSON encoding used for hashing"""
+        return json.dumps(document, sort_keys=True, separators=(",", ":"), default=json_default).encode()
+
+    def put(self, document: Any) -> Tuple[str, int]:
+        """
+        Store a document
+
+        Returns:
+            (sha256 hex digest, uncompressed size in bytes)
+        """
+        raw = self.encode(document)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._path(digest)
+        if os.path.exists(path):
+            self._metrics["deduplicated"] += 1
+            return digest, len(raw)
+
+        compressed = zstandard.ZstdCompressor(level=self.level).compress(raw)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+        self._metrics["writes"] += 1
+        self._metrics["bytes_raw"] += len(raw)
+        self._metrics["bytes_stored"] += len(compressed)
+        return digest, len(raw)
+
+    def get(self, digest: str) -> Optional[Any]:
+        """Load a document by digest, or None if it is not stored"""
+        try:
+            with open(self._path(digest), "rb") as f:
+                compressed = f.read()
+        except FileNotFoundError:
+            logger.warning(f"Blob {digest} not found")
+            return None
+        self._metrics["reads"] += 1
+        return json.loads(zstandard.ZstdDecompressor().decompress(compressed))
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self._path(digest))
+
+    def get_metrics(self) -> Dict:
+        """Write/read counters and the compression ratio of blobs written by this process"""
+        stored = self._metrics["bytes_stored"]
+        return dict(self._metrics, compression_ratio=self._metrics["bytes_raw"] / stored if stored else 0.0)
+
+
+_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Get the process-wide blob store"""
+    global _store
+    if _store is None:
+        _store = BlobStore(Config.BLOB_STORE_PATH, level=Config.BLOB_COMPRESSION_LEVEL)
+    return _store
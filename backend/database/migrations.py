@@ -0,0 +1,70 @@
+"""
+Additive schema migrations for databases created by older versions
+
+``Base.metadata.create_all`` creates missing tables with the current schema but never
+alters existing ones. Each migration here brings an existing database forward one step
+and is idempotent, so it is also safe on a freshly created schema. On SQLite the schema
+version is tracked in ``PRAGMA user_version`` and applied migrations are skipped.
+"""
+
+from typing import Callable, List
+from loguru import logger
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+
+def _add_columns(conn: Connection, table: str, columns: dict):
+    inspector = inspect(conn)
+    if not inspector.has_table(table):
+        return
+    existing = {column["name"] for column in inspector.get_columns(table)}
+    for name, ddl in columns.items():
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+
+
+def _create_index(conn: Connection, name: str, table: str, columns: str):
+    if inspect(conn).has_table(table):
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def _v1_results_blob_columns(conn: Connection):
+    """QueryLog result payloads moved to the blob store"""
+    _add_columns(conn, "query_logs", {"results_hash": "VARCHAR(64)", "results_size": "INTEGER"})
+
+
+def _v2_provenance_indexes(conn: Connection):
+    """Indexes for recent-first log listing and provenance lookups"""
+    _create_index(conn, "ix_query_logs_timestamp_id", "query_logs", "timestamp, id")
+    _create_index(conn, "ix_data_provenance_query_log_id", "data_provenance", "query_log_id")
+    _create_index(conn, "ix_data_provenance_record_id", "data_provenance", "record_id")
+    _create_index(conn, "ix_workflow_executions_query_log_id", "workflow_executions", "query_log_id")
+
+
+def _v3_log_status_index(conn: Connection):
+    """Index for log listing filtered by status"""
+    _create_index(conn, "ix_query_logs_status_timestamp_id", "query_logs", "status, timestamp, id")
+
+
+# Applied in order; the schema version is the number of migrations applied
+MIGRATIONS: List[Callable[[Connection], None]] = [
+    _v1_results_blob_columns,
+    _v2_provenance_indexes,
+    _v3_log_status_index,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def run_migrations(engine: Engine):
+    """Apply pending migrations in one transaction"""
+    is_sqlite = engine.dialect.name == "sqlite"
+    with engine.begin() as conn:
+        current = conn.execute(text("PRAGMA user_version")).scalar() if is_sqlite else 0
+        if current >= SCHEMA_VERSION:
+            return
+        for version, migration in enumerate(MIGRATIONS[current:], start=current + 1):
+            logger.info(f"Applying database migration {version}: {migration.__doc__}")
+            migration(conn)
+        if is_sqlite:
+            conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
@@ -2,17 +2,34 @@
 Database models for the biomedical research platform
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON, Boolean
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, Text, DateTime, JSON, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
-import os
+
+from config import Config
+from database.migrations import run_migrations
 
 # Database configuration
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./biomedical_platform.db")
+DATABASE_URL = Config.DATABASE_URL
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+# Create engine (pooled connections; SQLite ones are shared across worker threads)
+engine_options = {"connect_args": {"check_same_thread": False, "timeout": Config.DB_BUSY_TIMEOUT_MS / 1000}} if IS_SQLITE else {"pool_pre_ping": True}
+if ":memory:" not in DATABASE_URL:  # In-memory SQLite uses a single connection per thread
+    engine_options.update(pool_size=Config.DB_POOL_SIZE, max_overflow=Config.DB_MAX_OVERFLOW)
+engine = create_engine(DATABASE_URL, **engine_options)
 
-# Create engine
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {})
+if IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets readers run alongside the provenance writer; NORMAL sync is safe under WAL"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={Config.DB_BUSY_TIMEOUT_MS}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -23,11 +40,17 @@ Base = declarative_base()
 class QueryLog(Base):
     """Model for logging queries and their results"""
     __tablename__ = "query_logs"
+    __table_args__ = (
+        Index("ix_query_logs_timestamp_id", "timestamp", "id"),  # Recent-first listing
+        Index("ix_query_logs_status_timestamp_id", "status", "timestamp", "id"),  # Listing filtered by status
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     query = Column(Text, nullable=False)
     sources = Column(JSON, nullable=False)  # List of sources queried
-    results = Column(JSON, nullable=True)   # Results from all sources
+    results = Column(JSON, nullable=True)   # Legacy inline results; new rows use results_hash
+    results_hash = Column(String(64), nullable=True)  # SHA-256 of the result payload in the blob store
+    results_size = Column(Integer, nullable=True)  # Uncompressed payload size in bytes
     timestamp = Column(DateTime, default=datetime.utcnow)
     user_id = Column(String(100), nullable=True)
     processing_time = Column(Integer, nullable=True)  # Processing time in milliseconds
@@ -39,11 +62,11 @@ class DataProvenance(Base):
     __tablename__ = "data_provenance"
     
     id = Column(Integer, primary_key=True, index=True)
-    query_log_id = Column(Integer, nullable=False)
+    query_log_id = Column(Integer, nullable=False, index=True)
     source = Column(String(100), nullable=False)  # pubmed, uniprot, swissadme
     source_url = Column(String(500), nullable=True)
     data_type = Column(String(100), nullable=False)  # article, protein, drug_property
-    record_id = Column(String(200), nullable=True)  # PMID, UniProt ID, etc.
+    record_id = Column(String(200), nullable=True, index=True)  # PMID, UniProt ID, etc.
     extraction_method = Column(String(100), nullable=False)  # api, web_scraping
     timestamp = Column(DateTime, default=datetime.utcnow)
     data_hash = Column(String(64), nullable=True)  # Hash of the data for integrity
@@ -53,7 +76,7 @@ class WorkflowExecution(Base):
     __tablename__ = "workflow_executions"
     
     id = Column(Integer, primary_key=True, index=True)
-    query_log_id = Column(Integer, nullable=False)
+    query_log_id = Column(Integer, nullable=False, index=True)
     workflow_type = Column(String(100), nullable=False)  # multi_source, synthesis, etc.
     steps = Column(JSON, nullable=False)  # List of workflow steps
     ai_model = Column(String(100), nullable=True)  # Model used for orchestration
@@ -62,10 +85,28 @@ class WorkflowExecution(Base):
     error_message = Column(Text, nullable=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
 
+class QueryJob(Base):
+    """Model for queries submitted through the asynchronous job API"""
+    __tablename__ = "query_jobs"
+    
+    id = Column(String(36), primary_key=True)  # UUID handed back to the client
+    query = Column(Text, nullable=False)
+    sources = Column(JSON, nullable=False)
+    max_results = Column(Integer, default=10)
+    bypass_cache = Column(Boolean, default=False)  # Force fresh LLM calls when the job runs
+    status = Column(String(50), default="queued", index=True)  # queued, running, completed, failed
+    result_hash = Column(String(64), nullable=True)  # SHA-256 of the result payload in the blob store
+    result_size = Column(Integer, nullable=True)  # Uncompressed payload size in bytes
+    error_message = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
 def init_database():
     """Initialize the database and create tables"""
     try:
         Base.metadata.create_all(bind=engine)
+        run_migrations(engine)
         print("Database initialized successfully")
     except Exception as e:
         print(f"Error initializing database: {e}")
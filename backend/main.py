@@ -1,147 +1,292 @@
-"""
-Main FastAPI application for the Agentic AI-Enabled Biomedical Research Platform
-"""
-
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
-from loguru import logger
-import os
-from dotenv import load_dotenv
-
-from services.workflow_service import WorkflowService
-from database.models import init_database
-from config import Config
-
-# Load environment variables
-load_dotenv()
-
-# Initialize FastAPI app
-app = FastAPI(
-    title="Agentic AI Biomedical Research Platform",
-    description="A POC platform for integrating biomedical data sources with AI orchestration",
-    version="1.0.0"
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Initialize database
-init_database()
-
-# Initialize workflow service
-workflow_service = WorkflowService()
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup"""
-    logger.info("Starting Agentic AI Biomedical Research Platform")
-    await workflow_service.initialize()
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    logger.info("Shutting down Agentic AI Biomedical Research Platform")
-    await workflow_service.cleanup()
-
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {
-        "message": "Agentic AI Biomedical Research Platform API",
-        "version": "1.0.0",
-        "status": "running"
-    }
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "biomedical-platform"}
-
-@app.post("/api/query")
-async def process_query(query_data: dict):
-    """
-    Process a biomedical research query using AI orchestration
-    
-    Expected query_data format:
-    {
-        "query": "string",
-        "sources": ["pubmed", "uniprot", "swissadme"],
-        "max_results": 10
-    }
-    """
-    try:
-        logger.info(f"Processing query: {query_data.get('query', '')}")
-        
-        # Validate input
-        if not query_data.get("query"):
-            raise HTTPException(status_code=400, detail="Query is required")
-        
-        # Set defaults
-        sources = query_data.get("sources", ["pubmed", "uniprot", "swissadme"])
-        max_results = query_data.get("max_results", 10)
-        
-        # Process query through AI agent
-        result = await workflow_service.process_query(
-            query=query_data["query"],
-            sources=sources,
-            max_results=max_results
-        )
-        
-        return JSONResponse(content=result)
-        
-    except Exception as e:
-        logger.error(f"Error processing query: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@app.get("/api/sources")
-async def get_available_sources():
-    """Get list of available data sources"""
-    return {
-        "sources": [
-            {
-                "name": "pubmed",
-                "description": "PubMed article database",
-                "type": "api",
-                "status": "available"
-            },
-            {
-                "name": "uniprot",
-                "description": "UniProt protein database",
-                "type": "api", 
-                "status": "available"
-            },
-            {
-                "name": "swissadme",
-                "description": "SwissADME drug properties",
-                "type": "web_scraping",
-                "status": "available"
-            }
-        ]
-    }
-
-@app.get("/api/logs")
-async def get_logs(limit: int = 100):
-    """Get recent query logs for data provenance"""
-    try:
-        logs = await workflow_service.get_recent_logs(limit)
-        return {"logs": logs}
-    except Exception as e:
-        logger.error(f"Error retrieving logs: {str(e)}")
-        raise HTTPException(status_code=500, detail="Error retrieving logs")
-
-if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
-        host=Config.HOST,
-        port=Config.PORT,
-        reload=Config.DEBUG,
-        log_level=Config.LOG_LEVEL.lower()
+"""
+Main FastAPI application for the Agentic AI-Enabled Biomedical Research Platform
+"""
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+import uvicorn
+from loguru import logger
+import os
+import asyncio
+from datetime import datetime
+from typing import Optional
+from dotenv import load_dotenv
+
+from adapters import json_codec
+from adapters.records import json_default
+from services.workflow_service import WorkflowService
+from services.job_service import JobService, JobQueueFull
+from cache.llm_cache import bypass_llm_cache
+from database.models import init_database
+from config import Config
+
+# Load environment variables
+load_dotenv()
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Agentic AI Biomedical Research Platform",
+    description="A POC platform for integrating biomedical data sources with AI orchestration",
+    version="1.0.0"
+)
+
+# Configure CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Initialize database
+init_database()
+
+# Initialize workflow service
+workflow_service = WorkflowService()
+
+# Background job queue for long-running queries
+job_service = JobService(workflow_service)
+
+@app.on_event("startup")
+async def startup_event():
+    """Initialize services on startup"""
+    logger.info("Starting Agentic AI Biomedical Research Platform")
+    await workflow_service.initialize()
+    await job_service.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Cleanup on shutdown"""
+    logger.info("Shutting down Agentic AI Biomedical Research Platform")
+    await job_service.stop()
+    await workflow_service.cleanup()
+
+@app.get("/")
+async def root():
+    """Root endpoint"""
+    return {
+        "message": "Agentic AI Biomedical Research Platform API",
+        "version": "1.0.0",
+        "status": "running"
+    }
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return {"status": "healthy", "service": "biomedical-platform"}
+
+async def _run_until_disconnected(request: Request, coro):
+    """
+    Await coro, cancelling it if the client disconnects first
+
+    Returns (completed, result); cancellation propagates down to the source calls,
+    including any SwissADME scrape running on the executor.
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=Config.DISCONNECT_POLL_INTERVAL)
+            if done:
+                return True, task.result()
+            if await request.is_disconnected():
+                logger.info("Client disconnected, cancelling query")
+                task.cancel()
+                return False, None
+    finally:
+        if not task.done():
+            task.cancel()
+
+@app.post("/api/query")
+async def process_query(request: Request, query_data: dict):
+    """
+    Process a biomedical research query using AI orchestration
+    
+    Expected query_data format:
+    {
+        "query": "string",
+        "sources": ["pubmed", "uniprot", "swissadme"],
+        "max_results": 10,
+        "bypass_cache": false   // optional: force fresh LLM calls
+    }
+    """
+    try:
+        logger.info(f"Processing query: {query_data.get('query', '')}")
+        
+        # Validate input
+        if not query_data.get("query"):
+            raise HTTPException(status_code=400, detail="Query is required")
+        
+        # Set defaults
+        sources = query_data.get("sources", ["pubmed", "uniprot", "swissadme"])
+        max_results = query_data.get("max_results", 10)
+        
+        # Process query through AI agent (abandoned if the client goes away)
+        with bypass_llm_cache(bool(query_data.get("bypass_cache"))):
+            completed, result = await _run_until_disconnected(request, workflow_service.process_query(
+                query=query_data["query"],
+                sources=sources,
+                max_results=max_results
+            ))
+        
+        if not completed:
+            return JSONResponse(status_code=499, content={"detail": "Client closed request"})
+        
+        # Source results are Article / Protein records; encode them straight to JSON
+        return Response(content=json_codec.dumps(result, default=json_default), media_type="application/json")
+        
+    except Exception as e:
+        logger.error(f"Error processing query: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@app.post("/api/query/stream")
+async def stream_query(query_data: dict):
+    """
+    Process a query, streaming partial results as Server-Sent Events
+    
+    Accepts the same body as /api/query. In "plan" orchestration mode a "plan" event
+    lists the planned tool calls first. Emits a "source" event per data source as soon
+    as it returns (fastest first), then "analysis" with the AI synthesis, then "done".
+    Closing the connection cancels the sources still running.
+    """
+    if not query_data.get("query"):
+        raise HTTPException(status_code=400, detail="Query is required")
+    
+    events = workflow_service.stream_query(
+        query=query_data["query"],
+        sources=query_data.get("sources", ["pubmed", "uniprot", "swissadme"]),
+        max_results=query_data.get("max_results", 10)
+    )
+    
+    async def event_stream():
+        with bypass_llm_cache(bool(query_data.get("bypass_cache"))):
+            async for event, data in events:
+                yield f"event: {event}\ndata: {json_codec.dumps(data, default=json_default)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/jobs", status_code=202)
+async def submit_job(query_data: dict):
+    """
+    Submit a query to run in the background and return its job ID immediately
+    
+    Accepts the same body as /api/query. Poll /api/jobs/{job_id} for status and
+    fetch /api/jobs/{job_id}/result once it has completed.
+    """
+    if not query_data.get("query"):
+        raise HTTPException(status_code=400, detail="Query is required")
+    
+    try:
+        job = await job_service.submit(
+            query=query_data["query"],
+            sources=query_data.get("sources", ["pubmed", "uniprot", "swissadme"]),
+            max_results=query_data.get("max_results", 10),
+            bypass_cache=bool(query_data.get("bypass_cache"))
+        )
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error submitting job: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    
+    return JSONResponse(status_code=202, content=job)
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get the status of a submitted job"""
+    job = await job_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.get("/api/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """Get the result of a finished job (409 while it is still queued or running)"""
+    job = await job_service.get_result(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] in ("queued", "running"):
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+    return job
+
+@app.get("/api/sources")
+async def get_available_sources():
+    """Get list of available data sources"""
+    return {
+        "sources": [
+            {
+                "name": "pubmed",
+                "description": "PubMed article database",
+                "type": "api",
+                "status": "available"
+            },
+            {
+                "name": "uniprot",
+                "description": "UniProt protein database",
+                "type": "api", 
+                "status": "available"
+            },
+            {
+                "name": "swissadme",
+                "description": "SwissADME drug properties",
+                "type": "web_scraping",
+                "status": "available"
+            }
+        ]
+    }
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """Get runtime metrics (SwissADME pool/batching, cache hit/miss counters, job queue)"""
+    return {**workflow_service.get_metrics(), "jobs": job_service.get_metrics()}
+
+@app.get("/api/logs")
+async def get_logs(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+):
+    """
+    Get query logs for data provenance, newest first
+    
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page.
+    """
+    try:
+        return await workflow_service.get_recent_logs(
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            source=source,
+            since=since,
+            until=until
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error retrieving logs: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error retrieving logs")
+
+@app.get("/api/logs/{log_id}/results")
+async def get_log_results(log_id: int):
+    """Get the full results of a logged query"""
+    results = await workflow_service.get_query_results(log_id)
+    if results is None:
+        raise HTTPException(status_code=404, detail="Results not found")
+    return results
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "main:app",
+        host=Config.HOST,
+        port=Config.PORT,
+        reload=Config.DEBUG,
+        log_level=Config.LOG_LEVEL.lower()
     )
\ No newline at end of file
@@ -0,0 +1,217 @@
+"""
+Asynchronous job queue for long-running queries
+"""
+
+from typing import Dict, List, Optional
+from loguru import logger
+from datetime import datetime
+import asyncio
+import uuid
+
+from cache.llm_cache import bypass_llm_cache
+from database.blob_store import BlobStore, get_blob_store
+from database.models import SessionLocal, QueryJob
+from config import Config
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue has no room for another submission"""
+
+
+class JobService:
+    """
+    Runs submitted queries on a fixed pool of workers fed by a bounded queue
+
+    Jobs are persisted in the ``query_jobs`` table; anything still queued or running
+    when the process stopped is re-enqueued on the next start. Result payloads go to
+    the blob store; the row keeps only their hash and size.
+    """
+
+    def __init__(self, workflow_service, workers: int = None, max_queue: int = None, blob_store: BlobStore = None):
+        self.workflow_service = workflow_service
+        self.blob_store = blob_store or get_blob_store()
+        self.workers = workers or Config.JOB_WORKERS
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue or Config.JOB_QUEUE_SIZE)
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start the workers and re-enqueue jobs left over from a previous run"""
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        pending = await asyncio.to_thread(self._reset_unfinished_jobs)
+        if pending:
+            logger.info(f"Re-enqueuing {len(pending)} unfinished job(s)")
+            # May exceed the queue size, so wait for room instead of failing
+            self._tasks.append(asyncio.create_task(self._enqueue_all(pending)))
+        logger.info(f"Job service started with {self.workers} worker(s)")
+
+    async def stop(self):
+        """Stop the workers; jobs in flight stay 'running' and are picked up on restart"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Job service stopped")
+
+    async def submit(self, query: str, sources: List[str], max_results: int = 10, bypass_cache: bool = False) -> Dict:
+        """
+        Persist and enqueue a query
+
+        Args:
+            bypass_cache: Skip the LLM cache when the job runs
+
+        Returns:
+            The job's status dictionary
+
+        Raises:
+            JobQueueFull: If the queue is at capacity
+        """
+        if self.queue.full():
+            raise JobQueueFull(f"Job queue is full ({self.queue.maxsize} pending)")
+
+        job_id = str(uuid.uuid4())
+        job = await asyncio.to_thread(self._create_job, job_id, query, sources, max_results, bypass_cache)
+        try:
+            self.queue.put_nowait(job_id)
+        except asyncio.QueueFull:
+            # Filled up while the row was being written
+            await asyncio.to_thread(self._finish_job, job_id, "failed", None, "Job queue is full")
+            raise JobQueueFull(f"Job queue is full ({self.queue.maxsize} pending)")
+
+        logger.info(f"Queued job {job_id}: {query}")
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[Dict]:
+        """Get a job's status (without its result), or None if unknown"""
+        return await asyncio.to_thread(self._load_job, job_id, False)
+
+    async def get_result(self, job_id: str) -> Optional[Dict]:
+        """Get a job's status including its result, or None if unknown"""
+        return await asyncio.to_thread(self._load_job, job_id, True)
+
+    def get_metrics(self) -> Dict:
+        """Queue depth and worker count"""
+        return {"queued": self.queue.qsize(), "max_queue": self.queue.maxsize, "workers": self.workers}
+
+    async def _enqueue_all(self, job_ids: List[str]):
+        for job_id in job_ids:
+            await self.queue.put(job_id)
+
+    async def _worker(self, index: int):
+        while True:
+            job_id = await self.queue.get()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                logger.error(f"Job worker {index} failed on job {job_id}: {e}")
+            finally:
+                self.queue.task_done()
+
+    async def _run_job(self, job_id: str):
+        job = await asyncio.to_thread(self._start_job, job_id)
+        if job is None:
+            return
+
+        try:
+            with bypass_llm_cache(job["bypass_cache"]):
+                result = await self.workflow_service.process_query(
+                    query=job["query"],
+                    sources=job["sources"],
+                    max_results=job["max_results"]
+                )
+        except Exception as e:
+            await asyncio.to_thread(self._finish_job, job_id, "failed", None, str(e))
+            return
+
+        if result.get("status") == "error":
+            await asyncio.to_thread(self._finish_job, job_id, "failed", result, result.get("error"))
+        else:
+            await asyncio.to_thread(self._finish_job, job_id, "completed", result, None)
+        logger.info(f"Job {job_id} finished")
+
+    # --- Database helpers (run in a worker thread) ---
+
+    def _to_dict(self, job: QueryJob, include_result: bool) -> Dict:
+        data = {
+            "job_id": job.id,
+            "query": job.query,
+            "sources": job.sources,
+            "max_results": job.max_results,
+            "bypass_cache": bool(job.bypass_cache),
+            "status": job.status,
+            "error_message": job.error_message,
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        }
+        if include_result:
+            data["result"] = self.blob_store.get(job.result_hash) if job.result_hash else None
+        return data
+
+    def _create_job(self, job_id: str, query: str, sources: List[str], max_results: int, bypass_cache: bool = False) -> Dict:
+        db = SessionLocal()
+        try:
+            job = QueryJob(
+                id=job_id, query=query, sources=sources, max_results=max_results,
+                bypass_cache=bypass_cache, status="queued"
+            )
+            db.add(job)
+            db.commit()
+            db.refresh(job)
+            return self._to_dict(job, False)
+        finally:
+            db.close()
+
+    def _load_job(self, job_id: str, include_result: bool) -> Optional[Dict]:
+        db = SessionLocal()
+        try:
+            job = db.query(QueryJob).filter(QueryJob.id == job_id).first()
+            return self._to_dict(job, include_result) if job else None
+        finally:
+            db.close()
+
+    def _start_job(self, job_id: str) -> Optional[Dict]:
+        db = SessionLocal()
+        try:
+            job = db.query(QueryJob).filter(QueryJob.id == job_id).first()
+            if job is None or job.status not in ("queued", "running"):
+                return None
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            db.commit()
+            return self._to_dict(job, False)
+        finally:
+            db.close()
+
+    def _finish_job(self, job_id: str, status: str, result: Optional[Dict], error_message: Optional[str]):
+        result_hash, result_size = self.blob_store.put(result) if result is not None else (None, None)
+        db = SessionLocal()
+        try:
+            job = db.query(QueryJob).filter(QueryJob.id == job_id).first()
+            if job is None:
+                return
+            job.status = status
+            job.result_hash = result_hash
+            job.result_size = result_size
+            job.error_message = error_message
+            job.completed_at = datetime.utcnow()
+            db.commit()
+        finally:
+            db.close()
+
+    def _reset_unfinished_jobs(self) -> List[str]:
+        """Mark interrupted jobs as queued again and return all pending ids, oldest first"""
+        db = SessionLocal()
+        try:
+            jobs = (
+                db.query(QueryJob)
+                .filter(QueryJob.status.in_(("queued", "running")))
+                .order_by(QueryJob.created_at)
+                .all()
+            )
+            for job in jobs:
+                job.status = "queued"
+                job.started_at = None
+            db.commit()
+            return [job.id for job in jobs]
+        finally:
+            db.close()
@@ -0,0 +1,240 @@
+"""
+Write-behind logging of query logs, data provenance and workflow executions
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+from sqlalchemy import insert
+from datetime import datetime
+import asyncio
+
+from database.blob_store import BlobStore, get_blob_store
+from database.models import SessionLocal, QueryLog, DataProvenance, WorkflowExecution
+from config import Config
+
+
+class QueryLogHandle:
+    """
+    Reference to a QueryLog row that may not have been written yet
+
+    ``id`` is filled in by the flush that inserts the row. While the insert is still
+    buffered, ``pending`` holds its column values so later updates can be folded in.
+    """
+
+    __slots__ = ("id", "pending")
+
+    def __init__(self, pending: Dict[str, Any]):
+        self.id: Optional[int] = None
+        self.pending: Optional[Dict[str, Any]] = pending
+
+
+class ProvenanceWriter:
+    """
+    Buffers QueryLog / DataProvenance / WorkflowExecution writes and flushes them in batches
+
+    Callers enqueue without touching the database; a background task writes everything
+    buffered so far in one transaction (on a worker thread) every ``interval`` seconds,
+    or sooner once ``batch_size`` operations are waiting. ``stop`` flushes what is left.
+    Failed queries are retried on later flushes (see ``flush``).
+    QueryLog result payloads go to the blob store; the row keeps only their hash and size.
+    """
+
+    def __init__(self, interval: float = None, batch_size: int = None, blob_store: BlobStore = None,
+                 max_attempts: int = None):
+        self.interval = interval or Config.PROVENANCE_FLUSH_INTERVAL
+        self.batch_size = batch_size or Config.PROVENANCE_FLUSH_SIZE
+        self.max_attempts = max_attempts or Config.PROVENANCE_MAX_ATTEMPTS
+        self._failures: Dict[QueryLogHandle, int] = {}  # Failed flush attempts per query still buffered
+        self.blob_store = blob_store or get_blob_store()
+        self._ops: List[Tuple[str, QueryLogHandle, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._metrics = {"flushes": 0, "operations": 0, "failed_flushes": 0, "dropped_operations": 0, "provenance_rows": 0, "flush_time_total_ms": 0.0}
+
+    def start(self):
+        """Start the background flush loop (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush loop and write everything still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # Give queries that fail to write their remaining attempts
+        for _ in range(self.max_attempts):
+            await self.flush()
+            if not self._ops:
+                break
+
+    # --- Enqueue API (non-blocking) ---
+
+    def begin_query(self, query: str, sources: List[str], start_time: datetime) -> QueryLogHandle:
+        """Buffer a new QueryLog in the "processing" state"""
+        handle = QueryLogHandle({"query": query, "sources": sources, "timestamp": start_time, "status": "processing"})
+        self._enqueue("query_log", handle, handle.pending)
+        return handle
+
+    def add_provenance(self, handle: QueryLogHandle, rows: List[Dict[str, Any]]):
+        """Buffer DataProvenance rows for a query"""
+        if rows:
+            self._enqueue("provenance", handle, rows)
+
+    def add_workflow_execution(self, handle: QueryLogHandle, fields: Dict[str, Any]):
+        """Buffer a WorkflowExecution row for a query"""
+        self._enqueue("workflow", handle, fields)
+
+    def update_query(self, handle: QueryLogHandle, **fields):
+        """Update a QueryLog; folded into the buffered insert when it hasn't been written yet"""
+        if handle.pending is not None:
+            handle.pending.update(fields)
+        else:
+            self._enqueue("update", handle, fields)
+
+    def _enqueue(self, kind: str, handle: QueryLogHandle, payload: Any):
+        self._ops.append((kind, handle, payload))
+        if len(self._ops) >= self.batch_size:
+            self._wakeup.set()
+
+    # --- Flushing ---
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self):
+        """
+        Write all buffered operations
+
+        The batch is written in a single transaction. If that fails, each query's
+        operations are retried in their own transaction so one bad query does not
+        cost the others their logs; queries that still fail are put back at the
+        front of the buffer and dropped after ``max_attempts`` flushes.
+        """
+        async with self._flush_lock:
+            if not self._ops:
+                return
+            ops, self._ops = self._ops, []
+            # From here on, updates to these rows must be written as separate operations
+            for kind, handle, _ in ops:
+                if kind == "query_log":
+                    handle.pending = None
+
+            start = datetime.utcnow()
+            try:
+                await asyncio.to_thread(self._write_batch, ops)
+                failed = []
+            except Exception as e:
+                self._metrics["failed_flushes"] += 1
+                logger.warning(f"Batched write of {len(ops)} provenance operation(s) failed, retrying per query: {e}")
+                failed = await asyncio.to_thread(self._write_groups, ops)
+
+            self._metrics["flushes"] += 1
+            self._metrics["operations"] += len(ops) - len(failed)
+            failed_handles = {handle for _, handle, _ in failed}
+            for _, handle, _ in ops:
+                if handle not in failed_handles:
+                    self._failures.pop(handle, None)
+            if failed:
+                self._requeue(failed)
+            self._metrics["flush_time_total_ms"] += (datetime.utcnow() - start).total_seconds() * 1000
+
+    def _write_groups(self, ops: List[Tuple[str, QueryLogHandle, Any]]) -> List[Tuple[str, QueryLogHandle, Any]]:
+        """Write each query's operations in its own transaction; return the operations that failed"""
+        failed = []
+        for group in _group_by_query(ops):
+            try:
+                self._write_batch(group)
+            except Exception as e:
+                logger.error(f"Error writing {len(group)} provenance operation(s) for one query: {e}")
+                failed.extend(group)
+        return failed
+
+    def _requeue(self, failed: List[Tuple[str, QueryLogHandle, Any]]):
+        retry = []
+        for group in _group_by_query(failed):
+            handle = group[0][1]
+            attempts = self._failures.get(handle, 0) + 1
+            if attempts >= self.max_attempts:
+                self._failures.pop(handle, None)
+                self._metrics["dropped_operations"] += len(group)
+                logger.error(f"Dropping {len(group)} provenance operation(s) after {attempts} failed attempts")
+            else:
+                self._failures[handle] = attempts
+                retry.extend(group)
+        # Ahead of anything enqueued since, so per-query ordering is kept
+        self._ops[:0] = retry
+
+    def _offload_results(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a ``results`` payload with its blob hash and size"""
+        if fields.get("results") is None:
+            return fields
+        fields = dict(fields)
+        fields["results_hash"], fields["results_size"] = self.blob_store.put(fields.pop("results"))
+        return fields
+
+    def _write_batch(self, ops: List[Tuple[str, QueryLogHandle, Any]]):
+        """Write operations in one transaction; handles get their ids only once it commits"""
+        db = SessionLocal()
+        ids: Dict[QueryLogHandle, int] = {}
+        provenance_rows = []
+        try:
+            for kind, handle, payload in ops:
+                if kind == "query_log":
+                    query_log = QueryLog(**self._offload_results(payload))
+                    db.add(query_log)
+                    db.flush()  # Assigns the id that child rows reference
+                    ids[handle] = query_log.id
+                    continue
+                query_log_id = ids.get(handle, handle.id)
+                if query_log_id is None:
+                    continue  # Parent insert was dropped
+                if kind == "provenance":
+                    provenance_rows.extend(dict(row, query_log_id=query_log_id) for row in payload)
+                elif kind == "workflow":
+                    db.add(WorkflowExecution(query_log_id=query_log_id, **payload))
+                elif kind == "update":
+                    db.query(QueryLog).filter(QueryLog.id == query_log_id).update(self._offload_results(payload))
+            if provenance_rows:
+                # One executemany for every provenance row in the batch
+                db.execute(insert(DataProvenance), provenance_rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        # Only now are the ids durable; a rolled-back id would be reused by the next insert
+        for handle, query_log_id in ids.items():
+            handle.id = query_log_id
+        self._metrics["provenance_rows"] += len(provenance_rows)
+
+    def get_metrics(self) -> Dict:
+        """Flush counters and current buffer depth"""
+        return dict(self._metrics, buffered=len(self._ops))
+
+
+def _group_by_query(ops: List[Tuple[str, QueryLogHandle, Any]]) -> List[List[Tuple[str, QueryLogHandle, Any]]]:
+    """Split operations by query, keeping their order within each query"""
+    groups: Dict[QueryLogHandle, List] = {}
+    for op in ops:
+        groups.setdefault(op[1], []).append(op)
+    return list(groups.values())
+
+
+_writer: Optional[ProvenanceWriter] = None
+
+
+def get_provenance_writer() -> ProvenanceWriter:
+    """Get the process-wide provenance writer"""
+    global _writer
+    if _writer is None:
+        _writer = ProvenanceWriter()
+    return _writer
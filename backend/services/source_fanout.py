@@ -0,0 +1,57 @@
+"""
+Concurrent fan-out across data sources with per-source deadlines
+"""
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+from loguru import logger
+import asyncio
+
+from config import Config
+
+SourceCall = Callable[[], Awaitable[Any]]
+
+
+async def _run_source(source: str, call: SourceCall, timeout: Optional[float]) -> Tuple[str, Any]:
+    """Run a single source call, converting failures into the per-source error shape"""
+    try:
+        return source, await asyncio.wait_for(call(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Source {source} exceeded its {timeout}s deadline")
+        return source, {"error": f"{source} timed out after {timeout:g}s"}
+    except Exception as e:
+        logger.error(f"Error processing source {source}: {e}")
+        return source, {"error": str(e)}
+
+
+async def iter_sources(calls: Dict[str, SourceCall], timeouts: Optional[Dict[str, float]] = None) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Run all source calls concurrently and yield (source, result) as each one finishes
+
+    Args:
+        calls: Mapping of source name to a zero-argument coroutine factory
+        timeouts: Per-source deadline in seconds (defaults to Config.SOURCE_TIMEOUTS)
+
+    Yields:
+        Tuples of source name and its results, or {"error": ...} on failure/timeout
+    """
+    timeouts = Config.SOURCE_TIMEOUTS if timeouts is None else timeouts
+    tasks = [
+        asyncio.create_task(_run_source(source, call, timeouts.get(source)))
+        for source, call in calls.items()
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Consumer stopped early (or was cancelled) - don't leave sources running
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def gather_sources(calls: Dict[str, SourceCall], timeouts: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Run all source calls concurrently and return results keyed by source, in call order"""
+    results = {}
+    async for source, source_results in iter_sources(calls, timeouts):
+        results[source] = source_results
+    return {source: results[source] for source in calls}
@@ -1,291 +1,469 @@
-"""
-Workflow service for coordinating data sources and AI orchestration
-"""
-
-from typing import List, Dict, Optional, Any
-from loguru import logger
-import asyncio
-from datetime import datetime
-import json
-
-from ai_agent.orchestrator import AIOrchestrator
-from database.models import SessionLocal, QueryLog, DataProvenance, WorkflowExecution
-from adapters.pubmed_adapter import PubMedAdapter
-from adapters.uniprot_adapter import UniProtAdapter
-from adapters.swissadme_adapter import SwissADMEAdapter
-
-class WorkflowService:
-    """Service for managing biomedical research workflows"""
-    
-    def __init__(self):
-        self.ai_orchestrator = AIOrchestrator()
-        self.pubmed_adapter = PubMedAdapter()
-        self.uniprot_adapter = UniProtAdapter()
-        self.swissadme_adapter = SwissADMEAdapter()
-        self.initialized = False
-        
-    async def initialize(self):
-        """Initialize the workflow service"""
-        try:
-            await self.ai_orchestrator.initialize()
-            self.initialized = True
-            logger.info("Workflow service initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing workflow service: {e}")
-            self.initialized = False
-    
-    async def process_query(self, query: str, sources: List[str], max_results: int = 10) -> Dict:
-        """
-        Process a biomedical research query
-        
-        Args:
-            query: The research query
-            sources: List of data sources to query
-            max_results: Maximum results per source
-            
-        Returns:
-            Dictionary containing processed results
-        """
-        start_time = datetime.utcnow()
-        query_log_id = None
-        
-        try:
-            logger.info(f"Processing query: {query}")
-            
-            # Log the query
-            query_log_id = await self._log_query(query, sources, start_time)
-            
-            # Process using AI orchestration if available
-            if self.initialized:
-                result = await self.ai_orchestrator.process_query(query, sources, max_results)
-                orchestration_method = "ai_orchestration"
-            else:
-                # Fallback to direct processing
-                result = await self._direct_processing(query, sources, max_results)
-                orchestration_method = "direct_processing"
-            
-            # Log data provenance
-            await self._log_data_provenance(query_log_id, result, sources)
-            
-            # Log workflow execution
-            await self._log_workflow_execution(query_log_id, orchestration_method, result)
-            
-            # Update query log with results
-            processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            await self._update_query_log(query_log_id, result, processing_time, "completed")
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error processing query: {e}")
-            
-            # Update query log with error
-            if query_log_id:
-                processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-                await self._update_query_log(query_log_id, None, processing_time, "failed", str(e))
-            
-            return {
-                "query": query,
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
-                "status": "error"
-            }
-    
-    async def _direct_processing(self, query: str, sources: List[str], max_results: int) -> Dict:
-        """Direct processing without AI orchestration"""
-        try:
-            results = {}
-            
-            # Process each source
-            for source in sources:
-                try:
-                    if source == "pubmed":
-                        source_results = await self.pubmed_adapter.search_articles(query, max_results)
-                    elif source == "uniprot":
-                        source_results = await self.uniprot_adapter.search_proteins(query, max_results)
-                    elif source == "swissadme":
-                        # For SwissADME, we need SMILES notation
-                        # This is a simplified approach
-                        # smiles_query = "c1ccccc1Oc1ccccc1"  # Placeholder - in practice, convert query to SMILES
-                        source_results = await self.swissadme_adapter.search_drug_properties(query)
-                    else:
-                        source_results = {"error": f"Unknown source: {source}"}
-                    
-                    results[source] = source_results
-                    
-                except Exception as e:
-                    logger.error(f"Error processing source {source}: {e}")
-                    results[source] = {"error": str(e)}
-            
-            return {
-                "query": query,
-                "sources_queried": sources,
-                "results": results,
-                "timestamp": datetime.utcnow().isoformat(),
-                # "orchestration_method": "direct_processing"
-                "orchestration_method": "Direct"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in direct processing: {e}")
-            raise
-    
-    async def _log_query(self, query: str, sources: List[str], start_time: datetime) -> int:
-        """Log the query to database"""
-        try:
-            db = SessionLocal()
-            query_log = QueryLog(
-                query=query,
-                sources=sources,
-                timestamp=start_time,
-                status="processing"
-            )
-            db.add(query_log)
-            db.commit()
-            db.refresh(query_log)
-            query_log_id = query_log.id
-            db.close()
-            
-            logger.info(f"Logged query with ID: {query_log_id}")
-            return query_log_id
-            
-        except Exception as e:
-            logger.error(f"Error logging query: {e}")
-            return None
-    
-    async def _log_data_provenance(self, query_log_id: int, result: Dict, sources: List[str]):
-        """Log data provenance information"""
-        try:
-            if not query_log_id:
-                return
-            
-            db = SessionLocal()
-            
-            # Log provenance for each source
-            for source in sources:
-                provenance = DataProvenance(
-                    query_log_id=query_log_id,
-                    source=source,
-                    data_type=self._get_data_type(source),
-                    extraction_method=self._get_extraction_method(source),
-                    timestamp=datetime.utcnow()
-                )
-                db.add(provenance)
-            
-            db.commit()
-            db.close()
-            
-        except Exception as e:
-            logger.error(f"Error logging data provenance: {e}")
-    
-    async def _log_workflow_execution(self, query_log_id: int, orchestration_method: str, result: Dict):
-        """Log workflow execution details"""
-        try:
-            if not query_log_id:
-                return
-            
-            db = SessionLocal()
-            
-            workflow_execution = WorkflowExecution(
-                query_log_id=query_log_id,
-                workflow_type=orchestration_method,
-                steps=self._extract_workflow_steps(result),
-                ai_model="gemini-pro" if orchestration_method == "ai_orchestration" else None,
-                status="completed",
-                timestamp=datetime.utcnow()
-            )
-            db.add(workflow_execution)
-            db.commit()
-            db.close()
-            
-        except Exception as e:
-            logger.error(f"Error logging workflow execution: {e}")
-    
-    async def _update_query_log(self, query_log_id: int, result: Dict, processing_time: int, status: str, error_message: str = None):
-        """Update query log with results"""
-        try:
-            if not query_log_id:
-                return
-            
-            db = SessionLocal()
-            query_log = db.query(QueryLog).filter(QueryLog.id == query_log_id).first()
-            
-            if query_log:
-                query_log.results = result
-                query_log.processing_time = processing_time
-                query_log.status = status
-                query_log.error_message = error_message
-                
-                db.commit()
-            
-            db.close()
-            
-        except Exception as e:
-            logger.error(f"Error updating query log: {e}")
-    
-    def _get_data_type(self, source: str) -> str:
-        """Get data type for a source"""
-        data_types = {
-            "pubmed": "article",
-            "uniprot": "protein",
-            "swissadme": "drug_property"
-        }
-        return data_types.get(source, "unknown")
-    
-    def _get_extraction_method(self, source: str) -> str:
-        """Get extraction method for a source"""
-        methods = {
-            "pubmed": "api",
-            "uniprot": "api",
-            "swissadme": "web_scraping"
-        }
-        return methods.get(source, "unknown")
-    
-    def _extract_workflow_steps(self, result: Dict) -> List[str]:
-        """Extract workflow steps from result"""
-        steps = []
-        
-        if "sources_queried" in result:
-            for source in result["sources_queried"]:
-                steps.append(f"query_{source}")
-        
-        if "ai_analysis" in result:
-            steps.append("ai_synthesis")
-        
-        return steps
-    
-    async def get_recent_logs(self, limit: int = 100) -> List[Dict]:
-        """Get recent query logs"""
-        try:
-            db = SessionLocal()
-            logs = db.query(QueryLog).order_by(QueryLog.timestamp.desc()).limit(limit).all()
-            
-            log_data = []
-            for log in logs:
-                log_data.append({
-                    "id": log.id,
-                    "query": log.query,
-                    "sources": log.sources,
-                    "timestamp": log.timestamp.isoformat(),
-                    "processing_time": log.processing_time,
-                    "status": log.status,
-                    "error_message": log.error_message
-                })
-            
-            db.close()
-            return log_data
-            
-        except Exception as e:
-            logger.error(f"Error retrieving logs: {e}")
-            return []
-    
-    async def cleanup(self):
-        """Cleanup resources"""
-        try:
-            if self.ai_orchestrator:
-                await self.ai_orchestrator.cleanup()
-            if self.swissadme_adapter:
-                self.swissadme_adapter.cleanup()
-            logger.info("Workflow service cleaned up")
-        except Exception as e:
-            logger.error(f"Error cleaning up workflow service: {e}")
+"""
+Workflow service for coordinating data sources and AI orchestration
+"""
+
+from typing import AsyncIterator, List, Dict, Optional, Any, Tuple
+from loguru import logger
+import asyncio
+from datetime import datetime, timezone
+from sqlalchemy import String, cast, tuple_
+import base64
+import binascii
+import json
+
+from ai_agent.orchestrator import AIOrchestrator, fold_call_result
+from database.models import SessionLocal, QueryLog
+from adapters.pubmed_adapter import PubMedAdapter
+from adapters.uniprot_adapter import UniProtAdapter
+from adapters.swissadme_adapter import SwissADMEAdapter
+from adapters.swissadme_cache import looks_like_smiles
+from adapters.http_client import close_http_client
+from adapters.rate_limiter import get_rate_limiter_metrics
+from services.source_fanout import gather_sources, iter_sources
+from services.provenance_writer import QueryLogHandle, get_provenance_writer
+from services.provenance_collector import ProvenanceCollector
+from database.blob_store import get_blob_store
+from cache.response_cache import get_response_cache
+from cache.record_cache import get_record_cache_metrics
+from cache.llm_cache import get_llm_cache
+from config import Config
+
+# Columns returned by /api/logs (results payloads are fetched separately)
+_LOG_COLUMNS = (
+    QueryLog.id,
+    QueryLog.query,
+    QueryLog.sources,
+    QueryLog.timestamp,
+    QueryLog.processing_time,
+    QueryLog.status,
+    QueryLog.error_message,
+    QueryLog.results_size,
+)
+
+def encode_log_cursor(timestamp: datetime, log_id: int) -> str:
+    """Opaque pagination cursor for the (timestamp, id) position of a log"""
+    return base64.urlsafe_b64encode(json.dumps([timestamp.isoformat(), log_id]).encode()).decode()
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Timestamps are stored as naive UTC; convert aware query bounds to match"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def decode_log_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_log_cursor; raises ValueError for malformed cursors"""
+    try:
+        timestamp, log_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(timestamp), int(log_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+class WorkflowService:
+    """Service for managing biomedical research workflows"""
+    
+    def __init__(self):
+        self.ai_orchestrator = AIOrchestrator()
+        self.pubmed_adapter = PubMedAdapter()
+        self.uniprot_adapter = UniProtAdapter()
+        self.swissadme_adapter = SwissADMEAdapter()
+        self.provenance_writer = get_provenance_writer()
+        self.initialized = False
+        
+    async def initialize(self):
+        """Initialize the workflow service"""
+        self.provenance_writer.start()
+        try:
+            # Start Chrome sessions off the event loop so startup stays responsive
+            await asyncio.to_thread(self.swissadme_adapter.warm_up)
+            
+            await self.ai_orchestrator.initialize()
+            self.initialized = True
+            logger.info("Workflow service initialized successfully")
+        except Exception as e:
+            logger.error(f"Error initializing workflow service: {e}")
+            self.initialized = False
+    
+    async def process_query(self, query: str, sources: List[str], max_results: int = 10) -> Dict:
+        """
+        Process a biomedical research query
+        
+        Args:
+            query: The research query
+            sources: List of data sources to query
+            max_results: Maximum results per source
+            
+        Returns:
+            Dictionary containing processed results
+        """
+        start_time = datetime.utcnow()
+        query_log = None
+        
+        try:
+            logger.info(f"Processing query: {query}")
+            
+            # Log the query
+            query_log = await self._log_query(query, sources, start_time)
+            
+            # Process using AI orchestration if available
+            if self.initialized:
+                result = await self.ai_orchestrator.process_query(query, sources, max_results)
+                orchestration_method = "ai_orchestration"
+            else:
+                # Fallback to direct processing
+                result = await self._direct_processing(query, sources, max_results)
+                orchestration_method = "direct_processing"
+            
+            # Log data provenance
+            provenance = ProvenanceCollector()
+            for source, source_results in (result.get("results") or {}).items():
+                provenance.add_source(source, source_results)
+            await self._log_data_provenance(query_log, provenance, sources)
+            
+            # Log workflow execution
+            await self._log_workflow_execution(query_log, orchestration_method, result)
+            
+            # Update query log with results
+            processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            await self._update_query_log(query_log, result, processing_time, "completed")
+            
+            return result
+            
+        except asyncio.CancelledError:
+            logger.info(f"Query cancelled: {query}")
+            if query_log:
+                processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                await self._update_query_log(query_log, None, processing_time, "cancelled")
+            raise
+            
+        except Exception as e:
+            logger.error(f"Error processing query: {e}")
+            
+            # Update query log with error
+            if query_log:
+                processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                await self._update_query_log(query_log, None, processing_time, "failed", str(e))
+            
+            return {
+                "query": query,
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat(),
+                "status": "error"
+            }
+    
+    async def stream_query(self, query: str, sources: List[str], max_results: int = 10) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Process a query, yielding partial results as each source finishes
+        
+        In "plan" mode with AI orchestration available, the LLM plans the tool calls
+        first (as in process_query) and the planned calls are streamed; otherwise each
+        source is queried with the question itself.
+        
+        Yields (event, data) pairs:
+            ("plan", {"plan": [...]}) when the calls were planned;
+            ("source", {"source": name, "results": [...] or {"error": ...}}) per source,
+            fastest first (again, with the merged results, as each further planned call
+            for that source finishes); ("analysis", {"ai_analysis": text}) once every
+            source is in (only when AI orchestration is available); and finally
+            ("done", {...}) with the query metadata. An ("error", {"error": ...}) event
+            ends a failed stream. The complete result is logged like process_query.
+        """
+        start_time = datetime.utcnow()
+        query_log = await self._log_query(query, sources, start_time)
+        provenance = ProvenanceCollector()
+        result = {
+            "query": query,
+            "sources_queried": sources,
+            "results": {},
+            "orchestration_method": "Streaming"
+        }
+        
+        try:
+            for source in sources:
+                if source not in ("pubmed", "uniprot", "swissadme"):
+                    result["results"][source] = {"error": f"Unknown source: {source}"}
+                    yield "source", {"source": source, "results": result["results"][source]}
+            
+            plan = None
+            if self.initialized and self.ai_orchestrator.llm and Config.AI_ORCHESTRATION_MODE == "plan":
+                try:
+                    plan, calls, timeouts = await self.ai_orchestrator.plan_source_calls(query, sources, max_results)
+                except Exception as e:
+                    logger.warning(f"Planning failed, streaming the sources directly: {e}")
+            
+            if plan is not None:
+                result["plan"] = plan
+                result["orchestration_method"] = "AI Plan (Streaming)"
+                yield "plan", {"plan": plan}
+                async for key, call_results in iter_sources(calls, timeouts):
+                    source = fold_call_result(result["results"], key, call_results)
+                    yield "source", {"source": source, "results": result["results"][source]}
+                # A source may have several planned calls; hash each one's merged results once
+                for source, source_results in result["results"].items():
+                    provenance.add_source(source, source_results)
+            else:
+                async for source, source_results in iter_sources(self._source_calls(query, sources, max_results)):
+                    result["results"][source] = source_results
+                    provenance.add_source(source, source_results)
+                    yield "source", {"source": source, "results": source_results}
+            
+            if self.initialized:
+                try:
+                    analysis = await self.ai_orchestrator.synthesize_results(query, result["results"])
+                except Exception as e:
+                    logger.error(f"Error synthesizing streamed results: {e}")
+                    analysis = None
+                if analysis:
+                    result["ai_analysis"] = analysis
+                    yield "analysis", {"ai_analysis": analysis}
+            
+            result["results"] = {source: result["results"][source] for source in sources if source in result["results"]}
+            result["timestamp"] = datetime.utcnow().isoformat()
+            processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            
+            await self._log_data_provenance(query_log, provenance, sources)
+            await self._log_workflow_execution(query_log, "streaming", result)
+            await self._update_query_log(query_log, result, processing_time, "completed")
+            
+            yield "done", {
+                "query": query,
+                "sources_queried": sources,
+                "timestamp": result["timestamp"],
+                "orchestration_method": result["orchestration_method"],
+                "processing_time": processing_time
+            }
+            
+        except (asyncio.CancelledError, GeneratorExit):
+            # Client went away mid-stream - iter_sources cancels the remaining sources
+            logger.info(f"Streaming query cancelled: {query}")
+            processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            await asyncio.shield(self._update_query_log(query_log, None, processing_time, "cancelled"))
+            raise
+            
+        except Exception as e:
+            logger.error(f"Error streaming query: {e}")
+            processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            await self._update_query_log(query_log, None, processing_time, "failed", str(e))
+            yield "error", {"error": str(e)}
+    
+    async def _direct_processing(self, query: str, sources: List[str], max_results: int) -> Dict:
+        """Direct processing without AI orchestration"""
+        try:
+            calls = self._source_calls(query, sources, max_results)
+
+            # Query all known sources concurrently, each with its own deadline
+            source_results = await gather_sources(calls)
+            results = {
+                source: source_results.get(source, {"error": f"Unknown source: {source}"})
+                for source in sources
+            }
+
+            return {
+                "query": query,
+                "sources_queried": sources,
+                "results": results,
+                "timestamp": datetime.utcnow().isoformat(),
+                # "orchestration_method": "direct_processing"
+                "orchestration_method": "Direct"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in direct processing: {e}")
+            raise
+
+    def _source_calls(self, query: str, sources: List[str], max_results: int) -> Dict:
+        """Build the coroutine factories for each requested (known) source"""
+        calls = {}
+        if "pubmed" in sources:
+            calls["pubmed"] = lambda: self.pubmed_adapter.search_articles(query, max_results)
+        if "uniprot" in sources:
+            calls["uniprot"] = lambda: self.uniprot_adapter.search_proteins(query, max_results)
+        if "swissadme" in sources:
+            # SwissADME needs SMILES notation; don't tie up a browser scraping a question
+            if looks_like_smiles(query):
+                calls["swissadme"] = lambda: self.swissadme_adapter.search_drug_properties(query)
+            else:
+                calls["swissadme"] = self._smiles_required
+        return calls
+    
+    @staticmethod
+    async def _smiles_required() -> Dict:
+        return {"error": "SwissADME needs SMILES input; the query is not a SMILES string"}
+
+    async def _log_query(self, query: str, sources: List[str], start_time: datetime) -> QueryLogHandle:
+        """Log the query (buffered; written by the provenance writer's next flush)"""
+        return self.provenance_writer.begin_query(query, sources, start_time)
+    
+    async def _log_data_provenance(self, query_log: QueryLogHandle, provenance: ProvenanceCollector, sources: List[str]):
+        """Log per-record data provenance (plus a summary row per source)"""
+        try:
+            if not query_log:
+                return
+            
+            self.provenance_writer.add_provenance(query_log, await provenance.rows(sources))
+            
+        except Exception as e:
+            logger.error(f"Error logging data provenance: {e}")
+    
+    async def _log_workflow_execution(self, query_log: QueryLogHandle, orchestration_method: str, result: Dict):
+        """Log workflow execution details"""
+        try:
+            if not query_log:
+                return
+            
+            self.provenance_writer.add_workflow_execution(query_log, {
+                "workflow_type": orchestration_method,
+                "steps": self._extract_workflow_steps(result),
+                "ai_model": "gemini-pro" if orchestration_method == "ai_orchestration" else None,
+                "status": "completed",
+                "timestamp": datetime.utcnow()
+            })
+            
+        except Exception as e:
+            logger.error(f"Error logging workflow execution: {e}")
+    
+    async def _update_query_log(self, query_log: QueryLogHandle, result: Dict, processing_time: int, status: str, error_message: str = None):
+        """Update query log with results"""
+        try:
+            if not query_log:
+                return
+            
+            self.provenance_writer.update_query(
+                query_log,
+                results=result,
+                processing_time=processing_time,
+                status=status,
+                error_message=error_message
+            )
+            
+        except Exception as e:
+            logger.error(f"Error updating query log: {e}")
+    
+    def _extract_workflow_steps(self, result: Dict) -> List[str]:
+        """Extract workflow steps from result"""
+        steps = []
+        
+        if "sources_queried" in result:
+            for source in result["sources_queried"]:
+                steps.append(f"query_{source}")
+        
+        if "ai_analysis" in result:
+            steps.append("ai_synthesis")
+        
+        return steps
+    
+    async def get_recent_logs(self, limit: int = 100, cursor: Optional[str] = None, status: Optional[str] = None,
+                              source: Optional[str] = None, since: Optional[datetime] = None,
+                              until: Optional[datetime] = None) -> Dict:
+        """
+        Get query logs, newest first, one keyset page at a time
+        
+        Pages are seeked on (timestamp, id) through the matching index rather than
+        offset, so every page costs the same however far back it is. Only the listed
+        columns are loaded.
+        
+        Args:
+            limit: Logs per page
+            cursor: ``next_cursor`` from the previous page
+            status: Only logs with this status
+            source: Only logs that queried this source
+            since: Only logs at or after this time
+            until: Only logs before this time
+            
+        Returns:
+            {"logs": [...], "next_cursor": cursor for the next page, or None on the last page}
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_log_cursor(cursor) if cursor else None
+        since, until = _naive_utc(since), _naive_utc(until)
+        
+        def load():
+            db = SessionLocal()
+            try:
+                query = db.query(*_LOG_COLUMNS)
+                if status:
+                    query = query.filter(QueryLog.status == status)
+                if source:
+                    # sources is a JSON list stored as text; match the quoted name
+                    pattern = '%"' + source.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + '"%'
+                    query = query.filter(cast(QueryLog.sources, String).like(pattern, escape="\\"))
+                if since:
+                    query = query.filter(QueryLog.timestamp >= since)
+                if until:
+                    query = query.filter(QueryLog.timestamp < until)
+                if after:
+                    query = query.filter(tuple_(QueryLog.timestamp, QueryLog.id) < tuple_(*after))
+                return query.order_by(QueryLog.timestamp.desc(), QueryLog.id.desc()).limit(limit + 1).all()
+            finally:
+                db.close()
+        
+        try:
+            rows = await asyncio.to_thread(load)
+        except Exception as e:
+            logger.error(f"Error retrieving logs: {e}")
+            raise
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_log_cursor(rows[-1].timestamp, rows[-1].id)
+        
+        logs = [
+            dict(row._mapping, timestamp=row.timestamp.isoformat() if row.timestamp else None)
+            for row in rows
+        ]
+        return {"logs": logs, "next_cursor": next_cursor}
+    
+    async def get_query_results(self, query_log_id: int) -> Optional[Dict]:
+        """
+        Load the stored results of a logged query
+
+        Args:
+            query_log_id: QueryLog id
+
+        Returns:
+            The result payload, or None if the log or its payload does not exist
+        """
+        def load():
+            db = SessionLocal()
+            try:
+                row = db.query(QueryLog.results_hash, QueryLog.results).filter(QueryLog.id == query_log_id).first()
+            finally:
+                db.close()
+            if row is None:
+                return None
+            if row.results_hash:
+                return get_blob_store().get(row.results_hash)
+            return row.results  # Logged before results moved to the blob store
+
+        return await asyncio.to_thread(load)
+    
+    def get_metrics(self) -> Dict:
+        """Get runtime metrics for pooled resources"""
+        return {
+            "swissadme_pool": self.swissadme_adapter.get_pool_metrics(),
+            "swissadme_batching": self.swissadme_adapter.get_batching_metrics(),
+            "swissadme_cache": self.swissadme_adapter.get_cache_metrics(),
+            "response_cache": get_response_cache().get_metrics(),
+            "record_cache": get_record_cache_metrics(),
+            "llm_cache": get_llm_cache().get_metrics(),
+            "context_compaction": self.ai_orchestrator.get_context_metrics(),
+            "provenance_writer": self.provenance_writer.get_metrics(),
+            "blob_store": get_blob_store().get_metrics(),
+            "rate_limits": get_rate_limiter_metrics()
+        }
+    
+    async def cleanup(self):
+        """Cleanup resources"""
+        try:
+            # Flush buffered logs first so they survive a failure further down
+            await self.provenance_writer.stop()
+            if self.ai_orchestrator:
+                await self.ai_orchestrator.cleanup()
+            if self.swissadme_adapter:
+                self.swissadme_adapter.cleanup()
+            await close_http_client()
+            logger.info("Workflow service cleaned up")
+        except Exception as e:
+            logger.error(f"Error cleaning up workflow service: {e}")
@@ -0,0 +1,16 @@
+"""
+Shared test setup: import modules from backend/ and use a scratch database
+"""
+
+import os
+import sys
+import tempfile
+
+_scratch = tempfile.mkdtemp(prefix="biomedical_tests_")
+
+# Must be set before config / database.models are imported
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_scratch, 'test.db')}"
+os.environ["CACHE_DB_PATH"] = os.path.join(_scratch, "cache.db")
+os.environ["BLOB_STORE_PATH"] = os.path.join(_scratch, "blobs")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
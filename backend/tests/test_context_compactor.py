@@ -0,0 +1,32 @@
+"""
+Tests for binary-payload detection in the context compactor
+"""
+
+import base64
+import json
+
+from ai_agent.context_compactor import compact_results
+
+# Human p53, repeated to well past the base64 length threshold
+_SEQUENCE = "MEEPQSDPSVEPPLSQETFSDLWKLLPENNVLSPLPSQAMDDLMLSPDDIEQWFTEDPGPDEAPRMPEAAPPVAPAPAAPTPAAPAPAPSWPLSSSVPSQKTYQGSYGFRLGFLHSGTAKSVTCTYSPALNKMFCQLAKTCPVQLWVDSTPPPGTRVRAMAIYKQSQHMTEVVRRCPHHERCSDSDGLAPPQHLIRVEGNLRVEYLDDRNTFRHSVVVPYEPPEVGSDCTTIHYNYMCNSSCMGGMNRRPILTIITLEDSSGNLLGRNSFEVRVCACPGRDRRTEEENLRKKGEPHHELPPGSTKRALPNNTSSSPQPKKKPLDGEYFTLQIRGRERFEMFRELNEALELKDAQAGKEPGGSRAHSSHLKSKKGQSTSRHKKLMFKTEGPDSD"
+
+
+def _evidence(results):
+    compacted, _ = compact_results(results, query="TP53")
+    return json.loads(compacted)["evidence"]
+
+
+def test_protein_sequences_are_truncated_not_dropped():
+    results = {"uniprot": [{"accession": "P04637", "sequence": _SEQUENCE, "notes": _SEQUENCE}]}
+
+    protein, = _evidence(results)["uniprot"]
+    assert protein["sequence"] == _SEQUENCE[:60] + "..."
+    assert protein["notes"].startswith(_SEQUENCE[:100])
+
+
+def test_base64_payloads_are_dropped():
+    payload = base64.b64encode(bytes(range(256)) * 2).decode()
+    results = {"swissadme": [{"smiles": "CCO", "radar": payload, "plot": "data:image/png;base64,AAAA"}]}
+
+    molecule, = _evidence(results)["swissadme"]
+    assert molecule == {"smiles": "CCO"}
@@ -0,0 +1,76 @@
+"""
+Tests for JobService result storage
+"""
+
+import asyncio
+import os
+import tempfile
+
+from cache.kv_store import SqliteKVStore
+from cache.llm_cache import LLMCache
+from database.blob_store import get_blob_store
+from database.models import SessionLocal, QueryJob, init_database
+from services.job_service import JobService
+
+
+class FakeWorkflowService:
+    async def process_query(self, query, sources, max_results):
+        return {"status": "success", "query": query, "results": {"pubmed": [{"pmid": "1"}]}}
+
+
+class CachedLLMWorkflowService:
+    """Answers every query through an LLM cache, counting the real calls"""
+
+    def __init__(self):
+        path = os.path.join(tempfile.mkdtemp(), "llm.db")
+        self.cache = LLMCache(SqliteKVStore(path, table="llm_cache"), ttl=3600, similarity=0, index_size=10)
+        self.calls = 0
+
+    async def process_query(self, query, sources, max_results):
+        async def call():
+            self.calls += 1
+            return f"analysis {self.calls}"
+        analysis = await self.cache.get_or_call("gemini", 0.1, f"Analyze: {query}", call)
+        return {"status": "success", "query": query, "analysis": analysis}
+
+
+def test_job_result_is_stored_in_blob_store():
+    init_database()
+
+    async def scenario():
+        service = JobService(FakeWorkflowService(), workers=1, max_queue=10)
+        job = await asyncio.to_thread(service._create_job, "job-blob", "BRCA1", ["pubmed"], 5)
+        await service._run_job(job["job_id"])
+        return await service.get_result(job["job_id"])
+
+    result = asyncio.run(scenario())
+    assert result["status"] == "completed"
+    assert result["result"]["results"] == {"pubmed": [{"pmid": "1"}]}
+
+    db = SessionLocal()
+    try:
+        row = db.query(QueryJob).filter(QueryJob.id == "job-blob").first()
+        assert get_blob_store().exists(row.result_hash)
+        assert row.result_size > 0
+    finally:
+        db.close()
+
+
+
+def test_job_bypass_cache_forces_a_fresh_llm_call():
+    init_database()
+    workflow = CachedLLMWorkflowService()
+
+    async def run(job_id, bypass_cache):
+        service = JobService(workflow, workers=1, max_queue=10)
+        job = await asyncio.to_thread(service._create_job, job_id, "EGFR", ["pubmed"], 5, bypass_cache)
+        await service._run_job(job["job_id"])
+        return await service.get_result(job["job_id"])
+
+    assert asyncio.run(run("job-cached-1", False))["result"]["analysis"] == "analysis 1"
+    assert asyncio.run(run("job-cached-2", False))["result"]["analysis"] == "analysis 1"
+
+    fresh = asyncio.run(run("job-fresh", True))
+    assert fresh["bypass_cache"] is True
+    assert fresh["result"]["analysis"] == "analysis 2"
+    assert workflow.calls == 2
@@ -0,0 +1,60 @@
+"""
+Tests for LLMCache near-duplicate matching
+"""
+
+import asyncio
+import os
+import tempfile
+
+from cache.kv_store import SqliteKVStore
+from cache.llm_cache import LLMCache, make_llm_cache_key
+
+TEMPLATE = """
+Plan the data retrieval for this biomedical research question: "{question}"
+
+Available sources: pubmed, uniprot
+- pubmed: input is a PubMed search query
+- uniprot: input is a protein name, gene name, or organism
+
+Return ONLY a JSON object of the form {{"calls": [{{"source": "<source>", "input": "<tool input>"}}]}}
+using at most 6 calls. Calls run in parallel, so include every independent lookup needed;
+omit sources that are not relevant.
+"""
+
+
+def _cache(similarity):
+    path = os.path.join(tempfile.mkdtemp(), "llm.db")
+    return LLMCache(SqliteKVStore(path, table="llm_cache"), ttl=3600, similarity=similarity, index_size=100)
+
+
+def _ask(cache, question, answer):
+    async def call():
+        return answer
+    prompt = TEMPLATE.format(question=question)
+    return asyncio.run(cache.get_or_call("gemini", 0.1, prompt, call, similarity_text=question))
+
+
+def test_different_entity_is_not_a_near_duplicate():
+    cache = _cache(similarity=0.95)
+    _ask(cache, "What is the role of BRCA1 in hereditary breast cancer?", "plan for BRCA1")
+    assert _ask(cache, "What is the role of BRCA2 in hereditary breast cancer?", "plan for BRCA2") == "plan for BRCA2"
+
+
+def test_near_duplicate_question_is_reused_when_enabled():
+    cache = _cache(similarity=0.8)
+    question = "What is the role of BRCA1 in hereditary breast and ovarian cancer risk in carriers?"
+    _ask(cache, question, "first")
+    assert _ask(cache, question + " Thanks", "second") == "first"
+    assert cache.get_metrics()["near_hits"] == 1
+
+
+def test_near_duplicates_are_off_by_default():
+    cache = _cache(similarity=0)
+    question = "What is the role of BRCA1 in hereditary breast and ovarian cancer risk in carriers?"
+    _ask(cache, question, "first")
+    assert _ask(cache, question + " Thanks", "second") == "second"
+
+
+def test_exact_key_keeps_case():
+    assert make_llm_cache_key("gemini", 0.1, "Analyse c1ccccc1O") != make_llm_cache_key("gemini", 0.1, "Analyse C1CCCCC1O")
+    assert make_llm_cache_key("gemini", 0.1, "Analyse  BRCA1\n") == make_llm_cache_key("gemini", 0.1, "Analyse BRCA1")
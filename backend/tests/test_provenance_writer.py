@@ -0,0 +1,89 @@
+"""
+Regression tests for ProvenanceWriter failure handling
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from database.models import init_database, SessionLocal, QueryLog, DataProvenance
+from services.provenance_writer import ProvenanceWriter
+
+
+class FlakyBlobStore:
+    """Blob store whose ``put`` fails for documents marked ``{"fail": ...}``"""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+
+    def put(self, document):
+        if document.get("fail") and self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("blob store unavailable")
+        return "0" * 64, 1
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    init_database()
+
+
+def _row(query_log_id):
+    db = SessionLocal()
+    try:
+        return db.query(QueryLog).filter(QueryLog.id == query_log_id).first()
+    finally:
+        db.close()
+
+
+def test_rolled_back_insert_does_not_claim_an_id():
+    async def scenario():
+        writer = ProvenanceWriter(interval=60, batch_size=1000, blob_store=FlakyBlobStore(failures=4), max_attempts=3)
+        first = writer.begin_query("first", ["pubmed"], datetime.utcnow())
+        writer.update_query(first, results={"fail": True})
+        await writer.flush()
+        assert first.id is None
+
+        second = writer.begin_query("second", ["pubmed"], datetime.utcnow())
+        await writer.flush()  # first fails again; second is written on its own
+        assert first.id is None and second.id is not None
+
+        writer.update_query(first, status="completed")
+        await writer.flush()
+        return writer, first, second
+
+    writer, first, second = asyncio.run(scenario())
+    assert first.id != second.id
+    assert (_row(first.id).query, _row(first.id).status) == ("first", "completed")
+    assert (_row(second.id).query, _row(second.id).status) == ("second", "processing")
+    assert writer.get_metrics()["buffered"] == 0
+
+
+def test_failing_query_does_not_drop_the_rest_of_the_batch():
+    async def scenario():
+        writer = ProvenanceWriter(interval=60, batch_size=1000, blob_store=FlakyBlobStore(failures=100), max_attempts=2)
+        good = writer.begin_query("good", ["pubmed"], datetime.utcnow())
+        writer.add_provenance(good, [{"source": "pubmed", "data_type": "article", "record_id": "1",
+                                      "extraction_method": "api", "timestamp": datetime.utcnow()}])
+        bad = writer.begin_query("bad", ["pubmed"], datetime.utcnow())
+        writer.update_query(bad, results={"fail": True})
+        writer.update_query(good, status="completed")
+        await writer.flush()
+        assert good.id is not None and bad.id is None
+        assert writer.get_metrics()["buffered"] == 1  # Only the bad query is retried
+
+        await writer.stop()
+        return writer, good, bad
+
+    writer, good, bad = asyncio.run(scenario())
+    assert _row(good.id).status == "completed"
+    db = SessionLocal()
+    try:
+        assert db.query(DataProvenance).filter(DataProvenance.query_log_id == good.id).count() == 1
+    finally:
+        db.close()
+    metrics = writer.get_metrics()
+    assert bad.id is None
+    assert metrics["buffered"] == 0
+    assert metrics["dropped_operations"] == 1
@@ -0,0 +1,33 @@
+"""
+Tests for RecordCache's record <-> dict conversion at the SQLite edge
+"""
+
+import asyncio
+import os
+
+from adapters.records import Article
+from cache.kv_store import SqliteKVStore
+from cache.record_cache import RecordCache
+from cache.response_cache import MemoryLRU
+from config import Config
+
+
+def _store():
+    return SqliteKVStore(os.path.join(os.path.dirname(Config.CACHE_DB_PATH), "records.db"), "pubmed_records")
+
+
+def test_records_are_kept_in_memory_and_stored_as_dicts():
+    async def scenario():
+        store = _store()
+        cache = RecordCache("pubmed", store, MemoryLRU(16), ttl=60, record_type=Article)
+        article = Article("123", title="BRCA1 and DNA repair", authors=["Smith J"])
+        await cache.put_many({"123": article})
+
+        assert (await cache.get("123")) is article
+        assert store.get_many(["123"])["123"]["title"] == "BRCA1 and DNA repair"
+
+        # A fresh process only has the SQLite tier
+        cold = RecordCache("pubmed", store, MemoryLRU(16), ttl=60, record_type=Article)
+        assert (await cold.get("123")) == article
+
+    asyncio.run(scenario())
@@ -0,0 +1,32 @@
+"""
+Tests that Article / Protein records serialize exactly like the dicts they replaced
+"""
+
+import json
+
+from adapters import json_codec
+from adapters.records import Article, Protein, json_default
+from database.blob_store import BlobStore
+from services.provenance_collector import iter_source_records
+
+
+def _articles():
+    return [Article("1", title="TP53 in cancer", authors=["Levine AJ"]), Article("2", error="Details unavailable")]
+
+
+def test_encoders_take_records_directly():
+    articles = _articles()
+    dicts = [article.to_dict() for article in articles]
+
+    assert json.loads(json_codec.dumps({"pubmed": articles}, default=json_default)) == {"pubmed": dicts}
+    assert "error" not in json.loads(json_codec.dumps(articles[0], default=json_default))
+    assert BlobStore.encode({"pubmed": articles}) == BlobStore.encode({"pubmed": dicts})
+
+
+def test_provenance_hashes_records_in_their_dict_shape():
+    proteins = [Protein("P04637", protein_name="Cellular tumor antigen p53", url="https://www.uniprot.org/uniprotkb/P04637")]
+
+    from_records = list(iter_source_records("uniprot", proteins))
+    from_dicts = list(iter_source_records("uniprot", [protein.to_dict() for protein in proteins]))
+    assert from_records == from_dicts
+    assert [record_id for record_id, _, _ in iter_source_records("pubmed", _articles())] == ["1"]
@@ -0,0 +1,128 @@
+"""
+Tests for ResponseCache request coalescing and key normalization
+"""
+
+import asyncio
+import time
+
+from adapters.records import Article
+from cache.response_cache import MemoryLRU, ResponseCache, make_cache_key
+
+
+class MemoryStore:
+    """In-memory stand-in for SqliteKVStore"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get_entry(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, value):
+        self.entries[key] = (value, 0)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def _cache():
+    return ResponseCache(MemoryStore(), MemoryLRU(16), ttls={"pubmed": 60}, stale_ttls={"pubmed": 0})
+
+
+def test_cancelled_caller_does_not_cancel_shared_fetch():
+    async def scenario():
+        cache = _cache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return ["result"]
+
+        first = asyncio.create_task(cache.get_or_fetch("pubmed", {"query": "aspirin"}, fetch))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_fetch("pubmed", {"query": "aspirin"}, fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        result = await second
+        return first, result, calls
+
+    first, result, calls = asyncio.run(scenario())
+    assert first.cancelled()
+    assert result == ["result"]
+    assert calls == 1
+
+
+def test_fetch_is_cancelled_once_every_caller_has_gone():
+    async def scenario():
+        cache = _cache()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(cache.get_or_fetch("pubmed", {"query": "aspirin"}, fetch))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    asyncio.run(scenario())
+
+
+def test_cache_key_keeps_query_case():
+    assert make_cache_key("pubmed", {"query": "aspirin  OR ibuprofen"}) == make_cache_key("pubmed", {"query": "aspirin OR ibuprofen"})
+    assert make_cache_key("pubmed", {"query": "aspirin OR ibuprofen"}) != make_cache_key("pubmed", {"query": "aspirin or ibuprofen"})
+
+
+def test_record_namespaces_round_trip_through_the_store():
+    async def scenario():
+        store = MemoryStore()
+        cache = ResponseCache(store, MemoryLRU(16), ttls={"pubmed": 60}, stale_ttls={"pubmed": 0},
+                              record_types={"pubmed": Article})
+        articles = [Article("1", title="TP53"), Article("2", authors=["Levine AJ"])]
+
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return articles
+
+        assert await cache.get_or_fetch("pubmed", {"term": "TP53"}, fetch) is articles
+        (key, (stored, _)), = store.entries.items()
+        assert stored == [article.to_dict() for article in articles]
+
+        store.entries[key] = (stored, time.time())
+        cold = ResponseCache(store, MemoryLRU(16), ttls={"pubmed": 60}, stale_ttls={"pubmed": 0},
+                             record_types={"pubmed": Article})
+        assert await cold.get_or_fetch("pubmed", {"term": "TP53"}, fetch) == articles
+        assert calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_responses_with_error_records_are_not_cached():
+    async def scenario():
+        cache = _cache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return [Article("1", title="Details unavailable", error="429 Too Many Requests")]
+            return [Article("1", title="TP53")]
+
+        first = await cache.get_or_fetch("pubmed", {"term": "TP53"}, fetch)
+        second = await cache.get_or_fetch("pubmed", {"term": "TP53"}, fetch)
+
+        assert first[0].error and second[0].title == "TP53"
+        assert calls == 2
+        assert cache.get_metrics()["namespaces"]["pubmed"]["uncached"] == 1
+
+    asyncio.run(scenario())
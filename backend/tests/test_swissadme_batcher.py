@@ -0,0 +1,68 @@
+"""
+Tests for SmilesBatcher failure isolation and per-caller slicing
+"""
+
+import asyncio
+
+from adapters.swissadme_batcher import SmilesBatcher
+
+
+def _result(smiles, errors=None):
+    return {
+        "success": True,
+        "smiles": list(smiles),
+        "physicochemical_properties": {s: {"Formula": s} for s in smiles},
+        "errors": errors or {},
+        "boiled_egg_plot": "data:image/png;base64,plot-of-" + "-".join(smiles),
+    }
+
+
+def test_failed_batch_is_retried_per_request():
+    async def scenario():
+        submitted = []
+
+        async def scrape(smiles):
+            submitted.append(list(smiles))
+            if "bad" in smiles:
+                raise RuntimeError("SwissADME rejected the input")
+            return _result(smiles)
+
+        batcher = SmilesBatcher(scrape, window=0.01, max_batch_size=10)
+        good, bad = await asyncio.gather(batcher.submit(["CCO"]), batcher.submit(["bad"]))
+
+        assert submitted[0] == ["CCO", "bad"]
+        assert good["success"] and good["physicochemical_properties"] == {"CCO": {"Formula": "CCO"}}
+        assert not bad["success"] and "rejected" in bad["error"]
+        assert batcher.get_metrics()["isolated_retries"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_molecule_errors_only_reach_their_caller():
+    async def scenario():
+        async def scrape(smiles):
+            return _result([s for s in smiles if s != "C1CC"], errors={"C1CC": "Molecule missing from SwissADME results"})
+
+        batcher = SmilesBatcher(scrape, window=0.01, max_batch_size=10)
+        first, second = await asyncio.gather(batcher.submit(["CCO"]), batcher.submit(["C1CC"]))
+
+        assert first["errors"] == {}
+        assert second["errors"] == {"C1CC": "Molecule missing from SwissADME results"}
+        assert second["physicochemical_properties"] == {"C1CC": {}}
+
+    asyncio.run(scenario())
+
+
+def test_boiled_egg_plot_only_goes_to_a_caller_owning_the_batch():
+    async def scenario():
+        async def scrape(smiles):
+            return _result(smiles)
+
+        batcher = SmilesBatcher(scrape, window=0.01, max_batch_size=10)
+        first, second = await asyncio.gather(batcher.submit(["CCO"]), batcher.submit(["CCN"]))
+        alone = await batcher.submit(["CCO", "CCN"])
+
+        assert first["boiled_egg_plot"] == "" and second["boiled_egg_plot"] == ""
+        assert alone["boiled_egg_plot"].endswith("plot-of-CCO-CCN")
+
+    asyncio.run(scenario())
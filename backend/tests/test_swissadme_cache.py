@@ -0,0 +1,64 @@
+"""
+Tests for SwissADMECache write-time validation and the SMILES input check
+"""
+
+import os
+
+import pytest
+
+from adapters.swissadme_cache import Chem, SwissADMECache, looks_like_smiles
+from cache.kv_store import SqliteKVStore
+from config import Config
+
+
+def _cache(name):
+    return SwissADMECache(SqliteKVStore(os.path.join(os.path.dirname(Config.CACHE_DB_PATH), f"{name}.db"), "swissadme"))
+
+
+def _result(rows, csv_smiles):
+    return {
+        "success": True,
+        "smiles": list(rows),
+        "physicochemical_properties": {s: {"Formula": formula} for s, formula in rows.items()},
+        "csv_smiles": csv_smiles,
+    }
+
+
+def test_non_canonical_input_is_cached_under_the_reported_canonical_smiles():
+    cache = _cache("canonical")
+    # Ethanol submitted as OCC; SwissADME reports its canonical form CCO
+    cache.put_result(_result({"OCC": "C2H6O"}, {"OCC": "CCO"}))
+
+    found = cache.get_many(["OCC", "CCO"])
+    assert set(found) == {"OCC", "CCO"}
+    assert found["CCO"].smiles == "CCO"
+    assert found["CCO"].physicochemical_properties == {"Formula": "C2H6O"}
+
+
+@pytest.mark.skipif(Chem is None, reason="needs RDKit to tell the molecules apart")
+def test_only_rows_reported_for_the_submitted_molecule_are_cached():
+    cache = _cache("validated")
+    cache.put_result(_result(
+        {"CCO": "C2H6O", "CCN": "C3H8O"},
+        # SwissADME reported a different molecule for CCN's row
+        {"CCO": "CCO", "CCN": "CCCO"},
+    ))
+
+    found = cache.get_many(["CCO", "CCN"])
+    assert set(found) == {"CCO"}
+    assert found["CCO"].physicochemical_properties == {"Formula": "C2H6O"}
+
+
+def test_rows_without_reported_smiles_are_not_cached():
+    cache = _cache("unreported")
+    cache.put_result(_result({"CCO": "C2H6O"}, {}))
+
+    assert cache.get_many(["CCO"]) == {}
+
+
+def test_questions_are_not_mistaken_for_smiles():
+    assert looks_like_smiles("CC(=O)Oc1ccccc1C(=O)O, C[C@@H](N)C(=O)O")
+    assert looks_like_smiles("[Na+].[Cl-]")
+    assert not looks_like_smiles("What does BRCA1 do?")
+    assert not looks_like_smiles("aspirin")
+    assert not looks_like_smiles("")